@@ -0,0 +1,3 @@
+from fight_camp.coach_page import run
+
+run()
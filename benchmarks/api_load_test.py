@@ -0,0 +1,172 @@
+"""Load test for fight_camp.plan_api against a server on localhost.
+
+    python benchmarks/api_load_test.py --server-workers 4 --requests 20000 --unique 0
+    python -m fight_camp.plan_api --workers 4 &
+    python benchmarks/api_load_test.py --requests 20000 --concurrency 64
+    python benchmarks/api_load_test.py --batch-size 1000 --requests 200 --format arrow
+
+Each of --concurrency clients keeps one HTTP/1.1 keep-alive connection open
+and sends requests back to back. --unique sets how many distinct athletes are
+cycled through, so a small value measures cache hits; --unique 0 sends every
+request different athletes, so nothing is served from the response cache and
+every request is planned. --server-workers starts `plan_api --workers N` on
+--port for the run and stops it afterwards. Prints throughput, latency
+percentiles and status code counts.
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fight_camp.constants import TRAINING_LEVELS  # noqa: E402
+
+
+SERVER_START_SECONDS = 30
+
+
+def athlete_bodies(count, today, seed=0):
+    rng = np.random.default_rng(seed)
+    levels = list(TRAINING_LEVELS)
+    bodies = []
+    for _ in range(count):
+        current_weight = round(float(rng.uniform(60, 110)), 1)
+        bodies.append({
+            "age": int(rng.integers(18, 40)),
+            "sex": "Male" if rng.random() < 0.5 else "Female",
+            "height": int(rng.integers(150, 200)),
+            "current_weight": current_weight,
+            "target_weight": round(current_weight - float(rng.uniform(3, 10)), 1),
+            "fight_date": (today + timedelta(days=int(rng.integers(35, 180)))).isoformat(),
+            "water_cut_percentage": round(float(rng.uniform(0, 5)), 1),
+            "training_level": levels[int(rng.integers(len(levels)))],
+        })
+    return bodies
+
+
+def request_payloads(args):
+    today = date.today()
+    unique = args.unique or args.requests  # 0: a fresh request every time
+    # A seed per run, so a long-running server's cache holds nothing from earlier runs either
+    athletes = athlete_bodies(unique * max(args.batch_size, 1), today, seed=time.time_ns())
+    if args.batch_size:
+        path = f"/plan/batch?format={args.format}"
+        bodies = [{"athletes": athletes[i:i + args.batch_size]}
+                  for i in range(0, len(athletes), args.batch_size)]
+    else:
+        path = f"/plan?format={args.format}"
+        bodies = athletes
+    payloads = []
+    for body in bodies:
+        content = json.dumps(body).encode()
+        head = (f"POST {path} HTTP/1.1\r\nHost: {args.host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(content)}\r\n\r\n").encode()
+        payloads.append(head + content)
+    return payloads
+
+
+async def client(args, payloads, next_request, latencies, statuses):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        while True:
+            index = next(next_request, None)
+            if index is None:
+                return
+            started = time.perf_counter()
+            writer.write(payloads[index % len(payloads)])
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            statuses[status_line.split()[1].decode()] += 1
+    finally:
+        writer.close()
+
+
+async def run(args):
+    payloads = request_payloads(args)
+    next_request = iter(range(args.requests))
+    latencies = []
+    statuses = Counter()
+    started = time.perf_counter()
+    await asyncio.gather(*(client(args, payloads, next_request, latencies, statuses)
+                           for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "athletes_per_second": len(latencies) * max(args.batch_size, 1) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+        "statuses": dict(statuses),
+    }
+
+
+def start_server(args):
+    """Start plan_api with --server-workers processes and wait until it accepts connections."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "fight_camp.plan_api", "--host", args.host, "--port", str(args.port),
+         "--workers", str(args.server_workers)],
+        cwd=ROOT,
+    )
+    deadline = time.monotonic() + SERVER_START_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((args.host, args.port), timeout=1).close()
+            return server
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+    server.kill()
+    raise SystemExit(f"plan_api did not start on {args.host}:{args.port}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the plan API on localhost.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=0, help="athletes per /plan/batch call (0: use /plan)")
+    parser.add_argument("--unique", type=int, default=1000,
+                        help="distinct requests to cycle through (0: every request distinct)")
+    parser.add_argument("--format", choices=("json", "arrow"), default="json")
+    parser.add_argument("--server-workers", type=int, default=0,
+                        help="start plan_api with this many worker processes (0: use a running server)")
+    args = parser.parse_args(argv)
+
+    server = start_server(args) if args.server_workers else None
+    try:
+        result = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    result["server_workers"] = args.server_workers or None
+    print(json.dumps(result, indent=2))
+    return 0 if set(result["statuses"]) == {"200"} else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
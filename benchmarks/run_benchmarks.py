@@ -0,0 +1,458 @@
+"""Benchmark suite for the planner: micro, full-rerun, memory-per-session, startup, store and archive.
+
+    python benchmarks/run_benchmarks.py                   # everything
+    python benchmarks/run_benchmarks.py --only micro      # micro|rerun|memory|startup|store|archive
+    python benchmarks/run_benchmarks.py --output bench.json --thresholds benchmarks/thresholds.json
+
+Results are written as JSON ({name: {"seconds"|"bytes": value, ...}}) and
+compared against the thresholds file; any benchmark above its ceiling is
+reported and the script exits with status 1.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from fight_camp.planner import TRAINING_LEVELS, plan_weekly, plan_weekly_batch  # noqa: E402
+
+APP_SCRIPTS = ["app.py", "app_2.py", "app_3.py", "app_4.py", "app_5.py"]
+CAMP_WEEKS = [5, 12, 26]
+BATCH_SIZES = [1, 100, 10_000]
+DEFAULT_THRESHOLDS = Path(__file__).with_name("thresholds.json")
+TODAY = date(2026, 1, 5)
+STARTUP_RUNS = 3
+STORE_ATHLETES = 2000
+STORE_DAYS = 90
+ARCHIVE_ATHLETES = 100_000
+ROSTER_MEMORY_ATHLETES = 100_000
+LEGACY_MEMORY_SAMPLE = 1000  # legacy row dicts are measured on a sample and scaled up
+REPLAN_ATHLETES = 50_000  # a nightly batch of weigh-ins across the roster
+SIMULATION_ATHLETES = 10_000
+COACH_ATHLETES = 10_000
+SESSION_SAMPLES = 100_000  # about 28 hours of 1 Hz records
+# Modules the first render must not import; they belong to later code paths
+DEFERRED_MODULES = ["numpy", "pandas", "fpdf", "PIL", "pyarrow"]
+
+
+# --- Timing Helpers ---
+def time_call(func, repeat=5, min_seconds=0.05):
+    """Median seconds per call, auto-scaling the loop count like timeit."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds or number >= 1_000_000:
+            break
+        number *= 10
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+    return {"seconds": statistics.median(samples), "min_seconds": min(samples), "loops": number}
+
+
+def legacy_weekly_rows(age, sex, height, current_weight, target_weight, water_cut_percentage,
+                       training_level, total_weeks):
+    """The scalar app_5.py weekly loop as it was before the batch engine, kept as a baseline."""
+    carb_multiplier, training_calories_factor = TRAINING_LEVELS[training_level]
+    water_cut_kg = (water_cut_percentage / 100) * target_weight
+    fat_loss_goal = current_weight - (target_weight + (2 * water_cut_kg))
+    weight_factors = [1 + 0.02 * i for i in range(total_weeks)]
+    normalization_factor = fat_loss_goal / sum(weight_factors)
+    weekly_data = []
+    last_weight = current_weight
+    for i, w in enumerate(weight_factors):
+        loss = w * normalization_factor
+        week_weight = last_weight - loss
+        bmr = 10 * week_weight + 6.25 * height - 5 * age + (5 if sex == "Male" else -161)
+        weekly_data.append({
+            "Week": i + 1,
+            "Date": (TODAY + timedelta(weeks=i)).strftime("%d %b"),
+            "Target Weight (kg)": round(week_weight, 1),
+            "Calories": round(bmr * training_calories_factor - (loss * 7700) / 7),
+            "Protein (g)": round(2.0 * week_weight),
+            "Fat (g)": round(1.0 * week_weight),
+            "Carbs (g)": round(carb_multiplier * week_weight),
+            "Fibre (g)": 30,
+            "Salt (g)": "3-5",
+        })
+        last_weight = week_weight
+    return weekly_data
+
+
+def legacy_weekly_loop(*args):
+    return pd.DataFrame(legacy_weekly_rows(*args))
+
+
+def fit_session_bytes(samples, seed=0):
+    """A FIT file of 1 Hz heart-rate records, every other one with a compressed timestamp header."""
+    import struct
+
+    heart_rates = np.random.default_rng(seed).integers(90, 190, samples)
+    start = int((np.datetime64(TODAY, "s") - np.datetime64("1989-12-31", "s")).astype(np.int64))
+    body = bytearray(b"\x40\x00\x00" + struct.pack("<H", 20) + bytes([2, 253, 4, 0x86, 3, 1, 0x02]))
+    body += b"\x41\x00\x00" + struct.pack("<H", 20) + bytes([1, 3, 1, 0x02])
+    for second, heart_rate in enumerate(heart_rates.tolist()):
+        timestamp = start + second
+        if second % 2:
+            body += bytes([0x80 | 1 << 5 | timestamp & 0x1F, heart_rate])
+        else:
+            body += b"\x00" + struct.pack("<IB", timestamp, heart_rate)
+    return struct.pack("<BBHI4sH", 14, 0x10, 2100, len(body), b".FIT", 0) + body + b"\x00\x00"
+
+
+def random_roster(size, camp_weeks, seed=0):
+    rng = np.random.default_rng(seed)
+    current_weight = rng.uniform(60, 110, size)
+    return {
+        "age": rng.integers(18, 40, size),
+        "sex": rng.choice(["Male", "Female"], size),
+        "height": rng.integers(150, 200, size),
+        "current_weight": current_weight,
+        "target_weight": current_weight - rng.uniform(3, 10, size),
+        "fight_date": np.full(size, np.datetime64(TODAY) + np.timedelta64(camp_weeks * 7, "D")),
+        "water_cut_percentage": rng.uniform(0, 5, size),
+        "training_level": rng.choice(list(TRAINING_LEVELS), size),
+    }
+
+
+# --- Suites ---
+def run_micro():
+    results = {}
+    from fight_camp.app import calculate_training_calories, estimate_bmr
+    from fight_camp.pdf_plan import clean_text
+
+    results["micro.estimate_bmr"] = time_call(lambda: estimate_bmr(72.5, 175, 25, "Male"))
+    results["micro.calculate_training_calories"] = time_call(lambda: calculate_training_calories(5.0, 5.0, 5.0))
+    results["micro.clean_text"] = time_call(
+        lambda: clean_text("4–2 out: 100ml/kg | 1 day out: 15ml/kg | Weigh-in day: minimal sips"))
+
+    for weeks in CAMP_WEEKS:
+        fight_date = TODAY + timedelta(weeks=weeks)
+        results[f"micro.legacy_weekly_loop[weeks={weeks}]"] = time_call(
+            lambda: legacy_weekly_loop(25, "Male", 175, 80.0, 70.0, 3.0, "Medium (5-10 hrs)", weeks - 1))
+        results[f"micro.plan_weekly[weeks={weeks}]"] = time_call(
+            lambda: plan_weekly(25, "Male", 175, 80.0, 70.0, fight_date, 3.0, "Medium (5-10 hrs)", today=TODAY))
+        for size in BATCH_SIZES:
+            roster = random_roster(size, weeks)
+            results[f"micro.plan_weekly_batch[weeks={weeks},athletes={size}]"] = time_call(
+                lambda: plan_weekly_batch(**roster, today=TODAY), repeat=3)
+
+    from fight_camp.replan import CampPlans
+
+    roster = random_roster(REPLAN_ATHLETES, CAMP_WEEKS[-1])
+    plans = CampPlans(**roster, today=TODAY)
+    athletes = np.arange(REPLAN_ATHLETES)
+    weigh_in_day = np.full(REPLAN_ATHLETES, np.datetime64(TODAY) + np.timedelta64(10 * 7 + 3, "D"))
+    observed = roster["current_weight"] - np.random.default_rng(1).uniform(0, 4, REPLAN_ATHLETES)
+    results[f"micro.replan_update[weeks={CAMP_WEEKS[-1]},athletes={REPLAN_ATHLETES}]"] = time_call(
+        lambda: plans.update(athletes, weigh_in_day, observed), repeat=3)
+
+    from fight_camp.scenarios import sweep
+
+    # What-if explorer: 20 target weights x 26 fight dates x 7 water cuts x every training level
+    target_weights = 70.0 + 0.25 * np.arange(-10, 10)
+    fight_dates = np.datetime64(TODAY) + 7 * np.arange(5, 31)
+    water_cuts = np.arange(0.0, 3.5, 0.5)
+    cells = len(target_weights) * len(fight_dates) * len(water_cuts) * len(TRAINING_LEVELS)
+    results[f"micro.scenario_sweep[cells={cells}]"] = time_call(
+        lambda: sweep(25, "Male", 175, 80.0, target_weights, fight_dates, water_cuts, list(TRAINING_LEVELS),
+                      today=TODAY))
+
+    from fight_camp.meal_plan import plan_meals
+    from fight_camp.plan_cache import PlanCache
+
+    # A full camp for one athlete with nothing cached, as on a first rerun
+    camp = plan_weekly_batch(**random_roster(1, CAMP_WEEKS[-1]), today=TODAY)
+    results[f"micro.plan_meals[weeks={CAMP_WEEKS[-1]}]"] = time_call(
+        lambda: plan_meals(camp.protein_g, camp.fat_g, camp.carbs_g, cache=PlanCache()), repeat=3)
+
+    from fight_camp.energy_balance import project_plan
+
+    # Dynamic projection of a 12-week camp for a whole network's roster
+    roster = random_roster(SIMULATION_ATHLETES, CAMP_WEEKS[1] + 1)
+    batch = plan_weekly_batch(**roster, today=TODAY)
+    days = int(batch.week.max()) * 7
+    results[f"micro.project_plan[days={days},athletes={SIMULATION_ATHLETES}]"] = time_call(
+        lambda: project_plan(batch, roster["age"], roster["sex"], roster["height"], roster["training_level"]),
+        repeat=3)
+
+    from fight_camp.matchmaking import match_options
+
+    # Matchmaking screen: both inverse answers for the whole replan-sized roster
+    roster = random_roster(REPLAN_ATHLETES, CAMP_WEEKS[1])
+    results[f"micro.match_options[athletes={REPLAN_ATHLETES}]"] = time_call(
+        lambda: match_options(roster["current_weight"], roster["target_weight"], roster["fight_date"], 1.0,
+                              today=TODAY), repeat=3)
+
+    from fight_camp.coach import BoardQuery, CoachBoard, RosterPlan
+
+    # Coach board rerun: join the latest weigh-ins, run a filtered sort and format one page
+    roster = random_roster(COACH_ATHLETES, CAMP_WEEKS[1])
+    ids = np.array([f"A{athlete:05d}" for athlete in range(COACH_ATHLETES)])
+    board_roster = RosterPlan(ids, roster, TODAY)
+    latest = {"athlete": ids[::2].tolist(), "date": [(TODAY + timedelta(days=17)).isoformat()] * len(ids[::2]),
+              "weight_kg": (roster["current_weight"][::2] - 1.5).tolist()}
+    query = BoardQuery("deviation", True, ("Welterweight", "Middleweight"), ("Behind", "On plan"))
+
+    def coach_rerun():
+        board = CoachBoard(board_roster, latest, TODAY + timedelta(days=20))
+        return board.page_frame(board.query(query), 1)
+
+    results[f"micro.coach_board[athletes={COACH_ATHLETES}]"] = time_call(coach_rerun, repeat=3)
+
+    import io
+
+    from fight_camp.reminders import LogSink, ReminderSchedule, simulate
+
+    # Reminder service start: schedule the replan-sized roster and send its busiest day (every athlete, 06:00-09:59)
+    roster = random_roster(REPLAN_ATHLETES, CAMP_WEEKS[1])
+    ids = np.array([f"A{athlete:05d}" for athlete in range(REPLAN_ATHLETES)])
+    rng = np.random.default_rng(0)
+    reminder_times = [f"{hour}:{minute:02d}" for hour, minute in zip(rng.integers(6, 10, REPLAN_ATHLETES).tolist(),
+                                                                      rng.integers(0, 60, REPLAN_ATHLETES).tolist())]
+
+    def reminder_day():
+        schedule = ReminderSchedule(ids, roster, TODAY, reminder_times, now=TODAY)
+        return simulate(schedule, LogSink(io.StringIO()), TODAY + timedelta(days=1))
+
+    results[f"micro.reminder_day[athletes={REPLAN_ATHLETES}]"] = time_call(reminder_day, repeat=3)
+
+    from fight_camp.sessions import read_session_days
+
+    # First upload of a day's 1 Hz training file, before its day sums are cached
+    fit_bytes = fit_session_bytes(SESSION_SAMPLES)
+    results[f"micro.session_days[fit,samples={SESSION_SAMPLES}]"] = time_call(
+        lambda: read_session_days(io.BytesIO(fit_bytes), "session.fit"), repeat=3)
+    return results
+
+
+def _app_test(script):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT_DIR / script), default_timeout=60)
+    at.run()
+    if at.sidebar.date_input:
+        # The default fight date is today, which only renders the error branch
+        at.sidebar.date_input[0].set_value(date.today() + timedelta(weeks=10))
+        if at.sidebar.button:  # app_5 only applies its inputs on "Generate plan"
+            at.sidebar.button[0].click()
+        at.run()
+    return at
+
+
+def run_reruns(reruns=10):
+    results = {}
+    for script in APP_SCRIPTS:
+        started = time.perf_counter()
+        at = _app_test(script)
+        first_run = time.perf_counter() - started
+        samples = []
+        for _ in range(reruns):
+            started = time.perf_counter()
+            at.run()
+            samples.append(time.perf_counter() - started)
+        if at.exception:
+            raise RuntimeError(f"{script} raised: {at.exception[0].value}")
+        results[f"rerun.{script}"] = {
+            "seconds": statistics.median(samples),
+            "p90_seconds": sorted(samples)[int(0.9 * (len(samples) - 1))],
+            "first_run_seconds": first_run,
+        }
+    return results
+
+
+def run_memory(sessions=5):
+    results = {}
+    for script in APP_SCRIPTS:
+        _app_test(script)  # warm imports and caches so only per-session state is counted
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        kept = [_app_test(script) for _ in range(sessions)]
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"memory.{script}"] = {
+            "bytes": (current - baseline) // sessions,
+            "peak_bytes": peak - baseline,
+            "sessions": len(kept),
+        }
+
+    # Roster-scale plan storage: the columnar batch against the legacy list of row dicts
+    from fight_camp.plan_cache import estimate_size
+
+    weeks = 12
+    roster = random_roster(ROSTER_MEMORY_ATHLETES, weeks + 1)
+    batch = plan_weekly_batch(**roster, today=TODAY)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    legacy = [
+        legacy_weekly_rows(*(roster[field][i] for field in (
+            "age", "sex", "height", "current_weight", "target_weight", "water_cut_percentage", "training_level",
+        )), weeks)
+        for i in range(LEGACY_MEMORY_SAMPLE)
+    ]
+    legacy_bytes = (tracemalloc.get_traced_memory()[0] - baseline) * ROSTER_MEMORY_ATHLETES // len(legacy)
+    tracemalloc.stop()
+    results[f"memory.roster_plan[athletes={ROSTER_MEMORY_ATHLETES},weeks={weeks}]"] = {
+        "bytes": estimate_size(batch),
+        "legacy_bytes": legacy_bytes,
+    }
+    return results
+
+
+_FIRST_RENDER = """
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=60)
+started = time.perf_counter()
+at.run()
+print(time.perf_counter() - started)
+print(",".join(m for m in sys.argv[2:] if m in sys.modules))
+"""
+
+
+def _import_seconds(module):
+    """Cumulative `-X importtime` of `module` with Streamlit already imported."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import streamlit; import {module}"],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def run_startup():
+    """Cold-start cost: import time of the page module and each script's first render."""
+    results = {"imports.fight_camp.app": {
+        "seconds": statistics.median(_import_seconds("fight_camp.app") for _ in range(STARTUP_RUNS)),
+    }}
+    for script in APP_SCRIPTS:
+        samples = []
+        for _ in range(STARTUP_RUNS):
+            completed = subprocess.run(
+                [sys.executable, "-c", _FIRST_RENDER, str(ROOT_DIR / script), *DEFERRED_MODULES],
+                cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+            )
+            seconds, loaded = completed.stdout.splitlines()[-2:]
+            samples.append(float(seconds))
+        results[f"startup.{script}"] = {
+            "seconds": statistics.median(samples),
+            "deferred_modules_loaded": len(loaded.split(",")) if loaded else 0,
+        }
+    return results
+
+
+def run_store():
+    """Weigh-in store: bulk import and a roster-wide last-90-days read, as the coach dashboard does."""
+    from fight_camp.weigh_ins import WeighInStore
+
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(60, 110, (STORE_ATHLETES, STORE_DAYS))
+    rows = [(f"athlete_{i:05d}", TODAY - timedelta(days=day), weights[i, day])
+            for i in range(STORE_ATHLETES) for day in range(STORE_DAYS)]
+    label = f"athletes={STORE_ATHLETES},days={STORE_DAYS}"
+    with tempfile.TemporaryDirectory() as directory:
+        store = WeighInStore(Path(directory) / "weigh_ins.sqlite3")
+        started = time.perf_counter()
+        store.bulk_insert(rows)
+        results = {f"store.bulk_insert[{label}]": {"seconds": time.perf_counter() - started, "rows": len(rows)}}
+        results[f"store.recent[{label}]"] = time_call(lambda: store.recent(STORE_DAYS, today=TODAY), repeat=3)
+        store.close()
+    return results
+
+
+def run_archive():
+    """Plan archive: append a roster's weekly plans, then the analytics scan of one weight class."""
+    from fight_camp.plan_archive import PlanArchive, archive_columns, athlete_filter, plan_filter
+
+    roster = random_roster(ARCHIVE_ATHLETES, 13)
+    batch = plan_weekly_batch(**roster, today=TODAY)
+    columns = archive_columns(batch, np.arange(ARCHIVE_ATHLETES), roster)
+    label = f"athletes={ARCHIVE_ATHLETES},rows={len(batch.week)}"
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PlanArchive(directory)
+        started = time.perf_counter()
+        archive.append(columns)
+        results[f"archive.append[{label}]"] = {"seconds": time.perf_counter() - started}
+        featherweights = plan_filter("Featherweight", since=TODAY, until=TODAY + timedelta(weeks=13))
+        results[f"archive.scan_weight_class[{label}]"] = time_call(
+            lambda: archive.scan(["week", "calories"], filter=featherweights), repeat=3)
+        results[f"archive.scan_athlete[{label}]"] = time_call(
+            lambda: archive.scan(filter=athlete_filter(ARCHIVE_ATHLETES // 2)), repeat=3)
+    return results
+
+
+SUITES = {
+    "micro": run_micro, "rerun": run_reruns, "memory": run_memory, "startup": run_startup, "store": run_store,
+    "archive": run_archive,
+}
+
+
+# --- Reporting ---
+def check_thresholds(results, thresholds):
+    """Return a list of (name, metric, value, limit) for benchmarks over their ceiling."""
+    failures = []
+    for name, limits in thresholds.items():
+        if name not in results:
+            continue
+        for metric, limit in limits.items():
+            key = metric.removeprefix("max_")
+            value = results[name].get(key)
+            if value is not None and value > limit:
+                failures.append((name, key, value, limit))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the planner benchmark suite.")
+    parser.add_argument("--only", choices=sorted(SUITES), action="append", help="suite(s) to run")
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--thresholds", default=str(DEFAULT_THRESHOLDS), help="JSON regression ceilings")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for suite in args.only or SUITES:
+        print(f"Running {suite} benchmarks...", file=sys.stderr)
+        results.update(SUITES[suite]())
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    for name, values in results.items():
+        value = f"{values['seconds'] * 1e6:,.1f} us" if "seconds" in values else f"{values['bytes'] / 1024:,.0f} KB"
+        print(f"{name:<60} {value:>14}")
+
+    thresholds = json.loads(Path(args.thresholds).read_text()) if Path(args.thresholds).exists() else {}
+    failures = check_thresholds(results, thresholds)
+    for name, metric, value, limit in failures:
+        print(f"REGRESSION {name}: {metric}={value:.6g} exceeds {limit:.6g}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""Concurrent-session load test for the Streamlit apps.
+
+    python benchmarks/streamlit_load_test.py app_5.py --sessions 50 --reruns 20
+    python benchmarks/streamlit_load_test.py app_2.py --sessions 10 --seed 7 --output load.json
+
+Starts `streamlit run <app>` on a free local port and opens --sessions
+websocket sessions against it, each speaking the browser's protocol: a first
+run, then --reruns reruns that either submit new randomized sidebar inputs
+or flip "Activate Fight Week Mode" (as a fragment rerun where the app puts the
+toggle in a fragment). Inputs and actions come from --seed alone, so the same
+command replays the same scenarios across code changes.
+
+Reports rerun latency percentiles and websocket bytes received per rerun by
+action, and the server's resident memory before and after the sessions
+connect (read from /proc, so Linux only). One extra warm-up session runs
+first, outside the results, so the libraries the apps import lazily are
+loaded before the "before" reading.
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+
+from api_load_test import athlete_bodies
+
+ROOT = Path(__file__).resolve().parent.parent
+FIGHT_WEEK_LABEL = "Activate Fight Week Mode"
+SIDEBAR = 1  # delta_path root of st.sidebar
+# Sidebar label -> athlete_bodies field; other sidebar widgets get a random value in their range
+LABEL_FIELDS = {
+    "Age": "age",
+    "Sex": "sex",
+    "Height (cm)": "height",
+    "Current Weight (kg)": "current_weight",
+    "Target Fight Weight (kg)": "target_weight",
+    "Fight Date": "fight_date",
+    "Water Cut Percentage (Max 5%)": "water_cut_percentage",
+    "Training Intensity (per week)": "training_level",
+    "Overall Training Intensity": "training_level",
+}
+FINISHED = ("FINISHED_SUCCESSFULLY", "FINISHED_FRAGMENT_RUN_SUCCESSFULLY")
+
+
+# --- Server ---
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(app, port, timeout=60):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(app), "--server.headless", "true",
+         "--server.port", str(port), "--server.address", "127.0.0.1", "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"streamlit did not become healthy within {timeout}s")
+
+
+def resident_bytes(pid):
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+# --- Sessions ---
+def widget_value(state, kind, widget, value):
+    """Set `value` on a WidgetState proto the way the frontend encodes `kind` widgets."""
+    if kind in ("number_input", "slider"):
+        if kind == "slider":
+            state.double_array_value.data[:] = [float(value)]
+        else:
+            state.double_value = float(value)
+    elif kind == "selectbox":
+        state.string_value = value if value in widget.options else widget.options[0]
+    elif kind == "date_input":
+        state.string_array_value.data[:] = [value]
+    elif kind == "text_input":
+        state.string_value = value
+    elif kind == "checkbox":
+        state.bool_value = bool(value)
+    elif kind == "button":
+        state.trigger_value = True
+
+
+def random_value(rng, kind, widget):
+    """A value for a sidebar widget with no athlete field."""
+    if kind == "number_input":
+        step = widget.step or 1
+        return widget.min + step * int(rng.integers(0, int((widget.max - widget.min) / step) + 1))
+    if kind == "selectbox":
+        return widget.options[int(rng.integers(len(widget.options)))]
+    if kind == "text_input":
+        return f"load-{int(rng.integers(1000))}"
+    return None
+
+
+class Session:
+    """One simulated browser tab: its websocket, the widgets it has seen and its measurements."""
+
+    def __init__(self, websocket, rng):
+        self.websocket = websocket
+        self.rng = rng
+        self.widgets = {}  # widget id -> (kind, proto, label, fragment id, in sidebar)
+        self.values = {}  # widget id -> value
+        self.fight_week = False
+        self.reruns = []
+
+    async def rerun(self, action, fragment_id=""):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        message.rerun_script.fragment_id = fragment_id
+        for kind, widget, _, _, _ in self.widgets.values():
+            if widget.id in self.values:
+                widget_value(message.rerun_script.widget_states.widgets.add(id=widget.id), kind, widget,
+                             self.values[widget.id])
+                if kind == "button":
+                    del self.values[widget.id]  # triggers fire once
+
+        if not fragment_id:
+            self.widgets = {}  # a full run re-sends every element
+        started = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+        received = 0
+        while True:
+            frame = await self.websocket.recv()
+            received += len(frame)
+            forward = ForwardMsg()
+            forward.ParseFromString(frame)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                self.see(forward)
+            elif kind == "script_finished":
+                status = ForwardMsg.ScriptFinishedStatus.Name(forward.script_finished)
+                if status == "FINISHED_EARLY_FOR_RERUN":
+                    continue
+                break
+        self.reruns.append({"action": action, "seconds": time.perf_counter() - started, "bytes": received,
+                            "ok": status in FINISHED})
+
+    def see(self, forward):
+        element = forward.delta.new_element
+        kind = element.WhichOneof("type")
+        if kind not in ("number_input", "selectbox", "slider", "date_input", "text_input", "checkbox", "button"):
+            return
+        widget = getattr(element, kind)
+        in_sidebar = tuple(forward.metadata.delta_path[:1]) == (SIDEBAR,)
+        self.widgets[widget.id] = (kind, widget, widget.label, forward.delta.fragment_id, in_sidebar)
+
+    def new_inputs(self, body):
+        """Queue new values for every sidebar input, plus the form's submit trigger."""
+        for kind, widget, label, _, in_sidebar in self.widgets.values():
+            if not in_sidebar or label == FIGHT_WEEK_LABEL:
+                continue
+            if kind == "button":
+                if widget.is_form_submitter:
+                    self.values[widget.id] = True
+            elif label in LABEL_FIELDS:
+                self.values[widget.id] = body[LABEL_FIELDS[label]]
+            else:
+                value = random_value(self.rng, kind, widget)
+                if value is not None:
+                    self.values[widget.id] = value
+
+    def flip_fight_week(self):
+        """Queue the fight week toggle's new value; returns its fragment id, or None if not shown."""
+        toggles = [(widget, fragment_id) for _, widget, label, fragment_id, _ in self.widgets.values()
+                   if label == FIGHT_WEEK_LABEL]
+        if not toggles:
+            return None
+        widget, fragment_id = toggles[0]
+        self.fight_week = not self.fight_week
+        self.values[widget.id] = self.fight_week
+        return fragment_id
+
+
+async def run_session(args, index, bodies):
+    from websockets.asyncio.client import connect
+
+    rng = np.random.default_rng([args.seed, index])
+    async with connect(f"ws://127.0.0.1:{args.port}/_stcore/stream", subprotocols=["streamlit"],
+                       max_size=None) as websocket:
+        session = Session(websocket, rng)
+        await session.rerun("first_run")
+        for body in bodies:
+            if args.think_time:
+                await asyncio.sleep(float(rng.exponential(args.think_time)))
+            fragment_id = session.flip_fight_week() if rng.random() < args.toggle_share else None
+            if fragment_id is None:
+                session.new_inputs(body)
+                await session.rerun("inputs")
+            else:
+                await session.rerun("fight_week", fragment_id)
+        return session
+
+
+def summarize(reruns):
+    seconds = sorted(rerun["seconds"] for rerun in reruns)
+    received = [rerun["bytes"] for rerun in reruns]
+    return {
+        "reruns": len(reruns),
+        "failed": sum(not rerun["ok"] for rerun in reruns),
+        "p50_ms": statistics.median(seconds) * 1000,
+        "p90_ms": seconds[int(0.90 * (len(seconds) - 1))] * 1000,
+        "p99_ms": seconds[int(0.99 * (len(seconds) - 1))] * 1000,
+        "max_ms": seconds[-1] * 1000,
+        "mean_bytes": statistics.fmean(received),
+        "max_bytes": max(received),
+    }
+
+
+async def drive(args, server):
+    # One more session's inputs than measured: the last slice is the warm-up's
+    bodies = athlete_bodies((args.sessions + 1) * args.reruns, date.today(), seed=args.seed)
+    await run_session(args, args.sessions, bodies[args.sessions * args.reruns:])
+    idle_bytes = resident_bytes(server.pid)
+    started = time.perf_counter()
+    sessions = [asyncio.ensure_future(run_session(args, index, bodies[index * args.reruns:(index + 1) * args.reruns]))
+                for index in range(args.sessions)]
+    finished = await asyncio.gather(*sessions)
+    elapsed = time.perf_counter() - started
+    # Sessions stay registered on the server until their websockets close, which
+    # happens as each coroutine returns; measure right after the last one finished
+    loaded_bytes = resident_bytes(server.pid)
+
+    reruns = [rerun for session in finished for rerun in session.reruns]
+    by_action = {}
+    for rerun in reruns:
+        by_action.setdefault(rerun["action"], []).append(rerun)
+    return {
+        "app": args.app,
+        "sessions": args.sessions,
+        "reruns_per_session": args.reruns,
+        "seed": args.seed,
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "seconds": elapsed,
+        "reruns_per_second": len(reruns) / elapsed,
+        "all": summarize(reruns),
+        "by_action": {action: summarize(items) for action, items in by_action.items()},
+        "server_rss_idle_bytes": idle_bytes,
+        "server_rss_loaded_bytes": loaded_bytes,
+        "rss_per_session_bytes": (loaded_bytes - idle_bytes) / args.sessions,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive concurrent Streamlit sessions against a local app.")
+    parser.add_argument("app", help="app script, e.g. app_5.py")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--reruns", type=int, default=10, help="reruns per session after the first run")
+    parser.add_argument("--toggle-share", type=float, default=0.3,
+                        help="share of reruns that flip fight week mode instead of changing inputs")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean seconds between a session's reruns")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=0, help="server port (0: pick a free one)")
+    parser.add_argument("--output", help="also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    args.port = args.port or free_port()
+    server = start_server(ROOT / args.app, args.port)
+    try:
+        result = asyncio.run(drive(args, server))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    print(json.dumps(result, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    return 0 if not result["all"]["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""My Fight Camp Nutrition: planning engine, Streamlit page and batch tools.
+
+Nothing is imported here, so `import fight_camp.app` only pays for the
+modules the page actually uses; see fight_camp.app for what loads when.
+"""
@@ -0,0 +1,677 @@
+"""The Streamlit page shared by every app variant.
+
+NumPy, pandas and fpdf are only imported on the code paths that need them, so
+a first render that stops at a validation message never loads them and the
+PDF renderer is only loaded when someone clicks download.
+"""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from .constants import FIGHT_WEEK_PROTOCOL, MAX_CAMP_WEEKS, MIN_CAMP_DAYS, SESSION_FILE_TYPES, TRAINING_LEVELS
+from .rerun_timing import RerunTimer
+from .variants import FIGHT_WEEK_GUIDES, WEEK1_TRAINING_LEVELS, get_variant
+
+TITLE = "My Fight Camp Nutrition"
+DISCLAIMER = ("This app is for informational purposes only and should not be considered medical advice. "
+              "Always consult a healthcare professional before making significant changes to your diet or "
+              "exercise routine.")
+
+
+# --- Utility Functions ---
+def estimate_bmr(weight, height, age, sex):
+    """Mifflin-St Jeor BMR, as used by app_2/app_3/app_4."""
+    if sex == "Male":
+        return 10 * weight + 6.25 * height - 5 * age + 5
+    else:
+        return 10 * weight + 6.25 * height - 5 * age - 161
+
+
+def calculate_training_calories(high, medium, low):
+    return (high * 60 * 11) + (medium * 60 * 7.5) + (low * 60 * 4.5)
+
+
+def camp_length_weeks(days_left):
+    weeks_left = days_left / 7
+    return int(weeks_left) if weeks_left == int(weeks_left) else int(weeks_left) + 1
+
+
+def subscription_price(variant, fight_camp_length):
+    if variant["price_per_week"] is not None:
+        return fight_camp_length * variant["price_per_week"]
+    return fight_camp_length * 5 if 4 <= fight_camp_length <= 12 else 120
+
+
+# --- Header ---
+def render_header(variant):
+    from .static_assets import logo_tag, stylesheet_tag
+
+    if variant["header"] == "welcome":
+        st.title(TITLE)
+        st.markdown("""
+            <div style='text-align: center; margin-top: -20px;'>
+                <h3>Welcome to your Fight Camp Planner</h3>
+                <p>Get your personalized nutrition, weight cut, and water loading strategy, ready for peak performance on fight day.</p>
+            </div>
+        """, unsafe_allow_html=True)
+        return
+
+    if variant["banner_logo"]:
+        st.markdown(f"""
+            <div style='background-color: black; padding: 20px; border-radius: 10px; margin-bottom: 20px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.2);'>
+                {logo_tag(variant["banner_logo"])}
+                <h1 style='color: white; margin-bottom: 5px;'>{TITLE}</h1>
+                <p style='color: white;'>{variant["tagline"]}</p>
+            </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown(stylesheet_tag(variant["name"]), unsafe_allow_html=True)
+
+    if variant["header"] == "tagline":
+        st.title(TITLE)
+        st.markdown(f"""
+        <div style='text-align: center; margin-top: -20px;'>
+            <p>{variant["tagline"]}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+
+    st.markdown("<div class='header-bar'>", unsafe_allow_html=True)
+    if variant["header_logo"]:
+        st.markdown(f"""
+            <div style="text-align: center;">
+                {logo_tag(variant["header_logo"])}
+            </div>
+        """, unsafe_allow_html=True)
+    st.title(TITLE)
+    st.caption(variant["tagline"])
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+# --- Sidebar Inputs ---
+def sidebar_inputs(variant):
+    # app_5 batches its inputs in a form, so typing doesn't rerun the script;
+    # the plan is only rebuilt when "Generate plan" is pressed
+    panel = st.sidebar.form("fight_details") if variant["form"] else st.sidebar
+    panel.header("Your Fight Details")
+
+    inputs = {}
+    current_weight_default = 70.0
+    if variant["weigh_in_log"]:
+        inputs["athlete"] = panel.text_input("Athlete ID (optional)").strip()
+        latest = latest_weigh_in(inputs["athlete"])
+        if latest:
+            current_weight_default = min(max(latest[1], 30.0), 150.0)
+    inputs["age"] = panel.number_input("Age", min_value=10, max_value=80, value=25)
+    inputs["sex"] = panel.selectbox("Sex", variant["sex_options"])
+    if variant["height_input"]:
+        inputs["height"] = panel.number_input("Height (cm)", min_value=140, max_value=220, value=170)
+    inputs["current_weight"] = panel.number_input(
+        "Current Weight (kg)", min_value=30.0, max_value=150.0, value=current_weight_default, step=0.1
+    )
+    inputs["target_weight"] = panel.number_input("Target Fight Weight (kg)", min_value=30.0, max_value=150.0, value=65.0, step=0.1)
+    inputs["fight_date"] = panel.date_input("Fight Date", min_value=datetime.today())
+    inputs["water_cut_percentage"] = panel.slider(
+        "Water Cut Percentage (Max 5%)", min_value=0.0, max_value=5.0, value=variant["water_cut_default"], step=0.1
+    )
+
+    # Imported sessions, when there are any, replace the hours or intensity inputs
+    training = session_training(panel, inputs) if variant["session_import"] else None
+    if training is not None:
+        from .sessions import training_expenditure
+
+        # The same expenditure whether the app plans from kcal on top of BMR or a factor of it
+        bmr = estimate_bmr(inputs["current_weight"], inputs["height"], inputs["age"], inputs["sex"])
+        maintenance_factor, maintenance_kcal = training_expenditure(training.daily_kcal, bmr)
+    if variant["training"] == "hours":
+        if training is not None:
+            inputs["training_calories"] = maintenance_kcal - bmr
+        else:
+            panel.header("Weekly Training Hours")
+            high = panel.number_input("High Intensity (hrs)", min_value=0.0, max_value=20.0, value=5.0, step=0.5)
+            medium = panel.number_input("Medium Intensity (hrs)", min_value=0.0, max_value=20.0, value=5.0, step=0.5)
+            low = panel.number_input("Low Intensity (hrs)", min_value=0.0, max_value=20.0, value=5.0, step=0.5)
+            inputs["training_calories"] = calculate_training_calories(high, medium, low) / 7
+    elif variant["training"] == "week1":
+        panel.header("Training Intensity")
+        inputs["training_level"] = panel.selectbox("Overall Training Intensity", options=list(WEEK1_TRAINING_LEVELS))
+    elif variant["training"] == "planner":
+        if training is not None:
+            inputs["training_level"] = round(maintenance_factor, 2)
+        else:
+            inputs["training_level"] = panel.selectbox("Training Intensity (per week)", options=list(TRAINING_LEVELS))
+
+    if variant["form"]:
+        panel.form_submit_button("Generate plan", type="primary")
+    if variant["fight_week_guide"]:
+        inputs["fight_week_mode"] = panel.checkbox("Activate Fight Week Mode")
+    return inputs
+
+
+def session_training(panel, inputs):
+    """A TrainingEstimate from uploaded session files (fight_camp.sessions), or None without any."""
+    files = panel.file_uploader("Training sessions (CSV, TCX, GPX or FIT)", type=SESSION_FILE_TYPES,
+                                accept_multiple_files=True)
+    if not files:
+        return None
+    from .plan_cache import plan_cache
+    from .sessions import combine_session_days, estimate_training, file_key, read_session_days
+
+    # Files are parsed once per content hash, so re-uploads and other athletes reuse the day sums
+    keys = st.session_state.setdefault("session_file_keys", {})
+    session_days = []
+    try:
+        for file in files:
+            if file.file_id not in keys:
+                keys[file.file_id] = file_key(file.getvalue())
+            file.seek(0)
+            session_days.append(plan_cache.get_or_compute(
+                keys[file.file_id], lambda file=file: read_session_days(file, file.name)))
+        training = estimate_training(combine_session_days(session_days), inputs["current_weight"],
+                                     inputs["height"], inputs["age"], inputs["sex"])
+    except ValueError as error:
+        panel.error(f"Couldn't read the training sessions: {error}")
+        return None
+    panel.caption(f"{len(files)} session file(s) over {len(training.kcal)} days: ~{training.daily_kcal:.0f} kcal/day "
+                  f"of training.")
+    if training.unmeasured_days:
+        panel.caption(f"{training.unmeasured_days} day(s) had no heart rate or calories and count as rest.")
+    return training
+
+
+# --- Weigh-in Log ---
+def latest_weigh_in(athlete):
+    if not athlete:
+        return None
+    from .weigh_ins import get_store
+
+    return get_store().latest(athlete)
+
+
+def weigh_in_panel(athlete, today):
+    """Sidebar box to log today's weight; the latest weigh-in becomes the default current weight."""
+    from .weigh_ins import get_store
+
+    with st.sidebar.expander("Weigh-in Log", expanded=True):
+        latest = get_store().latest(athlete)
+        if latest:
+            st.caption(f"Last weigh-in: {latest[1]:.1f} kg on {latest[0]:%d %b %Y}")
+        weight = st.number_input("Today's weight (kg)", min_value=30.0, max_value=150.0,
+                                 value=min(max(latest[1], 30.0), 150.0) if latest else 70.0, step=0.1)
+        if st.button("Log weight"):
+            get_store().record(athlete, today, weight)
+            st.rerun()
+
+
+def weigh_in_history(athlete, today):
+    """The athlete's weigh-ins in their current camp, up to and including `today`."""
+    if not athlete:
+        return []
+    from .weigh_ins import current_camp, get_store
+
+    return current_camp(get_store().history(athlete, end=today))
+
+
+def weight_progress(athlete, fight_week_start_weight):
+    """(kg lost since the first weigh-in, kg to lose from it), or None without two weigh-ins."""
+    if not athlete:
+        return None
+    from .weigh_ins import current_camp, get_store
+
+    history = current_camp(get_store().history(athlete))
+    if len(history) < 2:
+        return None
+    start_weight, latest_weight = history[0][1], history[-1][1]
+    return start_weight - latest_weight, start_weight - fight_week_start_weight
+
+
+# --- Fight Week ---
+def render_fight_week(guide):
+    for heading, instruction, why_title, why_text in guide:
+        st.subheader(heading)
+        for line in instruction.splitlines():
+            st.write(line)
+        if why_title:
+            with st.expander(why_title):
+                st.write(why_text)
+
+
+def render_guide_fight_week(variant):
+    st.header("Fight Week Plan")
+    st.markdown("---")
+    render_fight_week(FIGHT_WEEK_GUIDES[variant["fight_week_guide"]])
+
+
+def render_weekly_goals(current_weight, fat_loss_per_week, fight_camp_length, fight_week_start_weight):
+    st.header("Weekly Weight Goals")
+    for week in range(1, fight_camp_length):
+        target_weight_week = current_weight - (fat_loss_per_week * week)
+        st.write(f"Week {week}: Target Weight ~ {target_weight_week:.1f} kg")
+    st.write(f"Fight Week Start: ~{fight_week_start_weight:.1f} kg")
+
+
+# --- Plans ---
+def overview_plan(variant, inputs, camp, timer):
+    """app.py: flat targets from a 2000 kcal baseline, plus a text download."""
+    timer.section("render")
+    st.header("Weight Cut Overview")
+    days_left = camp["days_left"]
+    if days_left <= 0:
+        st.error("Please select a valid future fight date.")
+        return
+
+    fight_camp_length = camp["fight_camp_length"]
+    current_weight, target_weight = inputs["current_weight"], inputs["target_weight"]
+    weight_to_lose = current_weight - target_weight
+    water_cut_kg = (inputs["water_cut_percentage"] / 100) * current_weight
+    fat_loss_goal = weight_to_lose - water_cut_kg
+    fat_loss_per_week = fat_loss_goal / fight_camp_length
+    calorie_deficit_per_day = (fat_loss_goal * 7700) / (fight_camp_length * 7)
+
+    # Macros Calculation
+    protein_per_kg = 2.2 if inputs["sex"] == "Male" else 2.0
+    protein_grams = protein_per_kg * target_weight
+    fat_grams = (0.3 * (calorie_deficit_per_day + 2000)) / 9
+    carbs_grams = ((calorie_deficit_per_day + 2000) - (protein_grams * 4) - (fat_grams * 9)) / 4
+
+    st.write(f"**Days Until Fight:** {days_left} days")
+    st.write(f"**Total Weight to Lose:** {weight_to_lose:.1f} kg")
+    st.write(f"**Fat Loss Goal:** {fat_loss_goal:.1f} kg (after {water_cut_kg:.1f} kg water cut)")
+    st.write(f"**Weekly Fat Loss Needed:** {fat_loss_per_week:.2f} kg/week")
+    st.write(f"**Daily Calorie Deficit Needed:** {calorie_deficit_per_day:.0f} kcal/day")
+
+    st.header("Daily Nutrition Targets")
+    st.write(f"**Calories per Day:** ~{2000 - calorie_deficit_per_day:.0f} kcal")
+    st.write(f"**Protein:** {protein_grams:.0f} g/day")
+    st.write(f"**Fat:** {fat_grams:.0f} g/day")
+    st.write(f"**Carbs:** {carbs_grams:.0f} g/day")
+
+    st.header("Carbohydrate & Fibre Reduction Plan")
+    st.write("- Maintain normal carbs and fibre until 7 days before fight.")
+    st.write("- 6–4 days out: reduce carbs by 50%, fibre to 15g/day.")
+    st.write("- 3–1 days out: very low carbs (under 50g/day), fibre to 10g/day.")
+
+    st.header("Water Loading Strategy")
+    st.write("- 7–5 days out: Drink 6–7L/day.")
+    st.write("- 4–3 days out: Reduce to 3–4L/day.")
+    st.write("- 2 days out: 1–1.5L.")
+    st.write("- 1 day out: Minimal sips only.")
+
+    timer.section("export")
+    from .exports import EXPORT_FORMATS, deferred, overview_text
+    from .plan_cache import normalize_key
+
+    # Only the button is sent each rerun; the text is built when it is clicked
+    targets = {
+        "weight_to_lose": weight_to_lose, "fat_loss_goal": fat_loss_goal, "water_cut_kg": water_cut_kg,
+        "calories": 2000 - calorie_deficit_per_day, "protein_grams": protein_grams, "fat_grams": fat_grams,
+        "carbs_grams": carbs_grams,
+    }
+    mime, file_name = EXPORT_FORMATS["txt"]
+    st.download_button(
+        label="Download Your Fight Camp Plan",
+        data=deferred("txt", normalize_key("overview", *inputs.values(), camp["today"], camp["price"]),
+                      lambda: overview_text(inputs, camp, targets)),
+        file_name=file_name,
+        mime=mime
+    )
+
+
+def hours_plan(variant, inputs, camp, timer):
+    """app_2.py/app_3.py: targets from BMR plus calories for weekly training hours."""
+    if camp["days_left"] <= 0:
+        st.error("Please select a valid future fight date.")
+        return
+    current_weight, target_weight = inputs["current_weight"], inputs["target_weight"]
+    if current_weight <= target_weight:
+        st.error("Current weight must be higher than target fight weight.")
+        return
+
+    fight_camp_length = camp["fight_camp_length"]
+    water_cut_kg = (inputs["water_cut_percentage"] / 100) * target_weight
+    fight_week_start_weight = target_weight + (2 * water_cut_kg)
+    fat_loss_goal = current_weight - fight_week_start_weight
+    fat_loss_per_week = fat_loss_goal / (fight_camp_length - 1)
+
+    from .energy_balance import camp_intake
+
+    bmr = estimate_bmr(current_weight, inputs["height"], inputs["age"], inputs["sex"])
+    target_calories = camp_intake(current_weight, fight_week_start_weight, (fight_camp_length - 1) * 7, bmr,
+                                  bmr + inputs["training_calories"], inputs["height"], inputs["age"], inputs["sex"])
+
+    protein_grams = 2.0 * current_weight
+    fat_grams = 1.0 * current_weight
+    carbs_grams = (target_calories - (protein_grams * 4 + fat_grams * 9)) / 4
+
+    timer.section("render")
+    if inputs["fight_week_mode"]:
+        render_guide_fight_week(variant)
+        return
+
+    with st.container():
+        st.header("Weight Cut Overview")
+        st.write(f"**Days Until Fight:** {camp['days_left']} days")
+        progress = weight_progress(inputs.get("athlete"), fight_week_start_weight)
+        if progress and progress[1] > 0:
+            lost, to_lose = progress
+            st.progress(max(0, min(1, lost / to_lose)))
+            st.caption(f"{lost:.1f} of {to_lose:.1f} kg lost since your first weigh-in")
+        else:
+            total_camp_days = fight_camp_length * 7
+            days_completed = total_camp_days - camp["days_left"]
+            st.progress(max(0, min(1, days_completed / total_camp_days)))
+        st.write(f"**Current Weight:** {current_weight:.1f} kg")
+        st.write(f"**Fight Week Start Target:** {fight_week_start_weight:.1f} kg")
+        st.write(f"**Fight Weight Target:** {target_weight:.1f} kg")
+
+    with st.container():
+        st.header("Daily Nutrition Targets")
+        st.write(f"**Calories per Day:** ~{target_calories:.0f} kcal")
+        st.write(f"**Protein:** {protein_grams:.0f} g/day")
+        st.write(f"**Fat:** {fat_grams:.0f} g/day")
+        st.write(f"**Carbs:** {carbs_grams:.0f} g/day")
+        st.write("**Fibre:** 30g/day")
+        st.write("**Salt:** 3-5g/day")
+
+    with st.container():
+        render_weekly_goals(current_weight, fat_loss_per_week, fight_camp_length, fight_week_start_weight)
+
+    with st.container():
+        st.header("Supplement Guidance")
+        st.write("- Daily multivitamin and mineral support.")
+        st.write("- Electrolyte support during water loading.")
+        st.write("- Protein supplements as needed.")
+
+
+def week1_plan(variant, inputs, camp, timer):
+    """app_4.py: the first week of the daily plan, from the overall training level."""
+    if camp["days_left"] <= 0:
+        return
+    current_weight, target_weight = inputs["current_weight"], inputs["target_weight"]
+    if current_weight <= target_weight:
+        st.error("Current weight must be higher than target fight weight.")
+        return
+
+    carb_multiplier, training_calories = WEEK1_TRAINING_LEVELS[inputs["training_level"]]
+    fight_camp_length = camp["fight_camp_length"]
+    water_cut_kg = (inputs["water_cut_percentage"] / 100) * target_weight
+    fight_week_start_weight = target_weight + (2 * water_cut_kg)
+    fat_loss_goal = current_weight - fight_week_start_weight
+    fat_loss_per_week = fat_loss_goal / (fight_camp_length - 1)
+
+    timer.section("render")
+    if inputs["fight_week_mode"]:
+        render_guide_fight_week(variant)
+        return
+
+    from .plan_cache import normalize_key, plan_cache
+
+    with st.container():
+        st.header("Daily Nutrition Targets - Week 1")
+        week1_key = normalize_key(
+            "week1", inputs["age"], inputs["sex"], inputs["height"], current_weight, target_weight,
+            inputs["fight_date"], inputs["water_cut_percentage"], inputs["training_level"], camp["today"],
+        )
+
+        def week1_days():
+            from .daily_plan import DailyPlanBatch, plan_daily_batch
+
+            # The levels add training kcal to BMR; plan with the maintenance factor that amounts to
+            bmr = estimate_bmr(current_weight, inputs["height"], inputs["age"], inputs["sex"])
+            daily = plan_daily_batch(
+                [inputs["age"]], [inputs["sex"]], [inputs["height"]], [current_weight], [target_weight],
+                [inputs["fight_date"]], [inputs["water_cut_percentage"]], [(bmr + training_calories) / bmr],
+                today=camp["today"],
+            )
+            week1 = DailyPlanBatch(*(column[:7] for column in daily))
+            return week1._replace(carbs_g=(carb_multiplier * week1.weight).round().astype(week1.carbs_g.dtype))
+
+        def week1_flat():
+            # Camps of MIN_CAMP_DAYS or less get no daily plan; repeat one camp-wide target instead
+            import pandas as pd
+
+            from .energy_balance import camp_intake
+
+            bmr = estimate_bmr(current_weight, inputs["height"], inputs["age"], inputs["sex"])
+            target_calories = camp_intake(current_weight, fight_week_start_weight, (fight_camp_length - 1) * 7,
+                                          bmr, bmr + training_calories, inputs["height"], inputs["age"], inputs["sex"])
+            return pd.DataFrame({
+                "Day": [f"Day {i}" for i in range(1, 8)],
+                "Calories (kcal)": [round(target_calories)] * 7,
+                "Protein (g)": [round(2.0 * current_weight)] * 7,
+                "Fat (g)": [round(1.0 * current_weight)] * 7,
+                "Carbs (g)": [round(carb_multiplier * current_weight)] * 7,
+                "Fibre (g)": [30] * 7,
+                "Salt (g)": ["3-5"] * 7
+            })
+
+        week1 = plan_cache.get_or_compute(week1_key, week1_days)
+        if len(week1.date):
+            from .daily_plan import daily_frame
+
+            st.subheader(f"Goal Weight Loss for Week 1: ~{current_weight - week1.weight[-1]:.2f} kg")
+            st.dataframe(daily_frame(week1).set_index("Date"))
+        else:
+            st.subheader(f"Goal Weight Loss for Week 1: ~{fat_loss_per_week:.2f} kg")
+            st.dataframe(plan_cache.get_or_compute(("flat",) + week1_key, week1_flat).set_index("Day"))
+
+    with st.container():
+        render_weekly_goals(current_weight, fat_loss_per_week, fight_camp_length, fight_week_start_weight)
+
+
+def weekly_plan(variant, inputs, camp, timer):
+    """app_5.py: the vectorized weekly plan, PDF export and daily pager."""
+    if camp["days_left"] <= MIN_CAMP_DAYS:
+        st.error("Fight date must be at least 4 weeks in the future.")
+        return
+    if camp["fight_camp_length"] - 1 > MAX_CAMP_WEEKS:
+        st.error(f"Plans cover at most {MAX_CAMP_WEEKS} weeks before fight week; pick a fight date within a year.")
+        return
+    if inputs["current_weight"] <= inputs["target_weight"]:
+        st.error("Current weight must be higher than fight weight.")
+        return
+
+    from .plan_cache import normalize_key, plan_cache
+    from .planner import plan_weekly_batch
+
+    water_cut_kg = (inputs["water_cut_percentage"] / 100) * inputs["target_weight"]
+    fight_week_start_weight = inputs["target_weight"] + (2 * water_cut_kg)
+
+    timer.section("table build")
+    athlete = {field: inputs[field] for field in (
+        "age", "sex", "height", "current_weight", "target_weight", "fight_date",
+        "water_cut_percentage", "training_level",
+    )}
+    # The cache holds the compact (plan batch, logged weights) pair; tables are formatted at render time
+    plan = None
+    history = [entry for entry in weigh_in_history(inputs.get("athlete"), camp["today"]) if entry[0] < camp["today"]]
+    if history:
+        # The camp began at its first weigh-in: keep past weeks and re-plan the rest from the
+        # weight typed in today, which stands in for (or corrects) today's weigh-in
+        history.append((camp["today"], inputs["current_weight"]))
+        from .replan import replanned_weekly
+
+        replan_fields = {field: value for field, value in athlete.items() if field != "current_weight"}
+        plan_key = normalize_key("replan", *replan_fields.values(), *history)
+        plan = plan_cache.get_or_compute(plan_key, lambda: replanned_weekly(history, **replan_fields))
+    if plan is None:
+        plan_key = normalize_key("weekly", *athlete.values(), camp["today"])
+        plan = plan_cache.get_or_compute(plan_key, lambda: (plan_weekly_batch(
+            **{field: [value] for field, value in athlete.items()}, today=camp["today"]), None))
+
+    timer.section("render")
+    plan_views(plan_key, athlete, fight_week_start_weight, plan, camp["today"])
+
+
+# Each view reruns as a fragment: switching views or paging the daily table
+# only reruns this function, not the inputs, header or plan calculation
+@st.fragment
+def plan_views(plan_key, athlete, fight_week_start_weight, plan, today):
+    if st.toggle("Activate Fight Week Mode", key="fight_week_mode"):
+        st.header("Fight Week Plan")
+        st.markdown(f"### Fight Week Start Date: {athlete['fight_date'] - timedelta(days=7):%d %b %Y}")
+        st.markdown(f"### Fight Week Start Weight: ~{fight_week_start_weight:.1f} kg")
+        st.markdown("---")
+        render_fight_week(FIGHT_WEEK_PROTOCOL)
+    else:
+        weekly_view(plan_key, athlete, plan, today)
+        meal_view(plan[0])
+        if st.toggle("Explore what-if scenarios", key="scenario_mode"):
+            scenario_view(athlete, today)
+
+
+def weekly_view(plan_key, athlete, plan, today):
+    from .daily_plan import DAYS_PER_PAGE, daily_frame, expand_weekly
+    from .energy_balance import project_plan
+    from .exports import EXPORT_FORMATS, deferred, plan_calendar, plan_pdf, weekly_csv
+    from .plan_cache import plan_cache
+    from .planner import weekly_frame
+
+    batch, logged_weight = plan
+    st.header("Weekly Nutrition & Weight Targets")
+    st.dataframe(weekly_frame(batch, logged_weight).set_index("Week"))
+    projected = plan_cache.get_or_compute(("projection",) + plan_key, lambda: project_plan(
+        batch, [athlete["age"]], [athlete["sex"]], [athlete["height"]], [athlete["training_level"]]))
+    st.caption(f"Calories come from a day-by-day model that accounts for your metabolism slowing as you lose "
+               f"weight; eating them projects ~{projected[-1]:.1f} kg by fight week.")
+
+    # Each file is built on its button's first click, then served from plan_cache
+    downloads = [
+        ("Download PDF", "pdf", lambda: plan_pdf(athlete, batch)),
+        ("Download CSV", "csv", lambda: weekly_csv(batch, logged_weight)),
+        ("Add to Calendar (.ics)", "ics", lambda: plan_calendar(batch, athlete["fight_date"], plan_key)),
+    ]
+    for column, (label, export_format, build) in zip(st.columns(len(downloads)), downloads):
+        mime, file_name = EXPORT_FORMATS[export_format]
+        column.download_button(label=label, data=deferred(export_format, plan_key, build),
+                               file_name=file_name, mime=mime)
+
+    st.header("Daily Targets")
+    # Expanded from the plan above, so a re-planned camp's days start where its weeks do
+    plan_start = batch.date[0].astype(object)
+    body = {field: [value] for field, value in athlete.items() if field != "current_weight"}
+    daily_plan = plan_cache.get_or_compute(("daily",) + plan_key,
+                                           lambda: expand_weekly(batch, **body, today=plan_start))
+    total_days = len(daily_plan.date)
+    page_count = -(-total_days // DAYS_PER_PAGE)
+    today_page = min(max((today - plan_start).days // DAYS_PER_PAGE + 1, 1), page_count)
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=today_page, step=1)
+    first_day = (page - 1) * DAYS_PER_PAGE
+    last_day = min(first_day + DAYS_PER_PAGE, total_days)
+    st.caption(f"Days {first_day + 1}-{last_day} of {total_days}")
+    st.dataframe(daily_frame(daily_plan, first_day, last_day).set_index("Date"))
+
+
+def meal_view(batch):
+    from .meal_plan import DAYS_PER_WEEK, load_foods, meal_frame, plan_meals
+
+    st.header("Meal Plan")
+    exclude = st.multiselect("Foods to leave out", load_foods().names)
+    week_column, day_column = st.columns(2)
+    week = week_column.selectbox("Week", batch.week.tolist())
+    day = day_column.selectbox("Day", range(1, DAYS_PER_WEEK + 1))
+    try:
+        weeks = plan_meals(batch.protein_g, batch.fat_g, batch.carbs_g, exclude=exclude)
+    except ValueError as error:
+        st.error(str(error))
+        return
+    meal_day = weeks[week - 1][day - 1]
+    st.dataframe(meal_frame(meal_day).set_index("Meal"))
+    totals = dict(meal_day.totals)
+    st.caption(f"Day total: {totals['kcal']:.0f} kcal | Protein {totals['protein_g']:.0f} g | "
+               f"Fat {totals['fat_g']:.0f} g | Carbs {totals['carbs_g']:.0f} g | "
+               f"Fibre {totals['fibre_g']:.0f} g | Salt {totals['salt_g']:.1f} g")
+    if not meal_day.met:
+        st.warning("The foods left can't match this week's targets closely; try leaving fewer out.")
+
+
+def scenario_view(athlete, today):
+    """Heatmaps of fight date x water cut for a chosen target weight and training level."""
+    import altair as alt
+    import numpy as np
+
+    from .planner import training_label
+    from .scenarios import heatmap_frame, sweep
+
+    st.header("What-if Scenarios")
+    target_weights = np.round(athlete["target_weight"] + np.arange(-2.0, 2.5, 0.5), 1)
+    fight_dates = np.datetime64(athlete["fight_date"], "D") + 7 * np.arange(-4, 5)
+    # A factor measured from session files is compared with every preset level
+    levels = list(TRAINING_LEVELS)
+    if not isinstance(athlete["training_level"], str):
+        levels.insert(0, athlete["training_level"])
+    grid = sweep(
+        athlete["age"], athlete["sex"], athlete["height"], athlete["current_weight"], target_weights,
+        fight_dates, np.arange(0.0, 5.5, 0.5),
+        [TRAINING_LEVELS[level][1] if isinstance(level, str) else level for level in levels], today=today,
+    )
+    level_column, target_column = st.columns(2)
+    level = level_column.selectbox("Training Intensity", levels, index=levels.index(athlete["training_level"]),
+                                   format_func=training_label)
+    target = target_column.select_slider("Target Fight Weight (kg)", options=target_weights.tolist(),
+                                         value=target_weights[len(target_weights) // 2].item())
+    frame = heatmap_frame(grid, target_weights.tolist().index(target), levels.index(level))
+    for title, measure in (("Required Daily Deficit (final camp week)", "Daily Deficit (kcal)"),
+                           ("Average Weekly Loss", "Weekly Loss (kg)")):
+        st.subheader(title)
+        st.altair_chart(alt.Chart(frame).mark_rect().encode(
+            x=alt.X("Water Cut (%):O"),
+            y=alt.Y("Fight Date:O", sort=None),
+            color=alt.Color(f"{measure}:Q", scale=alt.Scale(scheme="orangered")),
+            tooltip=list(frame.columns),
+        ), width="stretch")
+
+
+PLANS = {"overview": overview_plan, "hours": hours_plan, "week1": week1_plan, "weekly": weekly_plan}
+
+
+# --- Page ---
+def run(variant_name):
+    """Render one rerun of the page for the named variant (see fight_camp.variants)."""
+    variant = get_variant(variant_name)
+    timer = RerunTimer(f"{variant_name}.py")
+
+    timer.section("header")
+    if variant["page_config"]:
+        st.set_page_config(page_title=TITLE, layout="centered")
+    render_header(variant)
+
+    timer.section("inputs")
+    inputs = sidebar_inputs(variant)
+
+    timer.section("calculations")
+    today = datetime.today().date()
+    days_left = (inputs["fight_date"] - today).days
+    fight_camp_length = camp_length_weeks(days_left)
+    camp = {
+        "today": today,
+        "days_left": days_left,
+        "fight_camp_length": fight_camp_length,
+        "price": subscription_price(variant, fight_camp_length),
+    }
+
+    if inputs.get("athlete"):
+        weigh_in_panel(inputs["athlete"], today)
+
+    st.sidebar.subheader("Your Subscription Plan")
+    st.sidebar.write(f"Fight Camp Length: **{fight_camp_length} weeks**")
+    st.sidebar.write(f"Total Subscription Cost: **£{camp['price']}**")
+
+    PLANS[variant["plan"]](variant, inputs, camp, timer)
+
+    timer.section("footer")
+    if variant["cache_panel"]:
+        from .plan_cache import plan_cache
+
+        with st.sidebar.expander("Plan Cache"):
+            cache_stats = plan_cache.stats()
+            st.write(f"Hits: **{cache_stats['hits']}** | Misses: **{cache_stats['misses']}**")
+            st.write(f"Entries: {cache_stats['entries']} ({cache_stats['bytes'] / 1024:.0f} KB)")
+    if variant["footer"]:
+        st.caption(variant["footer"])
+    if variant["disclaimer"]:
+        st.markdown("---")
+        with st.expander("Disclaimer"):
+            st.write(DISCLAIMER)
+
+    timer.finish(panel=st.sidebar)
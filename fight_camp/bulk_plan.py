@@ -0,0 +1,220 @@
+"""Headless bulk planning: roster CSV/JSONL in, weekly plan rows out.
+
+    python -m fight_camp.bulk_plan roster.csv plans.parquet --chunk-size 50000 --processes 4
+    python -m fight_camp.bulk_plan roster.csv archive/ --format archive
+
+The roster is read in chunks and each chunk is planned with one vectorized
+call and written out before the next is read, so memory is bounded by the
+chunk size (times the number of chunks in flight when sharding across
+processes) rather than by the roster size. --daily writes one row per
+athlete-day instead of one per week. --format archive appends the weekly
+plans to a partitioned plan archive directory (see fight_camp.plan_archive).
+"""
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .daily_plan import plan_daily_batch
+from .planner import FIBRE_G, ROSTER_FIELDS, SALT_G, plan_weekly_batch
+
+ID_COLUMN = "athlete_id"
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet", "archive")
+
+
+# --- Reading ---
+def read_roster_chunks(path, chunk_size):
+    """Yield roster DataFrames of at most `chunk_size` rows."""
+    if Path(path).suffix.lower() in (".jsonl", ".ndjson", ".json"):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_size, convert_dates=False)
+    else:
+        reader = pd.read_csv(path, chunksize=chunk_size)
+    offset = 0
+    with reader:
+        for chunk in reader:
+            if ID_COLUMN not in chunk:
+                chunk[ID_COLUMN] = np.arange(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+
+# --- Planning ---
+def _chunk_inputs(chunk):
+    inputs = {field: chunk[field].to_numpy() for field in ROSTER_FIELDS}
+    inputs["fight_date"] = pd.to_datetime(chunk["fight_date"]).to_numpy().astype("datetime64[D]")
+    return inputs
+
+
+def weekly_columns(batch, ids):
+    """Output columns for a WeeklyPlanBatch, with `ids` labelling the input athletes."""
+    return {
+        ID_COLUMN: ids[batch.athlete],
+        "week": batch.week,
+        "date": batch.date,
+        "target_weight_kg": np.round(batch.weight, 1),
+        "calories": batch.calories,
+        "protein_g": batch.protein_g,
+        "fat_g": batch.fat_g,
+        "carbs_g": batch.carbs_g,
+        "fibre_g": np.full(batch.week.size, FIBRE_G),
+        "salt_g": np.full(batch.week.size, SALT_G),
+    }
+
+
+def daily_columns(plan, ids):
+    """Output columns for a DailyPlanBatch, with `ids` labelling the input athletes."""
+    return {
+        ID_COLUMN: ids[plan.athlete],
+        "date": plan.date,
+        "days_out": plan.days_out,
+        "target_weight_kg": np.round(plan.weight, 1),
+        "calories": plan.calories,
+        "protein_g": plan.protein_g,
+        "fat_g": plan.fat_g,
+        "carbs_g": plan.carbs_g,
+        "fibre_g": plan.fibre_g,
+        "salt_min_g": plan.salt_min_g,
+        "salt_max_g": plan.salt_max_g,
+        "water_ml": plan.water_ml,
+    }
+
+
+def plan_chunk(chunk, today, daily=False, archive=False):
+    """Plan one roster chunk; returns (column dict, athletes in chunk, invalid count).
+
+    `archive` returns fight_camp.plan_archive columns instead of the export columns.
+    """
+    inputs = _chunk_inputs(chunk)
+    ids = chunk[ID_COLUMN].to_numpy()
+    if daily:
+        plan = plan_daily_batch(**inputs, today=today)
+        invalid = len(chunk) - np.unique(plan.athlete).size
+        return daily_columns(plan, ids), len(chunk), invalid
+
+    batch = plan_weekly_batch(**inputs, today=today)
+    if archive:
+        from .plan_archive import archive_columns
+
+        return archive_columns(batch, ids, inputs), len(chunk), int((~batch.valid).sum())
+    return weekly_columns(batch, ids), len(chunk), int((~batch.valid).sum())
+
+
+def _ordered_results(chunks, today, processes, daily, archive=False):
+    """Plan chunks in order, keeping at most 2 * processes chunks in flight."""
+    if not processes or processes <= 1:
+        for chunk in chunks:
+            yield plan_chunk(chunk, today, daily, archive)
+        return
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(plan_chunk, chunk, today, daily, archive))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# --- Writing ---
+class PlanWriter:
+    """Append plan column chunks to a CSV, JSONL or Parquet file, or a plan archive directory."""
+
+    def __init__(self, path, output_format):
+        self.path = path
+        self.output_format = output_format
+        self._parquet = None
+        self._started = False
+        if output_format == "archive":
+            from .plan_archive import PlanArchive
+
+            self._archive = PlanArchive(path)
+
+    def write(self, columns):
+        if self.output_format == "archive":
+            self._archive.append(columns)
+            return
+        if self.output_format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.table(columns)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+            return
+        frame = pd.DataFrame(columns)
+        mode = "a" if self._started else "w"
+        if self.output_format == "csv":
+            frame.to_csv(self.path, mode=mode, header=not self._started, index=False)
+        else:
+            frame["date"] = frame["date"].dt.strftime("%Y-%m-%d")
+            frame.to_json(self.path, mode=mode, orient="records", lines=True)
+        self._started = True
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run(roster_path, output_path, output_format=None, chunk_size=50_000, processes=None,
+        today=None, progress=sys.stderr, daily=False):
+    """Plan a whole roster file, streaming rows to `output_path`; returns a stats dict."""
+    if output_format is None:
+        output_format = Path(output_path).suffix.lstrip(".").lower() or "csv"
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format!r} (use one of {OUTPUT_FORMATS})")
+    archive = output_format == "archive"
+    if archive and daily:
+        raise ValueError("The plan archive holds weekly plans; drop --daily to archive")
+    if today is None:
+        today = datetime.today().date()
+
+    stats = {"athletes": 0, "invalid": 0, "rows": 0}
+    started = time.perf_counter()
+    chunks = read_roster_chunks(roster_path, chunk_size)
+    with PlanWriter(output_path, output_format) as writer:
+        for columns, athletes, invalid in _ordered_results(chunks, today, processes, daily, archive):
+            writer.write(columns)
+            stats["athletes"] += athletes
+            stats["invalid"] += invalid
+            stats["rows"] += len(columns["date"])
+            if progress is not None:
+                elapsed = time.perf_counter() - started
+                print(f"{stats['athletes']:,} athletes, {stats['rows']:,} rows "
+                      f"({stats['rows'] / elapsed:,.0f} rows/s)", file=progress)
+    stats["seconds"] = time.perf_counter() - started
+    stats["rows_per_second"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate weekly fight camp plans for a whole roster.")
+    parser.add_argument("roster", help="CSV or JSONL roster with columns: " + ", ".join(ROSTER_FIELDS))
+    parser.add_argument("output", help="output file (.csv, .jsonl or .parquet), or directory with --format archive")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, help="output format (default: from extension)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="roster rows per chunk")
+    parser.add_argument("--processes", type=int, default=None, help="plan chunks in N worker processes")
+    parser.add_argument("--daily", action="store_true", help="one row per day instead of per week")
+    parser.add_argument("--quiet", action="store_true", help="only print the final summary")
+    args = parser.parse_args(argv)
+
+    stats = run(args.roster, args.output, args.format, args.chunk_size, args.processes,
+                progress=None if args.quiet else sys.stderr, daily=args.daily)
+    print(f"Planned {stats['athletes']:,} athletes ({stats['invalid']:,} skipped) -> "
+          f"{stats['rows']:,} rows in {stats['seconds']:.1f}s ({stats['rows_per_second']:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
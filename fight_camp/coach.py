@@ -0,0 +1,165 @@
+"""Roster-wide coach board: every athlete's current week against their plan.
+
+RosterPlan plans a whole roster once (it is cached per roster file and camp
+start) and precomputes what never changes between reruns: each athlete's
+weight class and the sort orders by fight date, athlete and class.
+CoachBoard adds the latest weigh-ins, works out each athlete's deviation from
+the weight their plan expected on that day, and answers sorted, filtered
+queries as row positions, so the page only formats the window it shows.
+"""
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from .constants import WEIGHT_CLASSES
+from .planner import plan_weekly_batch
+
+PAGE_SIZE = 50
+ON_PLAN_KG = 0.5  # within this of the plan counts as on plan
+WEIGHT_CLASS_NAMES = list(WEIGHT_CLASSES) + ["Open"]  # code -> name; "Open" is above every limit
+STATUSES = ["Behind", "On plan", "Ahead", "No weigh-in"]
+
+BoardQuery = namedtuple("BoardQuery", ["sort", "descending", "weight_classes", "statuses"])
+BoardQuery.__new__.__defaults__ = ("fight_date", False, (), ())
+BoardQuery.__doc__ = """A board ordering and filter; empty weight_classes/statuses mean all."""
+
+
+def weight_class_codes(target_weight):
+    """Index into WEIGHT_CLASS_NAMES of the class each fight weight falls in."""
+    return np.searchsorted(np.array(list(WEIGHT_CLASSES.values())), np.asarray(target_weight, dtype=float))
+
+
+class RosterPlan:
+    """A roster's weekly plans from one camp start, with its static sort orders.
+
+    `ids` labels the roster rows and `inputs` holds the plan_weekly_batch
+    arrays (see bulk_plan). Athletes whose plan is invalid are dropped;
+    `skipped` counts them. Shared between sessions, so read-only.
+    """
+
+    def __init__(self, ids, inputs, start):
+        self.start = np.datetime64(start, "D")
+        batch = plan_weekly_batch(**inputs, today=start)
+        valid = batch.valid
+        self.skipped = int((~valid).sum())
+        self.ids = np.asarray(ids).astype(str)[valid]
+        self.fight_date = np.asarray(inputs["fight_date"], dtype="datetime64[D]")[valid]
+        self.target_weight = np.asarray(inputs["target_weight"], dtype=float)[valid]
+        self.start_weight = np.asarray(inputs["current_weight"], dtype=float)[valid]
+        self.weight_class = weight_class_codes(self.target_weight)
+
+        # Rows are grouped by athlete; keep the valid athletes' first row and week count
+        rows_per_athlete = np.bincount(batch.athlete, minlength=len(valid))
+        self.first_row = (np.cumsum(rows_per_athlete) - rows_per_athlete)[valid]
+        self.total_weeks = rows_per_athlete[valid]
+        self.batch = batch
+
+        self.orders = {
+            "fight_date": np.argsort(self.fight_date, kind="stable"),
+            "athlete": np.argsort(self.ids, kind="stable"),
+            "weight_class": np.lexsort((self.fight_date, self.weight_class)),
+        }
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def nbytes(self):
+        """Bytes held, for PlanCache's memory ceiling."""
+        arrays = [self.ids, self.fight_date, self.target_weight, self.start_weight, self.weight_class,
+                  self.first_row, self.total_weeks, *self.batch, *self.orders.values()]
+        return sum(array.nbytes for array in arrays)
+
+    def planned_weight(self, day):
+        """The weight each athlete's plan expects on `day` (one date per athlete), losing each week's share daily."""
+        days_in = (np.asarray(day, dtype="datetime64[D]") - self.start).astype(np.int64)
+        week = np.clip(days_in // 7, 0, self.total_weeks - 1)
+        row = self.first_row + week
+        done = np.clip((days_in - 7 * week + 1) / 7, 0, 1)  # share of that week's loss already expected
+        return self.batch.weight[row] + self.batch.loss[row] * (1 - done)
+
+
+class CoachBoard:
+    """A RosterPlan joined with the latest weigh-ins, answering paged queries."""
+
+    def __init__(self, roster, latest, today=None):
+        if today is None:
+            today = datetime.today().date()
+        self.roster = roster
+        today = np.datetime64(today, "D")
+
+        # Current week row: the week holding today, or the last planned week once fight week starts
+        week = np.clip((today - roster.start).astype(np.int64) // 7, 0, roster.total_weeks - 1)
+        self.row = roster.first_row + week
+
+        # latest: columns from WeighInStore.latest_by_athlete, matched to roster IDs
+        self.latest_weight = np.full(len(roster), np.nan)
+        self.latest_date = np.full(len(roster), np.datetime64("NaT"), dtype="datetime64[D]")
+        if len(latest["athlete"]):
+            logged_ids = np.asarray(latest["athlete"], dtype=str)
+            position = np.searchsorted(logged_ids, roster.ids)  # latest_by_athlete is sorted by athlete
+            found = logged_ids[np.minimum(position, len(logged_ids) - 1)] == roster.ids
+            self.latest_weight[found] = np.asarray(latest["weight_kg"], dtype=float)[position[found]]
+            self.latest_date[found] = np.asarray(latest["date"], dtype="datetime64[D]")[position[found]]
+
+        logged = ~np.isnan(self.latest_weight)
+        self.deviation = np.full(len(roster), np.nan)
+        self.deviation[logged] = self.latest_weight[logged] - roster.planned_weight(self.latest_date)[logged]
+        self.status = np.select([~logged, self.deviation > ON_PLAN_KG, self.deviation < -ON_PLAN_KG],
+                                [STATUSES.index("No weigh-in"), STATUSES.index("Behind"), STATUSES.index("Ahead")],
+                                STATUSES.index("On plan"))
+        self.orders = dict(roster.orders)
+        self.orders["deviation"] = np.argsort(np.where(logged, self.deviation, np.inf), kind="stable")
+        # Leading entries of each order that have a value; the rest (no weigh-in) stay last either way round
+        self.sorted_counts = {key: len(roster) for key in self.orders}
+        self.sorted_counts["deviation"] = int(logged.sum())
+        self._queries = {}
+
+    def counts(self):
+        """{status: athletes} over the whole board."""
+        return dict(zip(STATUSES, np.bincount(self.status, minlength=len(STATUSES)).tolist()))
+
+    def query(self, query=BoardQuery()):
+        """Board positions matching `query`, in display order; repeated queries are memoized."""
+        if query not in self._queries:
+            order = self.orders[query.sort]
+            if query.descending:
+                count = self.sorted_counts[query.sort]
+                order = np.concatenate([order[:count][::-1], order[count:]])
+            keep = np.ones(len(order), dtype=bool)
+            if query.weight_classes:
+                codes = [WEIGHT_CLASS_NAMES.index(name) for name in query.weight_classes]
+                keep &= np.isin(self.roster.weight_class[order], codes)
+            if query.statuses:
+                keep &= np.isin(self.status[order], [STATUSES.index(name) for name in query.statuses])
+            self._queries[query] = order[keep]
+        return self._queries[query]
+
+    def page_frame(self, positions, page, page_size=PAGE_SIZE):
+        """The 1-based `page` of `positions` as the displayed table; only those rows are formatted."""
+        import pandas as pd
+
+        window = positions[(page - 1) * page_size:page * page_size]
+        roster, batch, row = self.roster, self.roster.batch, self.row[window]
+        return pd.DataFrame({
+            "Athlete": roster.ids[window],
+            "Weight Class": np.array(WEIGHT_CLASS_NAMES)[roster.weight_class[window]],
+            "Fight Date": pd.to_datetime(roster.fight_date[window]).strftime("%d %b %Y"),
+            "Week": batch.week[row],
+            "Target Weight (kg)": np.round(batch.weight[row], 1),
+            "Calories": batch.calories[row],
+            "Latest Weigh-in (kg)": np.round(self.latest_weight[window], 1),
+            "Deviation (kg)": np.round(self.deviation[window], 1),
+            "Status": np.array(STATUSES)[self.status[window]],
+        })
+
+
+def load_roster(path):
+    """(ids, plan inputs) for a roster CSV/JSONL file, as read by bulk_plan."""
+    import pandas as pd
+
+    from .bulk_plan import ID_COLUMN, _chunk_inputs, read_roster_chunks
+
+    roster = pd.concat(read_roster_chunks(path, 100_000), ignore_index=True)
+    return roster[ID_COLUMN].to_numpy(), _chunk_inputs(roster)
@@ -0,0 +1,167 @@
+"""The coach board page (app_coach.py): the whole roster on one paged table.
+
+Sorting, filtering and paging happen on the server (fight_camp.coach), and
+the table only ever receives the PAGE_SIZE rows on screen. The table controls
+rerun as a fragment, so paging doesn't re-read weigh-ins or re-plan.
+
+Rosters uploaded in the sidebar are planned in the background
+(fight_camp.roster_jobs); their progress polls in its own fragment, and the
+jobs are read back from disk, so a refresh shows them again.
+
+The board only opens rosters it lists itself: the files in FCN_ROSTER_DIR
+and the rosters of finished imports. Visitors pick one; they never type a path.
+"""
+import os
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+
+DEFAULT_ROSTER_PATH = Path(os.environ.get(
+    "FCN_ROSTER", Path(__file__).resolve().parent.parent / "data" / "roster.csv"))
+ROSTER_DIR = Path(os.environ.get("FCN_ROSTER_DIR", DEFAULT_ROSTER_PATH.parent))
+ROSTER_SUFFIXES = (".csv", ".jsonl", ".ndjson")
+SORT_LABELS = {
+    "Fight date": "fight_date",
+    "Athlete": "athlete",
+    "Weight class": "weight_class",
+    "Deviation from plan": "deviation",
+}
+JOB_POLL_SECONDS = 1
+JOBS_SHOWN = 5
+
+
+def run():
+    """Render one rerun of the coach board."""
+    st.set_page_config(page_title="Coach Board", layout="wide")
+    st.title("Coach Board")
+
+    roster_imports()
+    choices = roster_choices()
+    if st.session_state.get("roster_file") not in choices:  # "Show on board" can also set it
+        st.session_state["roster_file"] = next(iter(choices), None)
+    roster_file = st.sidebar.selectbox("Roster", list(choices), format_func=choices.get, key="roster_file")
+    today = datetime.today().date()
+    start = st.sidebar.date_input("Camp start", value=today, max_value=today)
+    if roster_file is None:
+        st.info(f"No rosters yet. Put a roster CSV or JSONL (the same columns as fight_camp.bulk_plan) "
+                f"in {ROSTER_DIR}, or import one in the sidebar.")
+        return
+    path = Path(roster_file)
+
+    from .coach import STATUSES, CoachBoard, RosterPlan, load_roster
+    from .plan_cache import plan_cache
+    from .weigh_ins import get_store
+
+    # Plans only change with the roster file or camp start; weigh-ins are re-read every run
+    roster = plan_cache.get_or_compute(("coach", str(path), path.stat().st_mtime_ns, start),
+                                       lambda: RosterPlan(*load_roster(path), start))
+    board = CoachBoard(roster, get_store().latest_by_athlete(since=start), today)
+
+    counts = board.counts()
+    for column, status in zip(st.columns(len(STATUSES)), STATUSES):
+        column.metric(status, f"{counts[status]:,}")
+    if roster.skipped:
+        st.caption(f"{roster.skipped:,} athletes left out: fight too soon or already at weight.")
+    board_table(board)
+
+
+def roster_choices():
+    """{path: label} for every roster the board may open: FCN_ROSTER_DIR files, then finished imports."""
+    from .roster_jobs import get_queue
+
+    paths = [DEFAULT_ROSTER_PATH] if DEFAULT_ROSTER_PATH.is_file() else []
+    if ROSTER_DIR.is_dir():
+        paths += sorted(path for path in ROSTER_DIR.iterdir()
+                        if path.suffix.lower() in ROSTER_SUFFIXES and path.is_file())
+    choices = {str(path): path.name for path in paths}
+    for job in get_queue().jobs():
+        status = job.status()
+        if status["state"] == "finished":
+            choices[str(job.roster_path)] = f"Import: {status['name']}"
+    return choices
+
+
+@st.fragment
+def board_table(board):
+    from .coach import PAGE_SIZE, STATUSES, WEIGHT_CLASS_NAMES, BoardQuery
+
+    sort_column, order_column, class_column, status_column = st.columns([2, 1, 3, 3])
+    sort = sort_column.selectbox("Sort by", list(SORT_LABELS))
+    descending = order_column.toggle("Descending")
+    weight_classes = class_column.multiselect("Weight classes", WEIGHT_CLASS_NAMES)
+    statuses = status_column.multiselect("Status", STATUSES)
+    positions = board.query(BoardQuery(SORT_LABELS[sort], descending, tuple(weight_classes), tuple(statuses)))
+    if not len(positions):
+        st.info("No athletes match these filters.")
+        return
+
+    page_count = -(-len(positions) // PAGE_SIZE)
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    first = (page - 1) * PAGE_SIZE
+    st.dataframe(board.page_frame(positions, page).set_index("Athlete"), width="stretch")
+    st.caption(f"Athletes {first + 1:,}-{min(first + PAGE_SIZE, len(positions)):,} of {len(positions):,}")
+
+
+# --- Roster Imports ---
+def roster_imports():
+    """Sidebar upload plus a panel per recent import job."""
+    from .roster_jobs import ACTIVE_STATES, get_queue
+
+    queue = get_queue()
+    upload = st.sidebar.file_uploader("Import a roster", type=["csv", "jsonl", "ndjson"])
+    # The same upload stays attached across reruns; submit it once per file
+    if upload is not None and st.session_state.get("submitted_upload") != upload.file_id:
+        queue.submit(upload.getvalue(), upload.name)
+        st.session_state["submitted_upload"] = upload.file_id
+
+    jobs = queue.jobs()[:JOBS_SHOWN]
+    if not jobs:
+        return
+    with st.expander("Roster imports", expanded=any(job.status()["state"] in ACTIVE_STATES for job in jobs)):
+        for job in jobs:
+            if job.status()["state"] in ACTIVE_STATES:
+                job_progress(job)
+            else:
+                job_summary(job)
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def job_progress(job):
+    """A running job's progress and first rows, refreshed until it stops."""
+    from .roster_jobs import ACTIVE_STATES, get_queue
+
+    status = job.status()
+    if status["state"] not in ACTIVE_STATES:
+        st.rerun()  # finished: redraw the panel as a summary, which stops the polling
+    done = min(status["athletes"] / status["total_athletes"], 1.0) if status["total_athletes"] else 0.0
+    text_column, button_column = st.columns([4, 1])
+    text_column.progress(done, text=f"{status['name']}: {status['state']}, "
+                                    f"{status['athletes']:,} of ~{status['total_athletes']:,} athletes planned")
+    button_column.button("Cancel", key=f"cancel-{job.id}", on_click=get_queue().cancel, args=(job,))
+    preview = job.preview()
+    if preview is not None:
+        st.dataframe(preview, width="stretch", hide_index=True)
+
+
+def job_summary(job):
+    """A stopped job's outcome, with its plans to download and its roster to show on the board."""
+    status = job.status()
+    line = (f"**{status['name']}**: {status['state']}, {status['athletes']:,} athletes "
+            f"({status['invalid']:,} not planned), {status['rows']:,} weekly rows")
+    if status["error"]:
+        line += f" - {status['error']}"
+    st.markdown(line)
+    if not status["rows"]:
+        return
+    download_column, board_column = st.columns(2)
+    download_column.download_button("Download plans (CSV)", data=job.output_path.read_bytes,
+                                    file_name=f"{Path(status['name']).stem}_plans.csv", mime="text/csv",
+                                    key=f"download-{job.id}")
+    if status["state"] == "finished":
+        board_column.button("Show on board", key=f"board-{job.id}", on_click=show_on_board,
+                            args=(job.roster_path,))
+
+
+def show_on_board(roster_path):
+    st.session_state["roster_file"] = str(roster_path)
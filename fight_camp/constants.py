@@ -0,0 +1,52 @@
+"""Plain-data planning constants, importable without NumPy or pandas."""
+
+# --- Planning Constants ---
+KCAL_PER_KG = 7700
+WEEKLY_LOSS_GRADIENT = 0.02  # each week loses 2% more than the one before
+MIN_CAMP_DAYS = 28
+MAX_CAMP_WEEKS = 52  # planned weeks; batches are padded to their longest camp, so this bounds their width
+FIBRE_G = 30
+SALT_G = "3-5"
+LOGGED_WEIGHT_COLUMN = "Logged Weight (kg)"  # re-planned tables only (fight_camp.replan)
+
+# Per-athlete inputs, named as in the app_5.py sidebar
+ROSTER_FIELDS = [
+    "age", "sex", "height", "current_weight", "target_weight", "fight_date",
+    "water_cut_percentage", "training_level",
+]
+
+# Weight class -> upper limit in kg (unified MMA rules); a class runs from the previous limit, exclusive
+WEIGHT_CLASSES = {
+    "Strawweight": 52.2,
+    "Flyweight": 56.7,
+    "Bantamweight": 61.2,
+    "Featherweight": 65.8,
+    "Lightweight": 70.3,
+    "Welterweight": 77.1,
+    "Middleweight": 83.9,
+    "Light Heavyweight": 93.0,
+    "Heavyweight": 120.2,
+}
+
+# Training session files fight_camp.sessions reads
+SESSION_FILE_TYPES = ["csv", "tcx", "gpx", "fit"]
+
+# Training level -> (carb multiplier g/kg, maintenance factor over BMR)
+TRAINING_LEVELS = {
+    "Low (<5 hrs)": (2.5, 1.375),
+    "Medium (5-10 hrs)": (2.75, 1.55),
+    "High (>10 hrs)": (3.0, 1.75),
+}
+
+# Fight week protocol: (heading, instruction, expander title, expander text)
+FIGHT_WEEK_PROTOCOL = [
+    ("Carbohydrate Management", "- 5-7 days before weigh-in: Reduce carbs by 50-80g/day.",
+     "Why reduce carbs?", "Depletes glycogen stores and associated water to drop weight."),
+    ("Fibre Management", "- 3 days before weigh-in: Fibre <10g/day.",
+     "Why reduce fibre?", "Minimises undigested bulk in the gut."),
+    ("Salt Management", "- 3 days before weigh-in: Salt 0.5-1g/day.",
+     "Why reduce salt?", "Helps eliminate retained water."),
+    ("Water Loading", "- 4–2 out: 100ml/kg | 1 day out: 15ml/kg | Weigh-in day: minimal sips only.",
+     "Why water load?", "Flushes excess water rapidly."),
+    ("Post Weigh-In", "- 1L electrolyte drink + carb meals every 1-2 hrs.", None, None),
+]
@@ -0,0 +1,158 @@
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from .planner import (
+    FIBRE_G, ROSTER_FIELDS, estimate_bmr, plan_weekly_batch, training_factors,
+)
+
+# --- Fight Week Rules (from the app_5.py fight week protocol) ---
+FIGHT_WEEK_DAYS_OUT = 7
+FIGHT_WEEK_CARB_CUT_G = 65  # midpoint of "reduce carbs by 50-80g/day"
+LOW_FIBRE_G = 10
+SALT_RANGE_G = (3.0, 5.0)
+LOW_SALT_RANGE_G = (0.5, 1.0)
+LOW_FIBRE_SALT_DAYS_OUT = 3
+# Days out -> water loading in ml per kg of that day's projected weight
+WATER_LOADING_ML_PER_KG = {4: 100, 3: 100, 2: 100, 1: 15, 0: 0}
+
+DAYS_PER_PAGE = 14
+
+DailyPlanBatch = namedtuple(
+    "DailyPlanBatch",
+    ["athlete", "date", "days_out", "weight", "calories", "protein_g", "fat_g", "carbs_g",
+     "fibre_g", "salt_min_g", "salt_max_g", "water_ml"],
+)
+DailyPlanBatch.__doc__ = """Flat day-by-day targets, one entry per athlete-day.
+
+Rows are ordered by athlete, then date. `water_ml` is NaN outside the water
+loading days.
+"""
+
+
+def plan_daily_batch(age, sex, height, current_weight, target_weight, fight_date,
+                     water_cut_percentage, training_level, today=None):
+    """Expand the weekly plan to one row per day up to and including fight day.
+
+    See expand_weekly() for how the days are filled in.
+    """
+    if today is None:
+        today = datetime.today().date()
+    weekly = plan_weekly_batch(age, sex, height, current_weight, target_weight, fight_date,
+                               water_cut_percentage, training_level, today=today)
+    return expand_weekly(weekly, age, sex, height, target_weight, fight_date,
+                         water_cut_percentage, training_level, today)
+
+
+def expand_weekly(weekly, age, sex, height, target_weight, fight_date, water_cut_percentage, training_level,
+                  today):
+    """DailyPlanBatch for a WeeklyPlanBatch planned from `today`, such as a re-planned one.
+
+    Camp days eat their week's calories and interpolate its loss linearly, so
+    every day's macros follow that day's projected weight. The days after the
+    last planned week eat maintenance; weight falls from the fight week
+    start weight to the target on fight day. The fight week protocol (carb
+    cut, low fibre and salt, water loading) is applied by days out, whichever
+    of the two phases a day falls in.
+    """
+    today = np.datetime64(today, "D")
+    age = np.asarray(age, dtype=float)
+    height = np.asarray(height, dtype=float)
+    sex = np.asarray(sex)
+    target_weight = np.asarray(target_weight, dtype=float)
+    fight_date = np.asarray(fight_date, dtype="datetime64[D]")
+    fight_week_start_weight = target_weight * (1 + 2 * np.asarray(water_cut_percentage, dtype=float) / 100)
+    carb_multiplier, maintenance_factor = training_factors(training_level)
+    days_left = (fight_date - today).astype(np.int64)
+
+    # --- Camp days: 7 per planned week ---
+    day_in_week = np.tile(np.arange(7), weekly.week.size)
+    week_row = np.repeat(np.arange(weekly.week.size), 7)
+    camp_athlete = weekly.athlete[week_row]
+    camp_loss = weekly.loss[week_row]
+    camp_weight = weekly.weight[week_row] + camp_loss * (6 - day_in_week) / 7
+    camp_date = weekly.date[week_row] + day_in_week.astype("timedelta64[D]")
+    camp_calories = weekly.calories[week_row].astype(float)
+
+    # --- Cut days: the 1-7 days left after the last planned week, plus fight day ---
+    valid_athletes = np.flatnonzero(weekly.valid)
+    camp_days = 7 * np.bincount(weekly.athlete, minlength=weekly.valid.size)
+    fight_days = days_left - camp_days + 1
+    fight_athlete = np.repeat(valid_athletes, fight_days[valid_athletes])
+    starts = np.cumsum(fight_days[valid_athletes]) - fight_days[valid_athletes]
+    offset = np.arange(fight_athlete.size) - np.repeat(starts, fight_days[valid_athletes])
+    fight_days_out = fight_days[fight_athlete] - 1 - offset
+    span = np.maximum(fight_days[fight_athlete] - 1, 1)
+    fight_weight = (target_weight[fight_athlete]
+                    + (fight_week_start_weight - target_weight)[fight_athlete] * fight_days_out / span)
+    fight_date_rows = fight_date[fight_athlete] - fight_days_out.astype("timedelta64[D]")
+
+    # --- Merge and order by athlete, then date ---
+    athlete = np.concatenate([camp_athlete, fight_athlete])
+    order = np.argsort(athlete, kind="stable")
+    athlete = athlete[order]
+    date = np.concatenate([camp_date, fight_date_rows])[order]
+    weight = np.concatenate([camp_weight, fight_weight])[order]
+    fight_bmr = estimate_bmr(fight_weight, height[fight_athlete], age[fight_athlete], sex[fight_athlete])
+    base_calories = np.concatenate([camp_calories, fight_bmr * maintenance_factor[fight_athlete]])[order]
+    days_out = (fight_date[athlete] - date).astype(np.int64)
+
+    carb_cut = np.where(days_out <= FIGHT_WEEK_DAYS_OUT, FIGHT_WEEK_CARB_CUT_G, 0)
+    carbs = np.maximum(carb_multiplier[athlete] * weight - carb_cut, 0)
+    calories = base_calories - carb_cut * 4
+
+    low_fibre_salt = days_out <= LOW_FIBRE_SALT_DAYS_OUT
+    water_ml_per_kg = np.full(days_out.shape, np.nan)
+    for days, ml_per_kg in WATER_LOADING_ML_PER_KG.items():
+        water_ml_per_kg[days_out == days] = ml_per_kg
+
+    return DailyPlanBatch(
+        athlete=athlete.astype(np.int32),
+        date=date,
+        days_out=days_out.astype(np.int16),
+        weight=weight,
+        calories=np.round(calories).astype(np.int16),
+        protein_g=np.round(2.0 * weight).astype(np.int16),
+        fat_g=np.round(1.0 * weight).astype(np.int16),
+        carbs_g=np.round(carbs).astype(np.int16),
+        fibre_g=np.where(low_fibre_salt, LOW_FIBRE_G, FIBRE_G).astype(np.int16),
+        salt_min_g=np.where(low_fibre_salt, LOW_SALT_RANGE_G[0], SALT_RANGE_G[0]),
+        salt_max_g=np.where(low_fibre_salt, LOW_SALT_RANGE_G[1], SALT_RANGE_G[1]),
+        water_ml=np.round(water_ml_per_kg * weight),
+    )
+
+
+def iter_daily_batches(roster, chunk_size=10_000, today=None):
+    """Yield (first athlete index, DailyPlanBatch) for `chunk_size` athletes at a time.
+
+    `roster` maps each of ROSTER_FIELDS to an array. Only one chunk's daily
+    rows exist at once, so a roster-wide daily export stays bounded in memory.
+    """
+    columns = {field: np.asarray(roster[field]) for field in ROSTER_FIELDS}
+    columns["fight_date"] = columns["fight_date"].astype("datetime64[D]")
+    total = len(columns["age"])
+    for start in range(0, total, chunk_size):
+        chunk = {field: values[start:start + chunk_size] for field, values in columns.items()}
+        yield start, plan_daily_batch(**chunk, today=today)
+
+
+def daily_frame(daily, start=0, stop=None):
+    """Format rows [start, stop) of a single athlete's daily plan for display."""
+    import pandas as pd
+
+    rows = slice(start, stop)
+    salt = [f"{low:g}-{high:g}" for low, high in zip(daily.salt_min_g[rows].tolist(),
+                                                     daily.salt_max_g[rows].tolist())]
+    return pd.DataFrame({
+        "Date": pd.to_datetime(daily.date[rows]).strftime("%a %d %b"),
+        "Days Out": daily.days_out[rows],
+        "Target Weight (kg)": [round(w, 1) for w in daily.weight[rows].tolist()],
+        "Calories": daily.calories[rows],
+        "Protein (g)": daily.protein_g[rows],
+        "Fat (g)": daily.fat_g[rows],
+        "Carbs (g)": daily.carbs_g[rows],
+        "Fibre (g)": daily.fibre_g[rows],
+        "Salt (g)": salt,
+        "Water (ml)": pd.array(daily.water_ml[rows], dtype="Int64"),
+    })
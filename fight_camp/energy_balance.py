@@ -0,0 +1,246 @@
+"""Day-by-day energy-balance model of weight change.
+
+The static KCAL_PER_KG rule assumes every kilo lost costs the same and that
+expenditure stays put. simulate() instead integrates a two-compartment body
+(fat mass and lean mass) one day at a time:
+
+- expenditure is the Mifflin-St Jeor BMR of the current weight, with the
+  athlete's real height, times their training level's maintenance factor, so
+  it falls as weight drops;
+- a deficit also lowers expenditure through the thermic effect of food and
+  adaptive thermogenesis, the latter building up over a couple of weeks;
+- each day's energy imbalance is split between fat and lean tissue by Forbes'
+  rule, so leaner athletes lose proportionally more lean mass, and each kg
+  costs that tissue's energy density.
+
+Every athlete advances together, so a 12-week camp for 10,000 athletes is 84
+steps over arrays of 10,000. weekly_intake() runs the model the other way
+round, finding the calories that reach each planned weekly weight; the
+weekly planners take their calorie targets from it. camp_intake() does the
+same for one athlete's flat camp intake in plain floats, so the
+single-athlete pages can use it without importing NumPy.
+"""
+from collections import namedtuple
+
+from .constants import KCAL_PER_KG
+
+FAT_KCAL_PER_KG = 9440
+LEAN_KCAL_PER_KG = 1816
+FORBES_KG = 10.4  # Forbes' constant
+# The same, scaled by the tissue energy densities (Hall 2008)
+FORBES_C = FORBES_KG * LEAN_KCAL_PER_KG / FAT_KCAL_PER_KG
+FORBES_NEWTON_STEPS = 3
+THERMIC_EFFECT = 0.10  # share of an intake change burnt digesting it
+ADAPTIVE_THERMOGENESIS = 0.14  # further drop in expenditure per kcal of deficit, once adapted
+ADAPTATION_DAYS = 14  # time constant of that adaptation
+TRIAL_STEP_KCAL = 100  # gap between the two trial intakes camp_intake() interpolates
+BODY_FAT_RANGE = (5.0, 60.0)  # % clip for the estimated starting body fat
+
+Simulation = namedtuple("Simulation", ["weight", "fat_mass", "lean_mass", "expenditure"])
+Simulation.__doc__ = """Simulated camp; each field has shape (athletes, days + 1).
+
+Column 0 is the starting state and column d the state after d days;
+`expenditure` is the kcal burnt on each day (its last column repeats the one
+before it).
+"""
+
+
+def _deurenberg(bmi, age, male):
+    return 1.2 * bmi + 0.23 * age - 10.8 * male - 5.4
+
+
+def estimate_body_fat(weight, height, age, sex):
+    """Deurenberg body fat % from BMI, age and sex; works on scalars or NumPy arrays."""
+    import numpy as np
+
+    bmi = np.asarray(weight, dtype=float) / (np.asarray(height, dtype=float) / 100) ** 2
+    body_fat = _deurenberg(bmi, np.asarray(age, dtype=float), np.asarray(sex) == "Male")
+    return np.clip(body_fat, *BODY_FAT_RANGE)
+
+
+def _body(age, sex, height, weight, training_level, body_fat_percentage):
+    """Starting (fat, lean, adaptation) and the constants _step() needs, as float arrays."""
+    import numpy as np
+
+    from .planner import estimate_bmr, training_factors
+
+    age = np.asarray(age, dtype=float)
+    height = np.asarray(height, dtype=float)
+    weight = np.asarray(weight, dtype=float)
+    sex = np.asarray(sex)
+    _, maintenance_factor = training_factors(training_level)
+    if body_fat_percentage is None:
+        body_fat_percentage = estimate_body_fat(weight, height, age, sex)
+    # BMR is 10 * weight plus a per-athlete constant, so each day only adds the weight term
+    bmr_offset = estimate_bmr(0.0, height, age, sex)
+    baseline = (10 * weight + bmr_offset) * maintenance_factor
+    fat = weight * np.asarray(body_fat_percentage, dtype=float) / 100
+    return (fat, weight - fat, np.zeros(len(weight))), (bmr_offset, maintenance_factor, baseline)
+
+
+def _step(fat, lean, adaptation, intake, bmr_offset, maintenance_factor, baseline):
+    """One day at `intake` kcal; returns the next (fat, lean, adaptation) and the kcal burnt.
+
+    Plain arithmetic, so it runs on floats or NumPy arrays alike.
+    """
+    intake_change = intake - baseline
+    deficit = (intake_change - abs(intake_change)) / 2  # min(intake_change, 0)
+    # Adaptation moves towards its full size for today's intake with an
+    # ADAPTATION_DAYS time constant; it only ever lowers expenditure
+    adaptation = adaptation + (ADAPTIVE_THERMOGENESIS * deficit - adaptation) / ADAPTATION_DAYS
+    burnt = (10 * (fat + lean) + bmr_offset) * maintenance_factor + THERMIC_EFFECT * intake_change + adaptation
+    balance = intake - burnt
+    lean_share = FORBES_C / (FORBES_C + fat)
+    return (fat + (1 - lean_share) * balance / FAT_KCAL_PER_KG, lean + lean_share * balance / LEAN_KCAL_PER_KG,
+            adaptation, burnt)
+
+
+def simulate(age, sex, height, weight, training_level, intake, body_fat_percentage=None):
+    """Integrate daily weight change for every athlete from their daily intake.
+
+    intake: kcal per day, shape (athletes, days) or anything that broadcasts
+    to it. The athlete arrays have one entry each; `body_fat_percentage`
+    defaults to estimate_body_fat(). Steps are one day (forward Euler), far
+    shorter than the weeks over which expenditure changes.
+    """
+    import numpy as np
+
+    (fat_0, lean_0, adaptation), constants = _body(age, sex, height, weight, training_level, body_fat_percentage)
+    intake = np.broadcast_to(np.asarray(intake, dtype=float), (len(fat_0), np.shape(intake)[-1]))
+    days = intake.shape[1]
+    fat = np.empty((len(fat_0), days + 1))
+    lean = np.empty((len(fat_0), days + 1))
+    expenditure = np.empty((len(fat_0), days + 1))
+    fat[:, 0] = fat_0
+    lean[:, 0] = lean_0
+
+    for day in range(days):
+        fat[:, day + 1], lean[:, day + 1], adaptation, expenditure[:, day] = _step(
+            fat[:, day], lean[:, day], adaptation, intake[:, day], *constants)
+    expenditure[:, days] = expenditure[:, days - 1] if days else constants[2]
+
+    return Simulation(weight=fat + lean, fat_mass=fat, lean_mass=lean, expenditure=expenditure)
+
+
+def _forbes_fat(weight, fat, lean):
+    """Fat mass at `weight` for a body that started at (fat, lean) and gained or lost by Forbes' rule.
+
+    Splitting each change by FORBES_C / (FORBES_C + fat) means dlean/dfat =
+    FORBES_KG / fat, so weight = fat + lean + FORBES_KG * ln(fat / start fat);
+    a few Newton steps invert that.
+    """
+    import numpy as np
+
+    estimate = fat + (weight - fat - lean) * fat / (fat + FORBES_KG)
+    for _ in range(FORBES_NEWTON_STEPS):
+        estimate = np.maximum(estimate, 0.1)
+        error = estimate + lean + FORBES_KG * np.log(estimate / fat) - weight
+        estimate = estimate - error / (1 + FORBES_KG / estimate)
+    return estimate
+
+
+def weekly_intake(age, sex, height, weight, training_level, week_end_weight, body_fat_percentage=None):
+    """(athletes, weeks) daily calories that bring simulate() to `week_end_weight` at the end of each week.
+
+    `weight` is each athlete's starting weight and `week_end_weight` has
+    shape (athletes, weeks); intake is held for the 7 days of each week.
+    Every week is solved at once, in closed form: Forbes' rule fixes the fat
+    in each planned weight and so the energy each week stores, weight is
+    taken to change linearly within a week, and adaptation, the only other
+    state carried between weeks, follows a linear recurrence. Weeks that
+    eat above the starting maintenance don't adapt, so a second pass
+    re-solves with those weeks marked.
+    """
+    import numpy as np
+
+    (fat, lean, _), (bmr_offset, maintenance_factor, baseline) = _body(
+        age, sex, height, weight, training_level, body_fat_percentage)
+    weights = np.hstack([(fat + lean)[:, None], np.asarray(week_end_weight, dtype=float)])
+    fat_mass = _forbes_fat(weights, fat[:, None], lean[:, None])
+    stored = np.diff(fat_mass, axis=1) * FAT_KCAL_PER_KG + np.diff(weights - fat_mass, axis=1) * LEAN_KCAL_PER_KG
+    # A week's BMR-driven burn: seven days from its start weight, the change in weight spread over them
+    burnt = maintenance_factor[:, None] * (70 * weights[:, :-1] + 30 * np.diff(weights, axis=1)
+                                           + 7 * bmr_offset[:, None])
+    baseline = baseline[:, None]
+
+    # Adaptation on the week's days 1..7 sums to (7 - S) * its target + S * its value at the start of the week
+    retained = 1 - 1 / ADAPTATION_DAYS
+    week_retained = retained ** 7
+    s = retained * (1 - week_retained) / (1 - retained)
+    adapting = np.full(stored.shape, ADAPTIVE_THERMOGENESIS)
+    for _ in range(2):
+        # Each week's intake is (r + s * adaptation at its start) / d ...
+        d = 7 * (1 - THERMIC_EFFECT) - adapting * (7 - s)
+        r = stored + burnt - baseline * (7 * THERMIC_EFFECT + adapting * (7 - s))
+        # ... and the adaptation it leaves is a * adaptation + b
+        a = week_retained + (1 - week_retained) * adapting * s / d
+        b = (1 - week_retained) * adapting * (r / d - baseline)
+        carried = np.cumprod(np.hstack([np.ones((len(a), 1)), a]), axis=1)
+        adaptation = carried[:, :-1] * np.cumsum(np.hstack([np.zeros((len(b), 1)), b[:, :-1] / carried[:, 1:-1]]),
+                                                 axis=1)
+        intake = (r + s * adaptation) / d
+        adapting = np.where(intake < baseline, ADAPTIVE_THERMOGENESIS, 0.0)
+    return intake
+
+
+def camp_intake(weight, goal_weight, days, bmr, maintenance, height, age, sex):
+    """The flat daily intake that brings one athlete from `weight` to `goal_weight` in `days` days.
+
+    `bmr` and `maintenance` are their kcal/day at `weight`; training on top
+    of BMR is taken to scale with weight, like a maintenance factor. Solved
+    as weekly_intake() solves one week, in plain floats.
+    """
+    body_fat = _deurenberg(weight / (height / 100) ** 2, age, sex == "Male")
+    fat = weight * min(max(body_fat, BODY_FAT_RANGE[0]), BODY_FAT_RANGE[1]) / 100
+    # BMR is 10 * weight plus a per-athlete constant (Mifflin-St Jeor)
+    constants = (bmr - 10 * weight, maintenance / bmr, maintenance)
+    guess = maintenance - (weight - goal_weight) * KCAL_PER_KG / days
+    end_weight = []
+    for intake in (guess, guess - TRIAL_STEP_KCAL):
+        state = (fat, weight - fat, 0.0)
+        for _ in range(days):
+            *state, _ = _step(*state, intake, *constants)
+        end_weight.append(state[0] + state[1])
+    share = (goal_weight - end_weight[0]) / (end_weight[1] - end_weight[0])
+    return guess - share * TRIAL_STEP_KCAL
+
+
+def plan_intake(batch, days_per_week=7):
+    """(athletes, days) daily calories that follow a WeeklyPlanBatch's weekly targets.
+
+    Days past an athlete's last planned week (and every day of an invalid
+    athlete) repeat their last week, or are NaN if they have none.
+    """
+    import numpy as np
+
+    weeks = int(batch.week.max(initial=0))
+    calories = np.full((len(batch.valid), weeks), np.nan)
+    calories[batch.athlete, batch.week - 1] = batch.calories
+    last_week = np.maximum(np.bincount(batch.athlete, minlength=len(batch.valid)) - 1, 0)
+    padding = np.arange(weeks) > last_week[:, None]
+    calories = np.where(padding, calories[np.arange(len(calories)), last_week][:, None], calories)
+    return np.repeat(calories, days_per_week, axis=1)
+
+
+def project_plan(batch, age, sex, height, training_level, body_fat_percentage=None):
+    """Projected weight at the end of each planned week (one entry per batch row) if its calories are eaten.
+
+    The camp starts from the plan's own starting weight, so re-planned
+    batches (fight_camp.replan) work too. The planners fit their calories
+    to the model, so this is `batch.weight` give or take rounding to whole
+    kcal and the weeks replaced by later weigh-ins.
+    """
+    import numpy as np
+
+    if not len(batch.week):
+        return np.empty(0)
+    first_row = np.searchsorted(batch.athlete, np.arange(len(batch.valid)))
+    first_row = np.minimum(first_row, len(batch.week) - 1)
+    start_weight = batch.weight[first_row] + batch.loss[first_row]
+    # Only valid athletes have rows, so only they are simulated
+    valid = batch.valid
+    simulation = simulate(np.asarray(age)[valid], np.asarray(sex)[valid], np.asarray(height)[valid],
+                          start_weight[valid], np.asarray(training_level)[valid], plan_intake(batch)[valid],
+                          None if body_fat_percentage is None else np.asarray(body_fat_percentage)[valid])
+    row = np.cumsum(valid) - 1
+    return simulation.weight[row[batch.athlete], batch.week.astype(np.int64) * 7]
@@ -0,0 +1,155 @@
+"""Plan downloads (text, CSV, iCalendar, PDF), built only when clicked.
+
+Each builder returns the file's bytes. deferred() wraps one for
+st.download_button's callable `data`, so a rerun only registers the button;
+the file is built on the first click and kept in plan_cache under the
+format and the plan's cache key, so clicking again (or another session with
+the same plan) serves the stored bytes.
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+from .plan_cache import plan_cache
+
+# Format -> (MIME type, file name)
+EXPORT_FORMATS = {
+    "txt": ("text/plain", "fight_camp_plan.txt"),
+    "csv": ("text/csv", "fight_camp_plan.csv"),
+    "ics": ("text/calendar", "fight_camp_plan.ics"),
+    "pdf": ("application/pdf", "fight_camp_plan.pdf"),
+}
+
+
+def deferred(export_format, plan_key, build, cache=plan_cache):
+    """A no-argument callable returning `build()`'s bytes, built once per (format, plan key)."""
+    return lambda: cache.get_or_compute((export_format,) + tuple(plan_key), build)
+
+
+# --- Text ---
+def overview_text(inputs, camp, targets):
+    """app.py's plain-text plan; `targets` holds the figures overview_plan shows."""
+    return f"""
+Fight Camp Nutrition Plan
+
+Age: {inputs["age"]}
+Sex: {inputs["sex"]}
+Current Weight: {inputs["current_weight"]} kg
+Target Weight: {inputs["target_weight"]} kg
+Days Until Fight: {camp["days_left"]} days
+Fight Camp Length: {camp["fight_camp_length"]} weeks
+
+Total Weight to Lose: {targets["weight_to_lose"]:.1f} kg
+Fat Loss Goal: {targets["fat_loss_goal"]:.1f} kg (after {targets["water_cut_kg"]:.1f} kg water cut)
+
+Daily Nutrition Targets:
+- Calories: ~{targets["calories"]:.0f} kcal
+- Protein: {targets["protein_grams"]:.0f} g
+- Fat: {targets["fat_grams"]:.0f} g
+- Carbs: {targets["carbs_grams"]:.0f} g
+
+Carbohydrate & Fibre Reduction:
+- 6–4 days out: reduce carbs by 50%, fibre to 15g/day
+- 3–1 days out: very low carbs (<50g/day), fibre to 10g/day
+
+Water Loading:
+- 7–5 days out: 6–7L/day
+- 4–3 days out: 3–4L/day
+- 2 days out: 1–1.5L
+- 1 day out: minimal sips only
+
+Subscription Plan:
+- Total Price: £{camp["price"]}
+""".encode("utf-8")
+
+
+# --- CSV ---
+def weekly_csv(batch, logged_weight=None):
+    """The weekly table as shown in the app, as CSV."""
+    from .planner import weekly_frame
+
+    return weekly_frame(batch, logged_weight).to_csv(index=False).encode("utf-8")
+
+
+# --- iCalendar ---
+def _ics_text(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line):
+    """Split a content line into 75-octet pieces, continuation lines starting with a space."""
+    encoded = line.encode("utf-8")
+    pieces = []
+    while len(encoded) > 75:
+        cut = 75 if not pieces else 74
+        while cut and (encoded[cut] & 0xC0) == 0x80:  # don't split a UTF-8 character
+            cut -= 1
+        pieces.append(encoded[:cut])
+        encoded = encoded[cut:]
+    pieces.append(encoded)
+    return b"\r\n ".join(pieces)
+
+
+def fight_week_milestones(fight_date):
+    """[(date, summary, description)] for the fight week protocol's key days."""
+    from .daily_plan import (
+        FIGHT_WEEK_CARB_CUT_G, FIGHT_WEEK_DAYS_OUT, LOW_FIBRE_G, LOW_FIBRE_SALT_DAYS_OUT, LOW_SALT_RANGE_G,
+        WATER_LOADING_ML_PER_KG,
+    )
+
+    loading_ml = max(WATER_LOADING_ML_PER_KG.values())
+    loading_start = max(days for days, ml in WATER_LOADING_ML_PER_KG.items() if ml == loading_ml)
+    cut_day = max(days for days, ml in WATER_LOADING_ML_PER_KG.items() if 0 < ml < loading_ml)
+    return [
+        (fight_date - timedelta(days=FIGHT_WEEK_DAYS_OUT), "Fight week starts",
+         f"Cut carbs by about {FIGHT_WEEK_CARB_CUT_G} g/day from today."),
+        (fight_date - timedelta(days=loading_start), "Water loading starts",
+         f"{loading_ml} ml of water per kg of body weight a day until {cut_day + 1} days out."),
+        (fight_date - timedelta(days=LOW_FIBRE_SALT_DAYS_OUT), "Low fibre and salt",
+         f"Fibre under {LOW_FIBRE_G} g/day and salt {LOW_SALT_RANGE_G[0]}-{LOW_SALT_RANGE_G[1]} g/day "
+         "from today."),
+        (fight_date - timedelta(days=cut_day), "Water cut",
+         f"{WATER_LOADING_ML_PER_KG[cut_day]} ml of water per kg today; minimal sips from tomorrow."),
+        (fight_date, "Fight day", "Weigh in, then 1L electrolyte drink and carb meals every 1-2 hours."),
+    ]
+
+
+def plan_calendar(batch, fight_date, plan_key=()):
+    """An .ics calendar with each week's target weight and calories plus the fight week milestones."""
+    from .planner import FIBRE_G, SALT_G
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    uid_prefix = hashlib.sha1(repr(plan_key).encode()).hexdigest()[:16]
+    events = [
+        (day.item(), f"Week {week}: aim for ~{weight:.1f} kg by the end of the week",
+         f"Daily targets this week: {calories} kcal, protein {protein} g, fat {fat} g, carbs {carbs} g, "
+         f"fibre {FIBRE_G} g, salt {SALT_G} g per day.")
+        for day, week, weight, calories, protein, fat, carbs in zip(
+            batch.date, batch.week.tolist(), batch.weight.tolist(), batch.calories.tolist(),
+            batch.protein_g.tolist(), batch.fat_g.tolist(), batch.carbs_g.tolist())
+    ]
+    events += fight_week_milestones(fight_date)
+
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//My Fight Camp Nutrition//Plan//EN", "CALSCALE:GREGORIAN"]
+    for index, (day, summary, description) in enumerate(events):
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid_prefix}-{index}@fight-camp-nutrition",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+            f"SUMMARY:{_ics_text(summary)}",
+            f"DESCRIPTION:{_ics_text(description)}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return b"".join(_ics_fold(line) + b"\r\n" for line in lines)
+
+
+# --- PDF ---
+def plan_pdf(athlete, batch):
+    """The weekly plan PDF (fight_camp.pdf_plan); fpdf is only imported here."""
+    from .pdf_plan import render_plan_pdf
+    from .planner import weekly_frame
+
+    return render_plan_pdf(athlete, weekly_frame(batch).itertuples(index=False))
@@ -0,0 +1,148 @@
+"""Inverse planning for matchmaking: earliest safe fight date and lightest feasible target.
+
+    python -m fight_camp.matchmaking roster.csv --max-weekly-loss 1.0 --max-water-cut 5 > options.csv
+
+The weekly plan (planner.plan_weekly_batch) loses the most in its last camp
+week, and that peak is the fat-loss goal times a factor that only depends on
+the number of planned weeks. The factors are computed once per camp length
+and kept, so every question below is a lookup plus, for fight dates, a
+binary search over camp lengths (np.searchsorted), for a whole roster at once.
+"""
+import argparse
+import sys
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+from .constants import MIN_CAMP_DAYS, WEEKLY_LOSS_GRADIENT, WEIGHT_CLASSES
+from .planner import camp_length_weeks
+
+MAX_CAMP_WEEKS = 104  # searches stop here; longer camps count as infeasible
+MIN_PLANNED_WEEKS = int(camp_length_weeks(MIN_CAMP_DAYS + 1)) - 1
+
+MatchOptions = namedtuple("MatchOptions", ["earliest_fight_date", "lightest_target", "weight_class"])
+MatchOptions.__doc__ = """Per-athlete answers from match_options().
+
+`earliest_fight_date` is NaT and `lightest_target` NaN where nothing is
+feasible; `weight_class` is the lightest WEIGHT_CLASSES name whose limit the
+lightest target makes, or None.
+"""
+
+
+# --- Forward Model ---
+@lru_cache(maxsize=None)
+def peak_loss_factors(max_weeks=MAX_CAMP_WEEKS):
+    """Peak weekly loss per kg of fat-loss goal for 0..max_weeks planned weeks (inf for 0).
+
+    Read-only; shared by every caller.
+    """
+    weeks = np.arange(max_weeks + 1, dtype=float)
+    factor_sum = weeks + WEEKLY_LOSS_GRADIENT * weeks * (weeks - 1) / 2
+    with np.errstate(divide="ignore"):
+        factors = (1 + WEEKLY_LOSS_GRADIENT * (weeks - 1)) / factor_sum
+    factors[0] = np.inf
+    factors.flags.writeable = False
+    return factors
+
+
+def fat_loss_goal(current_weight, target_weight, water_cut_percentage):
+    """Fat to lose before fight week, as in plan_weekly_batch."""
+    target_weight = np.asarray(target_weight, dtype=float)
+    return np.asarray(current_weight, dtype=float) - target_weight * (1 + 2 * np.asarray(water_cut_percentage) / 100)
+
+
+def peak_weekly_loss(current_weight, target_weight, water_cut_percentage, weeks):
+    """kg lost in the hardest week of a camp with `weeks` planned weeks (the forward model)."""
+    factors = peak_loss_factors()
+    weeks = np.clip(np.asarray(weeks, dtype=np.int64), 0, MAX_CAMP_WEEKS)
+    return fat_loss_goal(current_weight, target_weight, water_cut_percentage) * factors[weeks]
+
+
+# --- Inverse Questions ---
+def earliest_fight_date(current_weight, target_weight, max_weekly_loss, max_water_cut=5.0, today=None):
+    """Earliest fight date whose plan never loses more than `max_weekly_loss` kg in a week.
+
+    Uses the full `max_water_cut` %, which leaves the least fat to lose. NaT
+    where the athlete is not above target or no camp up to MAX_CAMP_WEEKS is
+    slow enough.
+    """
+    if today is None:
+        today = datetime.today().date()
+    today = np.datetime64(today, "D")
+    current_weight = np.asarray(current_weight, dtype=float)
+    target_weight = np.asarray(target_weight, dtype=float)
+    goal = fat_loss_goal(current_weight, target_weight, max_water_cut)
+
+    # Smallest camp whose factor is at most max loss / goal; factors fall with
+    # camp length, so search their negation, which rises
+    with np.errstate(divide="ignore", invalid="ignore"):
+        allowed_factor = np.where(goal > 0, np.asarray(max_weekly_loss, dtype=float) / goal, np.inf)
+    weeks = np.searchsorted(-peak_loss_factors(), -allowed_factor, side="left")
+    weeks = np.maximum(weeks, MIN_PLANNED_WEEKS)
+    feasible = (current_weight > target_weight) & (weeks <= MAX_CAMP_WEEKS)
+    # 7 * weeks + 1 days out is the first date planned with `weeks` weeks before fight week
+    days = np.where(feasible, 7 * weeks + 1, 0).astype("timedelta64[D]")
+    return np.where(feasible, today + days, np.datetime64("NaT"))
+
+
+def lightest_target(current_weight, fight_date, max_weekly_loss, max_water_cut=5.0, today=None):
+    """Lightest fight weight reachable by `fight_date` without losing more than `max_weekly_loss` kg a week.
+
+    NaN where the fight is too soon to plan (MIN_CAMP_DAYS or less).
+    """
+    if today is None:
+        today = datetime.today().date()
+    days_left = (np.asarray(fight_date, dtype="datetime64[D]") - np.datetime64(today, "D")).astype(np.int64)
+    weeks = np.clip(camp_length_weeks(days_left) - 1, 0, MAX_CAMP_WEEKS)
+    most_fat = np.asarray(max_weekly_loss, dtype=float) / peak_loss_factors()[weeks]
+    target = (np.asarray(current_weight, dtype=float) - most_fat) / (1 + 2 * np.asarray(max_water_cut) / 100)
+    return np.where(days_left > MIN_CAMP_DAYS, target, np.nan)
+
+
+def lightest_weight_class(target_weight):
+    """Name of the lightest class whose limit is at or above each target (None if none or NaN)."""
+    names = np.array(list(WEIGHT_CLASSES) + [None], dtype=object)
+    index = np.searchsorted(np.array(list(WEIGHT_CLASSES.values())), np.asarray(target_weight, dtype=float))
+    return names[np.where(np.isnan(target_weight), len(WEIGHT_CLASSES), index)]
+
+
+def match_options(current_weight, target_weight, fight_date, max_weekly_loss, max_water_cut=5.0, today=None):
+    """Both inverse answers for a roster: when each athlete could make their target, and how light they could go."""
+    if today is None:
+        today = datetime.today().date()
+    target = lightest_target(current_weight, fight_date, max_weekly_loss, max_water_cut, today)
+    return MatchOptions(
+        earliest_fight_date=earliest_fight_date(current_weight, target_weight, max_weekly_loss, max_water_cut, today),
+        lightest_target=target,
+        weight_class=lightest_weight_class(target),
+    )
+
+
+def main(argv=None):
+    from .bulk_plan import ID_COLUMN, _chunk_inputs, read_roster_chunks
+
+    parser = argparse.ArgumentParser(description="Earliest safe fight date and lightest target for a roster.")
+    parser.add_argument("roster", help="CSV or JSONL roster, as for fight_camp.bulk_plan")
+    parser.add_argument("--max-weekly-loss", type=float, default=1.0, help="kg per week (default 1.0)")
+    parser.add_argument("--max-water-cut", type=float, default=5.0, help="%% of fight weight (default 5)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="roster rows per chunk")
+    args = parser.parse_args(argv)
+
+    today = datetime.today().date()
+    header = True
+    for chunk in read_roster_chunks(args.roster, args.chunk_size):
+        inputs = _chunk_inputs(chunk)
+        options = match_options(inputs["current_weight"], inputs["target_weight"], inputs["fight_date"],
+                                args.max_weekly_loss, args.max_water_cut, today)
+        chunk[ID_COLUMN].to_frame().assign(
+            earliest_fight_date=options.earliest_fight_date,
+            lightest_target_kg=np.round(options.lightest_target, 1),
+            lightest_weight_class=options.weight_class,
+        ).to_csv(sys.stdout, index=False, header=header)
+        header = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Daily meal plans that hit the weekly macro targets, from the bundled food table.
+
+foods.csv lists per-100 g nutrients for everyday foods, grouped by role
+(protein, grain, carb, veg, fruit, dairy, fat, seasoning). A day is a fixed set of
+meal templates; each slot takes a food from its group, rotating through the
+group from day to day, and the portions are solved together so the day's
+protein, fat, carbs, fibre and salt land on the targets while staying close
+to normal serving sizes.
+
+Solutions are cached per macro bucket (targets rounded to MACRO_BUCKET_G) and
+rotation day, so a camp only solves the distinct buckets it visits, and all
+of those in one vectorized pass.
+"""
+import csv
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .constants import FIBRE_G
+from .daily_plan import SALT_RANGE_G
+from .plan_cache import PlanCache
+
+FOODS_PATH = Path(__file__).with_name("foods.csv")
+NUTRIENTS = ["kcal", "protein_g", "fat_g", "carbs_g", "fibre_g", "salt_g"]
+SOLVED_NUTRIENTS = ["protein_g", "fat_g", "carbs_g", "fibre_g", "salt_g"]
+
+# Meal -> food group of each slot
+MEALS = [
+    ("Breakfast", ["grain", "dairy", "fruit"]),
+    ("Lunch", ["protein", "carb", "veg"]),
+    ("Snack", ["dairy", "fruit", "fat"]),
+    ("Dinner", ["protein", "carb", "veg", "fat", "seasoning"]),
+]
+DAYS_PER_WEEK = 7
+
+# Bucket width per solved nutrient; targets in the same bucket share a solution
+MACRO_BUCKET_G = {"protein_g": 5, "fat_g": 5, "carbs_g": 10, "fibre_g": 5, "salt_g": 0.5}
+# How much each nutrient's relative error counts, and how hard portions are
+# pulled towards one serving
+NUTRIENT_WEIGHTS = np.array([1.0, 1.0, 1.0, 0.5, 0.5])
+SERVING_PULL = 0.001
+SOLVER_ITERATIONS = 400
+MACRO_TOLERANCE = 0.10  # protein, fat and carbs within +/-10%
+
+FoodTable = namedtuple("FoodTable", ["names", "groups", "nutrients", "serving_g", "max_g"])
+FoodTable.__doc__ = """The food table as arrays; `nutrients` is foods x NUTRIENTS, per gram."""
+
+MealDay = namedtuple("MealDay", ["items", "totals", "met"])
+MealDay.__doc__ = """One day's meals: (meal, food, grams) items, nutrient totals and whether targets were met."""
+
+meal_cache = PlanCache()
+
+
+@lru_cache(maxsize=None)
+def load_foods(path=FOODS_PATH):
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    return FoodTable(
+        names=tuple(row["food"] for row in rows),
+        groups=np.array([row["group"] for row in rows]),
+        nutrients=np.array([[float(row[name]) for name in NUTRIENTS] for row in rows], dtype=np.float32) / 100,
+        serving_g=np.array([float(row["serving_g"]) for row in rows]),
+        max_g=np.array([float(row["max_g"]) for row in rows]),
+    )
+
+
+# --- Templates ---
+def day_foods(foods, allowed, rotation):
+    """[(meal, food index)] for one rotation day, skipping slots whose group has no allowed food."""
+    group_foods = {group: np.flatnonzero(allowed & (foods.groups == group)) for group in set(foods.groups)}
+    slots_per_group = {}
+    for _, groups in MEALS:
+        for group in groups:
+            slots_per_group[group] = slots_per_group.get(group, 0) + 1
+    seen = {}
+    chosen = []
+    for meal, groups in MEALS:
+        for group in groups:
+            candidates = group_foods.get(group)
+            if candidates is None or not len(candidates):
+                continue
+            # Consecutive days step through the group; slots within a day take different foods
+            slot = seen.get(group, 0)
+            seen[group] = slot + 1
+            chosen.append((meal, candidates[(rotation * slots_per_group[group] + slot) % len(candidates)]))
+    return chosen
+
+
+def allowed_foods(foods, pantry=None, exclude=()):
+    """Boolean mask of usable foods: those in `pantry` (default all) and not in `exclude`."""
+    names = np.array(foods.names)
+    allowed = np.isin(names, list(pantry)) if pantry is not None else np.ones(len(names), dtype=bool)
+    allowed &= ~np.isin(names, list(exclude))
+    if not allowed[foods.groups != "seasoning"].any():
+        raise ValueError("No foods left to plan meals from; loosen the pantry or exclusions.")
+    return allowed
+
+
+# --- Solver ---
+def solve_portions(nutrients, serving, max_grams, targets, iterations=SOLVER_ITERATIONS):
+    """Grams per slot for a batch of days, by projected accelerated gradient.
+
+    nutrients: (days, slots, SOLVED_NUTRIENTS) per gram; serving, max_grams:
+    (days, slots); targets: (days, SOLVED_NUTRIENTS). Minimizes the weighted
+    relative nutrient error, counting fibre only when it falls short, plus a
+    small pull towards one serving per slot, with each portion kept within
+    [0, max_grams]. Portions are solved in servings so every variable has the
+    same scale.
+    """
+    scale = NUTRIENT_WEIGHTS / np.maximum(targets, 1.0)
+    A = np.swapaxes(nutrients * serving[:, :, None], 1, 2) * scale[:, :, None]  # (days, nutrients, slots)
+    b = targets * scale
+    upper = max_grams / serving
+    fibre = SOLVED_NUTRIENTS.index("fibre_g")
+
+    step = 1 / (np.linalg.eigvalsh(np.swapaxes(A, 1, 2) @ A)[:, -1] + SERVING_PULL)
+    x = np.clip(np.ones_like(upper), 0, upper)
+    y = x
+    momentum = 1.0
+    for _ in range(iterations):
+        residual = np.einsum("dns,ds->dn", A, y) - b
+        residual[:, fibre] = np.minimum(residual[:, fibre], 0)
+        gradient = np.einsum("dns,dn->ds", A, residual) + SERVING_PULL * (y - 1)
+        x_next = np.clip(y - step[:, None] * gradient, 0, upper)
+        momentum_next = (1 + np.sqrt(1 + 4 * momentum * momentum)) / 2
+        y = x_next + ((momentum - 1) / momentum_next) * (x_next - x)
+        x, momentum = x_next, momentum_next
+    return x * serving
+
+
+def round_grams(grams, serving):
+    """Round to 5 g, or 0.5 g for foods served in spoonfuls."""
+    step = np.where(serving < 10, 0.5, 5.0)
+    return np.round(grams / step) * step
+
+
+def targets_met(totals, targets):
+    protein_fat_carbs = np.abs(totals[:, 1:4] - targets[:, :3]) <= MACRO_TOLERANCE * targets[:, :3]
+    fibre = totals[:, 4] >= (1 - MACRO_TOLERANCE) * targets[:, 3]
+    salt = (totals[:, 5] >= SALT_RANGE_G[0]) & (totals[:, 5] <= SALT_RANGE_G[1])
+    return protein_fat_carbs.all(axis=1) & fibre & salt
+
+
+def _solve_days(foods, allowed, buckets, rotations):
+    """MealDay for each (bucket targets, rotation) pair, solved in one batch."""
+    templates = {rotation: day_foods(foods, allowed, rotation) for rotation in set(rotations)}
+    # Pad every day to the longest template with a zero-nutrient, zero-capacity slot
+    slots = max(len(template) for template in templates.values())
+    index = np.zeros((len(buckets), slots), dtype=np.int64)
+    used = np.zeros((len(buckets), slots), dtype=bool)
+    for day, rotation in enumerate(rotations):
+        template = templates[rotation]
+        index[day, :len(template)] = [food for _, food in template]
+        used[day, :len(template)] = True
+
+    nutrients = foods.nutrients[index][:, :, 1:].astype(float) * used[:, :, None]
+    serving = foods.serving_g[index]
+    max_grams = np.where(used, foods.max_g[index], 0.0)
+    targets = np.asarray(buckets, dtype=float)
+    grams = round_grams(solve_portions(nutrients, serving, max_grams, targets), serving)
+    totals = np.einsum("ds,dsn->dn", grams, foods.nutrients[index].astype(float))
+    met = targets_met(totals, targets)
+
+    days = []
+    for day, rotation in enumerate(rotations):
+        items = tuple((meal, foods.names[food], float(grams[day, slot]))
+                      for slot, (meal, food) in enumerate(templates[rotation]) if grams[day, slot] > 0)
+        day_totals = tuple(zip(NUTRIENTS, np.round(totals[day], 1).tolist()))
+        days.append(MealDay(items=items, totals=day_totals, met=bool(met[day])))
+    return days
+
+
+def macro_bucket(protein_g, fat_g, carbs_g, fibre_g, salt_g):
+    return tuple(
+        round(round(value / MACRO_BUCKET_G[name]) * MACRO_BUCKET_G[name], 1)
+        for name, value in zip(SOLVED_NUTRIENTS, (protein_g, fat_g, carbs_g, fibre_g, salt_g))
+    )
+
+
+# --- Camp Plans ---
+def plan_meals(protein_g, fat_g, carbs_g, fibre_g=FIBRE_G, salt_g=sum(SALT_RANGE_G) / 2,
+               pantry=None, exclude=(), foods=None, cache=meal_cache):
+    """Meals for every day of every planned week: one list of DAYS_PER_WEEK MealDays per week.
+
+    Takes one value per week for each macro (e.g. the weekly plan's columns);
+    `pantry` limits the foods used, `exclude` removes some. Days already
+    solved for the same bucket, rotation day and food choice come from
+    `cache`; the rest are solved together.
+    """
+    foods = foods or load_foods()
+    allowed = allowed_foods(foods, pantry, exclude)
+    allowed_key = tuple(np.flatnonzero(allowed).tolist())
+    weeks = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float))
+                                  for value in (protein_g, fat_g, carbs_g, fibre_g, salt_g)))
+
+    keys = [("meals", macro_bucket(*week), rotation, allowed_key)
+            for week in zip(*(values.tolist() for values in weeks)) for rotation in range(DAYS_PER_WEEK)]
+    missing = object()
+    solved = {key: cache.get(key, missing) for key in dict.fromkeys(keys)}
+    unsolved = [key for key, value in solved.items() if value is missing]
+    if unsolved:
+        for key, day in zip(unsolved, _solve_days(foods, allowed, [key[1] for key in unsolved],
+                                                  [key[2] for key in unsolved])):
+            solved[key] = cache.put(key, day)
+    days = [solved[key] for key in keys]
+    return [days[week:week + DAYS_PER_WEEK] for week in range(0, len(days), DAYS_PER_WEEK)]
+
+
+def meal_frame(meal_day):
+    """One day's meals as a table with per-item nutrients."""
+    import pandas as pd
+
+    foods = load_foods()
+    position = {name: index for index, name in enumerate(foods.names)}
+    rows = []
+    for meal, food, grams in meal_day.items:
+        per_item = foods.nutrients[position[food]].astype(float) * grams
+        rows.append({
+            "Meal": meal,
+            "Food": food,
+            "Amount (g)": grams,
+            "Calories": round(per_item[0]),
+            "Protein (g)": round(per_item[1], 1),
+            "Fat (g)": round(per_item[2], 1),
+            "Carbs (g)": round(per_item[3], 1),
+            "Fibre (g)": round(per_item[4], 1),
+            "Salt (g)": round(per_item[5], 2),
+        })
+    return pd.DataFrame(rows)
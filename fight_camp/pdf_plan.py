@@ -0,0 +1,216 @@
+import argparse
+import multiprocessing
+import re
+import time
+import unicodedata
+import zipfile
+from datetime import datetime, timedelta
+
+import numpy as np
+from fpdf import FPDF
+
+from .planner import FIBRE_G, FIGHT_WEEK_PROTOCOL, ROSTER_FIELDS, SALT_G, plan_weekly_batch, training_label
+from .static_assets import LOGO_SOURCE
+
+# --- Table Layout (mm, A4 portrait with 10mm margins) ---
+WEEKLY_COLUMNS = [
+    ("Week", 14), ("Date", 22), ("Weight (kg)", 26), ("Calories", 24), ("Protein (g)", 22),
+    ("Fat (g)", 18), ("Carbs (g)", 20), ("Fibre (g)", 20), ("Salt (g)", 24),
+]
+LOGO_WIDTH_MM = 60
+
+# Core PDF fonts are latin-1 only; map the punctuation the app uses first
+_PUNCTUATION = str.maketrans({"–": "-", "—": "-", "‘": "'", "’": "'", "“": '"', "”": '"', "£": "GBP "})
+
+
+# The logo as fpdf parsed it, once per process; see load_logo()
+_logo_info = None
+
+
+def clean_text(text):
+    text = str(text).translate(_PUNCTUATION)
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+
+def load_logo():
+    """Read and parse the logo once per process (the roster pool's worker initializer).
+
+    fpdf 1.7 (pinned in requirements.txt) parses an image on its first image()
+    call in a document and keeps the result in the document's `images`, so a
+    scratch document does the parsing and each plan is handed the entry.
+    """
+    global _logo_info
+    if _logo_info is None:
+        scratch = FPDF()
+        scratch.add_page()
+        scratch.image(str(LOGO_SOURCE), x=0, y=0)
+        _logo_info = scratch.images[str(LOGO_SOURCE)]
+    return _logo_info
+
+
+class PlanPDF(FPDF):
+    def logo(self, x, y, w):
+        name = str(LOGO_SOURCE)
+        if name not in self.images:
+            self.images[name] = dict(load_logo(), i=len(self.images) + 1)
+        self.image(name, x=x, y=y, w=w)
+
+    def logo_height(self, w):
+        info = load_logo()
+        return w * info["h"] / info["w"]
+
+    def heading(self, text, size=13):
+        self.set_font("Helvetica", "B", size)
+        self.set_text_color(255, 75, 75)
+        self.cell(0, 9, clean_text(text), ln=1)
+        self.set_text_color(0, 0, 0)
+
+    def line_text(self, text, style="", size=10):
+        self.set_font("Helvetica", style, size)
+        self.multi_cell(0, 5.5, clean_text(text))
+
+
+def render_plan_pdf(athlete, weekly_rows):
+    """Render one athlete's plan and return the PDF bytes.
+
+    `athlete` holds the sidebar fields (plus an optional "name"); `weekly_rows`
+    are tuples in WEEKLY_COLUMNS order, e.g. weekly_frame(batch).itertuples(index=False).
+    """
+    pdf = PlanPDF(format="A4")
+    pdf.set_margins(10, 10, 10)
+    pdf.set_auto_page_break(True, margin=12)
+    pdf.add_page()
+
+    # --- Header ---
+    logo_height = pdf.logo_height(LOGO_WIDTH_MM)
+    pdf.set_fill_color(0, 0, 0)
+    pdf.rect(10, 10, 190, logo_height + 22, style="F")
+    pdf.logo(x=105 - LOGO_WIDTH_MM / 2, y=13, w=LOGO_WIDTH_MM)
+    pdf.set_y(14 + logo_height)
+    pdf.set_text_color(255, 255, 255)
+    pdf.set_font("Helvetica", "B", 18)
+    pdf.cell(0, 9, "My Fight Camp Nutrition", ln=1, align="C")
+    pdf.set_font("Helvetica", "", 9)
+    pdf.cell(0, 5, "Make cutting weight simple: created by fighters, for fighters!", ln=1, align="C")
+    pdf.set_text_color(0, 0, 0)
+    pdf.ln(8)
+
+    # --- Athlete Summary ---
+    fight_date = athlete["fight_date"]
+    target_weight = athlete["target_weight"]
+    fight_week_start_weight = target_weight * (1 + 2 * athlete["water_cut_percentage"] / 100)
+    if athlete.get("name"):
+        pdf.heading(f"Fight Camp Plan: {athlete['name']}", size=15)
+    else:
+        pdf.heading("Fight Camp Plan", size=15)
+    pdf.line_text(
+        f"Fight date: {fight_date:%d %b %Y}   |   Current weight: {athlete['current_weight']:.1f} kg   |   "
+        f"Fight weight: {target_weight:.1f} kg   |   Training: {training_label(athlete['training_level'])}"
+    )
+    pdf.ln(3)
+
+    # --- Weekly Table ---
+    pdf.heading("Weekly Nutrition & Weight Targets")
+    pdf.set_font("Helvetica", "B", 9)
+    pdf.set_fill_color(240, 242, 246)
+    for title, width in WEEKLY_COLUMNS:
+        pdf.cell(width, 7, title, border=1, align="C", fill=True)
+    pdf.ln()
+    pdf.set_font("Helvetica", "", 9)
+    for row in weekly_rows:
+        for (_, width), value in zip(WEEKLY_COLUMNS, row):
+            pdf.cell(width, 6, clean_text(value), border=1, align="C")
+        pdf.ln()
+    pdf.ln(4)
+
+    # --- Fight Week Protocol ---
+    pdf.heading("Fight Week Plan")
+    pdf.line_text(f"Fight Week Start Date: {fight_date - timedelta(days=7):%d %b %Y}", style="B")
+    pdf.line_text(f"Fight Week Start Weight: ~{fight_week_start_weight:.1f} kg", style="B")
+    pdf.ln(2)
+    for heading, instruction, why_title, why_text in FIGHT_WEEK_PROTOCOL:
+        pdf.line_text(heading, style="B", size=11)
+        pdf.line_text(instruction)
+        if why_title:
+            pdf.line_text(f"{why_title} {why_text}", style="I", size=9)
+        pdf.ln(1)
+
+    pdf.ln(3)
+    pdf.line_text(
+        "This plan is for informational purposes only and should not be considered medical advice.",
+        style="I", size=8,
+    )
+    output = pdf.output(dest="S")
+    return output.encode("latin-1") if isinstance(output, str) else bytes(output)
+
+
+# --- Roster Batch Mode ---
+def _roster_plans(roster, today):
+    """Yield (file name, athlete dict, weekly rows) for every valid athlete."""
+    columns = {field: np.asarray(roster[field]) for field in ROSTER_FIELDS}
+    columns["fight_date"] = columns["fight_date"].astype("datetime64[D]")
+    batch = plan_weekly_batch(**columns, today=today)
+    names = np.asarray(roster["name"]) if "name" in roster else [None] * len(batch.valid)
+
+    weeks, calories = batch.week.tolist(), batch.calories.tolist()
+    protein, fat, carbs = batch.protein_g.tolist(), batch.fat_g.tolist(), batch.carbs_g.tolist()
+    weights, dates = batch.weight.tolist(), batch.date.tolist()
+    values = {field: column.tolist() for field, column in columns.items()}
+    bounds = np.searchsorted(batch.athlete, np.arange(len(batch.valid) + 1)).tolist()
+    for i in np.flatnonzero(batch.valid).tolist():
+        rows = [
+            (weeks[j], f"{dates[j]:%d %b}", f"{weights[j]:.1f}", calories[j],
+             protein[j], fat[j], carbs[j], FIBRE_G, SALT_G)
+            for j in range(bounds[i], bounds[i + 1])
+        ]
+        athlete = {field: values[field][i] for field in ROSTER_FIELDS}
+        athlete["name"] = names[i]
+        if names[i]:
+            file_name = f"{i + 1:05d}_{re.sub(r'[^A-Za-z0-9_-]+', '_', str(names[i]))}.pdf"
+        else:
+            file_name = f"athlete_{i + 1:05d}.pdf"
+        yield file_name, athlete, rows
+
+
+def _render_job(job):
+    file_name, athlete, rows = job
+    return file_name, render_plan_pdf(athlete, rows)
+
+
+def render_roster_zip(roster, destination, processes=None, chunksize=16, today=None):
+    """Render one PDF per valid athlete into a zip using a process pool.
+
+    `roster` is a DataFrame (or mapping of columns) with the ROSTER_FIELDS and
+    an optional "name" column; `destination` is a path or binary file object.
+    Each PDF is written to the archive as soon as it is rendered, so memory
+    stays flat however large the roster is. Returns the number of plans written.
+    """
+    written = 0
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_STORED) as archive, \
+            multiprocessing.Pool(processes, initializer=load_logo) as pool:
+        # PDF page streams are already deflated, so the zip just stores them
+        for file_name, data in pool.imap(_render_job, _roster_plans(roster, today), chunksize):
+            archive.writestr(file_name, data)
+            written += 1
+    return written
+
+
+def main(argv=None):
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Render a PDF fight camp plan for every athlete in a roster CSV.")
+    parser.add_argument("roster", help="CSV with columns: " + ", ".join(ROSTER_FIELDS) + " (and optionally name)")
+    parser.add_argument("output", help="zip file to write")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    roster = pd.read_csv(args.roster, parse_dates=["fight_date"])
+    started = time.perf_counter()
+    written = render_roster_zip(roster, args.output, processes=args.processes,
+                                today=datetime.today().date())
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {written} of {len(roster)} plans to {args.output} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
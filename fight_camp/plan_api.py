@@ -0,0 +1,240 @@
+"""Async HTTP API serving the app_5.py weekly and daily plans.
+
+    python -m fight_camp.plan_api --port 8600 --workers 4
+
+Endpoints (JSON request bodies, athletes use the ROSTER_FIELDS names):
+
+    GET  /health
+    POST /plan          one athlete              -> {"valid", "rows": [...]}
+    POST /plan/batch    {"athletes": [...]}      -> {"athletes", "invalid", "columns": {...}}
+
+Add ?format=arrow (or send Accept: application/vnd.apache.arrow.stream) for an
+Arrow IPC stream instead of JSON, ?daily=1 for day-by-day rows, and an optional
+"today" (YYYY-MM-DD) in the body to plan from a fixed date. Responses are
+cached on a digest of their normalized inputs. Batches of POOL_MIN_ATHLETES or more are
+planned and encoded in a process pool, smaller requests in a worker thread, so
+neither blocks the event loop. Each --workers process has its own pool and
+response cache.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from .bulk_plan import ID_COLUMN, daily_columns, weekly_columns
+from .daily_plan import plan_daily_batch
+from .plan_cache import PlanCache
+from .planner import MAX_CAMP_WEEKS, MIN_CAMP_DAYS, ROSTER_FIELDS, camp_length_weeks, plan_weekly_batch
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MAX_BATCH_ATHLETES = int(os.environ.get("PLAN_API_MAX_BATCH", 100_000))
+POOL_MIN_ATHLETES = int(os.environ.get("PLAN_API_POOL_MIN_ATHLETES", 256))
+POOL_PROCESSES = int(os.environ.get("PLAN_API_PROCESSES", 0)) or None  # None: one per CPU
+
+FIELD_DTYPES = {"sex": str, "fight_date": "datetime64[D]", "training_level": str}  # others: float
+SEXES = ("Male", "Female")
+KEY_PRECISION = 2  # decimals floats are rounded to before hashing, as plan_cache.normalize_key does
+
+# Encoded response bodies, keyed on output options and request_digest()
+response_cache = PlanCache()
+_pool = None
+
+
+class RequestError(ValueError):
+    """Bad request input; reported to the client as a 400."""
+
+
+# --- Planning ---
+def parse_athletes(records):
+    """Turn a list of athlete dicts into plan_weekly_batch inputs and athlete ids."""
+    if not isinstance(records, list) or not records:
+        raise RequestError("Expected a non-empty list of athletes")
+    if len(records) > MAX_BATCH_ATHLETES:
+        raise RequestError(f"At most {MAX_BATCH_ATHLETES} athletes per request")
+    for index, record in enumerate(records):
+        missing = [field for field in ROSTER_FIELDS if not isinstance(record, dict) or field not in record]
+        if missing:
+            raise RequestError(f"Athlete {index} is missing: {', '.join(missing)}")
+    inputs = {}
+    for field in ROSTER_FIELDS:
+        values = [record[field] for record in records]
+        try:
+            inputs[field] = np.array(values, dtype=FIELD_DTYPES.get(field, float))
+        except (TypeError, ValueError):
+            expected = "a YYYY-MM-DD date" if field == "fight_date" else "a number"
+            raise RequestError(f"{field} must be {expected}") from None
+    if not np.isin(inputs["sex"], SEXES).all():
+        raise RequestError(f"sex must be {' or '.join(SEXES)}")
+    ids = [record.get(ID_COLUMN, index) for index, record in enumerate(records)]
+    if not all(isinstance(value, (str, int, float)) for value in ids):
+        raise RequestError(f"{ID_COLUMN} must be a string or number")
+    return inputs, np.array(ids)
+
+
+def request_digest(inputs, ids):
+    """SHA-1 of parsed athletes and their ids, with floats rounded to KEY_PRECISION decimals.
+
+    Keeps cache keys a fixed size however many athletes a request has.
+    """
+    digest = hashlib.sha1()
+    for name, values in [*inputs.items(), (ID_COLUMN, ids)]:
+        if values.dtype.kind == "f":
+            values = np.round(values, KEY_PRECISION) + 0.0  # -0.0 becomes 0.0
+        digest.update(f"{name}:{values.dtype.str}:".encode())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def plan_columns(inputs, ids, today, daily=False):
+    """Returns (output columns, invalid athlete count) for parsed inputs."""
+    if daily:
+        plan = plan_daily_batch(**inputs, today=today)
+        return daily_columns(plan, ids), len(ids) - int(np.unique(plan.athlete).size)
+    batch = plan_weekly_batch(**inputs, today=today)
+    return weekly_columns(batch, ids), int((~batch.valid).sum())
+
+
+def render_plan(inputs, ids, today, daily, output_format, single):
+    """Plan and encode a response body; runs in a worker thread or a pool process."""
+    try:
+        columns, invalid = plan_columns(inputs, ids, today, daily)
+    except ValueError as error:  # unknown training level, non-numeric fields
+        raise RequestError(str(error)) from None
+    if single:
+        del columns[ID_COLUMN]
+    if output_format == "arrow":
+        import pyarrow as pa
+
+        table = pa.table(columns)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    columns["date"] = columns["date"].astype(str)
+    if "water_ml" in columns:
+        columns["water_ml"] = [None if np.isnan(ml) else ml for ml in columns["water_ml"].tolist()]
+    columns = {name: column if isinstance(column, list) else column.tolist() for name, column in columns.items()}
+    if single:
+        rows = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        body = {"valid": not invalid, "rows": rows}
+    else:
+        # Batches stay columnar, like the Arrow output: far less to encode than row dicts
+        body = {"athletes": len(ids), "invalid": invalid, "columns": columns}
+    return json.dumps(body).encode()
+
+
+# --- Request Handling ---
+def _output_format(request):
+    requested = request.query_params.get("format")
+    if requested is None:
+        requested = "arrow" if ARROW_MEDIA_TYPE in request.headers.get("accept", "") else "json"
+    if requested not in ("json", "arrow"):
+        raise RequestError("format must be json or arrow")
+    return requested
+
+
+def _today(body):
+    if "today" not in body:
+        return datetime.today().date()
+    try:
+        return datetime.strptime(body["today"], "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        raise RequestError("today must be a YYYY-MM-DD date") from None
+
+
+async def _plan_response(request, single):
+    try:
+        body = await request.json()
+    except ValueError:
+        return JSONResponse({"error": "Request body must be JSON"}, status_code=400)
+    try:
+        if not isinstance(body, dict):
+            raise RequestError("Request body must be a JSON object")
+        records = [body] if single else body.get("athletes")
+        inputs, ids = parse_athletes(records)
+        today = _today(body)
+        output_format = _output_format(request)
+        daily = request.query_params.get("daily", "0").lower() in ("1", "true", "yes")
+        if single:
+            # Same checks, in the same order, as the app_5.py sidebar
+            days_left = (inputs["fight_date"][0] - np.datetime64(today, "D")).astype(int)
+            if days_left <= MIN_CAMP_DAYS:
+                raise RequestError("Fight date must be at least 4 weeks in the future.")
+            if camp_length_weeks(days_left) - 1 > MAX_CAMP_WEEKS:
+                raise RequestError(f"Plans cover at most {MAX_CAMP_WEEKS} weeks before fight week; "
+                                   "pick a fight date within a year.")
+            if not inputs["current_weight"][0] > inputs["target_weight"][0]:
+                raise RequestError("Current weight must be higher than fight weight.")
+
+        key = (output_format, daily, single, today, request_digest(inputs, ids))
+        content = response_cache.get(key)
+        if content is None:
+            args = (inputs, ids, today, daily, output_format, single)
+            if len(ids) >= POOL_MIN_ATHLETES:
+                content = await asyncio.get_running_loop().run_in_executor(_pool, render_plan, *args)
+            else:
+                content = await asyncio.to_thread(render_plan, *args)
+            response_cache.put(key, content)
+    except RequestError as error:
+        return JSONResponse({"error": str(error)}, status_code=400)
+    media_type = ARROW_MEDIA_TYPE if output_format == "arrow" else "application/json"
+    return Response(content, media_type=media_type)
+
+
+async def plan(request):
+    return await _plan_response(request, single=True)
+
+
+async def plan_batch(request):
+    return await _plan_response(request, single=False)
+
+
+async def health(request):
+    return JSONResponse({"status": "ok", "cache": response_cache.stats()})
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global _pool
+    _pool = ProcessPoolExecutor(POOL_PROCESSES)
+    try:
+        yield
+    finally:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+app = Starlette(
+    routes=[
+        Route("/health", health),
+        Route("/plan", plan, methods=["POST"]),
+        Route("/plan/batch", plan_batch, methods=["POST"]),
+    ],
+    lifespan=lifespan,
+)
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve fight camp plans over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--workers", type=int, default=1, help="server processes (each with its own cache)")
+    args = parser.parse_args(argv)
+    uvicorn.run("fight_camp.plan_api:app", host=args.host, port=args.port, workers=args.workers,
+                log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Append-only archive of generated weekly plans for analytics.
+
+    python -m fight_camp.bulk_plan roster.csv archive/ --format archive
+    python -m fight_camp.plan_archive archive/ --weight-class Featherweight --since 2026-07-01 --until 2026-09-30
+
+Plans are stored as Hive-partitioned files that pyarrow.dataset (or DuckDB,
+Spark, Polars) can read directly:
+
+    <root>/camp_week=2026-10-12/athlete_bucket=7/part-<time>-<id>.arrow
+
+camp_week is the Monday of the week the camp started and athlete_bucket a
+stable hash of the athlete ID, so a query for one intake or one athlete only
+opens the matching directories. The default format is uncompressed Arrow
+IPC: readers memory-map the files and a column projection touches only those
+columns' pages, without decoding or copying. "parquet" trades that for
+smaller files. Writes only ever add new files, each written under a hidden
+name and renamed into place, so readers never see a partial file.
+"""
+import argparse
+import os
+import uuid
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from .constants import WEIGHT_CLASSES
+
+ATHLETE_BUCKETS = 16
+FILE_FORMATS = {"ipc": ".arrow", "parquet": ".parquet"}
+# Athlete columns stored next to each week so analytics need no roster join
+ATHLETE_COLUMNS = {"sex": "sex", "target_weight": "fight_weight_kg", "training_level": "training_level",
+                   "fight_date": "fight_date"}
+
+
+def athlete_buckets(ids):
+    """Stable bucket per athlete ID (CRC32 of its text form, so it survives restarts and ID types)."""
+    return np.array([zlib.crc32(str(athlete).encode()) % ATHLETE_BUCKETS for athlete in ids], dtype=np.int16)
+
+
+def camp_weeks(batch):
+    """Monday of each row's camp start week, from its week number and date."""
+    camp_start = batch.date - ((batch.week.astype(np.int64) - 1) * 7).astype("timedelta64[D]")
+    # 1970-01-01 was a Thursday, so day numbers are Mondays when (day - 4) % 7 == 0
+    return camp_start - ((camp_start.astype(np.int64) - 4) % 7).astype("timedelta64[D]")
+
+
+def archive_columns(batch, ids, inputs):
+    """Archive columns for a WeeklyPlanBatch: the bulk export columns plus the athlete's fight details."""
+    from .bulk_plan import weekly_columns
+
+    columns = weekly_columns(batch, np.asarray(ids).astype(str))
+    del columns["fibre_g"], columns["salt_g"]  # the same on every row; see FIBRE_G and SALT_G
+    for field, name in ATHLETE_COLUMNS.items():
+        columns[name] = np.asarray(inputs[field])[batch.athlete]
+    columns["fight_date"] = columns["fight_date"].astype("datetime64[D]")
+    columns["camp_week"] = camp_weeks(batch)
+    columns["athlete_bucket"] = athlete_buckets(ids)[batch.athlete]
+    return columns
+
+
+def weight_class_bounds(name):
+    """(lower, upper] fight weight limits in kg for a class in WEIGHT_CLASSES."""
+    if name not in WEIGHT_CLASSES:
+        raise ValueError(f"Unknown weight class: {name!r} (use one of {list(WEIGHT_CLASSES)})")
+    limits = list(WEIGHT_CLASSES.values())
+    index = list(WEIGHT_CLASSES).index(name)
+    return (limits[index - 1] if index else 0.0), limits[index]
+
+
+class PlanArchive:
+    """A directory of partitioned plan files; append() adds files, scan() reads them."""
+
+    def __init__(self, root, file_format="ipc"):
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Unsupported archive format: {file_format!r} (use one of {list(FILE_FORMATS)})")
+        self.root = Path(root)
+        self.file_format = file_format
+
+    # --- Writing ---
+    def append(self, columns):
+        """Write archive columns (see archive_columns) as new files, one per partition; returns rows written."""
+        import pyarrow as pa
+
+        camp_week = np.asarray(columns["camp_week"], dtype="datetime64[D]")
+        bucket = np.asarray(columns["athlete_bucket"])
+        if not len(bucket):
+            return 0
+        data = {name: values for name, values in columns.items() if name not in ("camp_week", "athlete_bucket")}
+        table = pa.table(data)
+
+        partition = camp_week.astype(np.int64) * ATHLETE_BUCKETS + bucket
+        order = np.argsort(partition, kind="stable")
+        keys, starts = np.unique(partition[order], return_index=True)
+        table = table.take(order)
+        stops = np.append(starts[1:], len(order))
+        for key, start, stop in zip(keys.tolist(), starts.tolist(), stops.tolist()):
+            week = np.datetime64(key // ATHLETE_BUCKETS, "D")
+            directory = self.root / f"camp_week={week}" / f"athlete_bucket={key % ATHLETE_BUCKETS}"
+            self._write_file(directory, table.slice(start, stop - start))
+        return table.num_rows
+
+    def _write_file(self, directory, table):
+        import pyarrow as pa
+
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"part-{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:12]}{FILE_FORMATS[self.file_format]}"
+        hidden = directory / f".{name}"  # dataset discovery skips dot files
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, hidden)
+        else:
+            with pa.OSFile(str(hidden), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(hidden, directory / name)
+
+    # --- Reading ---
+    def dataset(self):
+        """The archive as a pyarrow Dataset over memory-mapped files."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        from pyarrow import fs
+
+        partitioning = ds.partitioning(
+            pa.schema([("camp_week", pa.date32()), ("athlete_bucket", pa.int16())]), flavor="hive")
+        return ds.dataset(self.root, format=self.file_format, partitioning=partitioning,
+                          filesystem=fs.LocalFileSystem(use_mmap=True))
+
+    def scan(self, columns=None, filter=None):
+        """Read `columns` (default all) of the rows matching a pyarrow.dataset `filter` expression."""
+        return self.dataset().to_table(columns=columns, filter=filter)
+
+
+def athlete_filter(athlete):
+    """Filter expression for one athlete, pruned to their bucket's directories."""
+    import pyarrow.dataset as ds
+
+    from .bulk_plan import ID_COLUMN
+
+    bucket = int(athlete_buckets([athlete])[0])
+    return (ds.field("athlete_bucket") == bucket) & (ds.field(ID_COLUMN) == str(athlete))
+
+
+def plan_filter(weight_class=None, since=None, until=None):
+    """Filter expression for weeks dated within [since, until] of athletes fighting in `weight_class`."""
+    import pyarrow.dataset as ds
+
+    conditions = []
+    if weight_class is not None:
+        lower, upper = weight_class_bounds(weight_class)
+        conditions += [ds.field("fight_weight_kg") > lower, ds.field("fight_weight_kg") <= upper]
+    if since is not None:
+        conditions.append(ds.field("date") >= np.datetime64(since, "D").item())
+    if until is not None:
+        conditions.append(ds.field("date") <= np.datetime64(until, "D").item())
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Average weekly targets from a plan archive.")
+    parser.add_argument("root", help="archive directory")
+    parser.add_argument("--format", choices=list(FILE_FORMATS), default="ipc")
+    parser.add_argument("--weight-class", choices=list(WEIGHT_CLASSES))
+    parser.add_argument("--since", help="first plan date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="last plan date (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    archive = PlanArchive(args.root, args.format)
+    table = archive.scan(["week", "calories", "protein_g", "carbs_g"],
+                         filter=plan_filter(args.weight_class, args.since, args.until))
+    if not table.num_rows:
+        print("No archived plans match.")
+        return
+    by_week = table.group_by("week").aggregate(
+        [("calories", "mean"), ("protein_g", "mean"), ("carbs_g", "mean"), ("week", "count")]).sort_by("week")
+    print(f"{table.num_rows:,} plan weeks; average target {np.mean(table['calories']):,.0f} kcal/day")
+    print("week  plans  kcal  protein_g  carbs_g")
+    for row in by_week.to_pylist():
+        print(f"{row['week']:>4}  {row['week_count']:>5}  {row['calories_mean']:>4.0f}  "
+              f"{row['protein_g_mean']:>9.0f}  {row['carbs_g_mean']:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# --- Defaults (override with environment variables) ---
+DEFAULT_MAX_ENTRIES = int(os.environ.get("PLAN_CACHE_MAX_ENTRIES", 1024))
+DEFAULT_TTL_SECONDS = float(os.environ.get("PLAN_CACHE_TTL_SECONDS", 3600))
+DEFAULT_MAX_MB = float(os.environ.get("PLAN_CACHE_MAX_MB", 64))
+
+
+def normalize_key(*values, precision=2):
+    """Build a hashable cache key, rounding floats so 70.0 and 70.00000001 match."""
+    key = []
+    for value in values:
+        if isinstance(value, float):
+            value = round(value, precision)
+        key.append(value)
+    return tuple(key)
+
+
+def estimate_size(value):
+    """Approximate bytes held by a cached value."""
+    if hasattr(value, "memory_usage"):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class PlanCache:
+    """Thread-safe LRU cache with per-entry TTL and a total memory ceiling.
+
+    Shared by every Streamlit session in the process, so cached values must be
+    treated as read-only by callers.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_bytes=int(DEFAULT_MAX_MB * 1024 * 1024), clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self._clock():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size, self._clock() + self.ttl_seconds)
+            self.current_bytes += size
+            self._evict()
+        return value
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for `key`, calling `compute()` on a miss."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    # --- Internal helpers (call with the lock held) ---
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def _evict(self):
+        now = self._clock()
+        for key in [k for k, (_, _, expires_at) in self._entries.items() if expires_at <= now]:
+            self._drop(key)
+            self.evictions += 1
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self.current_bytes > self.max_bytes):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self.evictions += 1
+
+
+# Process-wide cache shared by all app variants and sessions
+plan_cache = PlanCache()
@@ -0,0 +1,174 @@
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from .constants import (  # noqa: F401 (re-exported)
+    FIBRE_G, FIGHT_WEEK_PROTOCOL, KCAL_PER_KG, LOGGED_WEIGHT_COLUMN, MAX_CAMP_WEEKS, MIN_CAMP_DAYS, ROSTER_FIELDS,
+    SALT_G, TRAINING_LEVELS, WEEKLY_LOSS_GRADIENT,
+)
+
+WeeklyPlanBatch = namedtuple(
+    "WeeklyPlanBatch",
+    ["valid", "athlete", "week", "date", "weight", "loss", "calories", "protein_g", "fat_g", "carbs_g"],
+)
+WeeklyPlanBatch.__doc__ = """Flat weekly targets for a batch of athletes.
+
+`valid` has one entry per input athlete; every other field has one entry per
+planned week, with `athlete` pointing back into the input arrays. Columns use
+the narrowest type that holds them (int16 grams and kcal, datetime64[D]
+dates), and values that are the same on every row, such as fibre and salt,
+are not stored at all; weekly_frame() adds them when formatting.
+"""
+
+
+# --- Scalar Helpers ---
+def camp_length_weeks(days_left):
+    return -(-np.asarray(days_left) // 7)
+
+
+def estimate_bmr(weight, height, age, sex):
+    """Mifflin-St Jeor BMR; works on scalars or NumPy arrays."""
+    sex_offset = np.where(np.asarray(sex) == "Male", 5, -161)
+    return 10 * np.asarray(weight) + 6.25 * np.asarray(height) - 5 * np.asarray(age) + sex_offset
+
+
+def training_factors(training_level):
+    """Return (carb_multiplier, maintenance_factor) arrays for training level labels.
+
+    A number in place of a label is a measured maintenance factor (see
+    fight_camp.sessions); its carb multiplier is interpolated between the levels'.
+    """
+    levels = np.asarray(training_level)
+    if levels.dtype.kind in "if":
+        carbs, factors = zip(*TRAINING_LEVELS.values())
+        maintenance_factor = levels.astype(float)
+        return np.interp(maintenance_factor, factors, carbs), maintenance_factor
+    carb_multiplier = np.empty(levels.shape)
+    maintenance_factor = np.empty(levels.shape)
+    known = np.zeros(levels.shape, dtype=bool)
+    for label, (carbs, factor) in TRAINING_LEVELS.items():
+        match = levels == label
+        carb_multiplier[match] = carbs
+        maintenance_factor[match] = factor
+        known |= match
+    if not known.all():
+        unknown = sorted(set(levels[~known].tolist()))
+        raise ValueError(f"Unknown training level(s): {unknown}")
+    return carb_multiplier, maintenance_factor
+
+
+def training_label(training_level):
+    """Display name for a training level label or measured maintenance factor."""
+    if isinstance(training_level, str):
+        return training_level
+    return f"From sessions ({training_level:.2f} x BMR)"
+
+
+# --- Batch Planning ---
+def plan_weekly_batch(age, sex, height, current_weight, target_weight, fight_date,
+                      water_cut_percentage, training_level, today=None):
+    """Compute every athlete's weekly targets in one vectorized pass.
+
+    Mirrors the weekly loop in app_5.py: the fat loss needed to reach the fight
+    week start weight is spread over the camp with a soft 2%/week gradient, and
+    each week's calories are those the energy-balance model
+    (fight_camp.energy_balance) needs to reach that week's weight. Athletes with
+    fewer than 28 days to go, more than MAX_CAMP_WEEKS weeks to plan, or who are
+    already at or under target, are marked invalid and contribute no rows.
+    """
+    if today is None:
+        today = datetime.today().date()
+    today = np.datetime64(today, "D")
+
+    age = np.asarray(age, dtype=float)
+    height = np.asarray(height, dtype=float)
+    current_weight = np.asarray(current_weight, dtype=float)
+    target_weight = np.asarray(target_weight, dtype=float)
+    water_cut_percentage = np.asarray(water_cut_percentage, dtype=float)
+    fight_date = np.asarray(fight_date, dtype="datetime64[D]")
+    sex = np.asarray(sex)
+    carb_multiplier, _ = training_factors(training_level)
+
+    days_left = (fight_date - today).astype(np.int64)
+    total_weeks = camp_length_weeks(days_left) - 1
+    valid = (days_left > MIN_CAMP_DAYS) & (total_weeks <= MAX_CAMP_WEEKS) & (current_weight > target_weight)
+    total_weeks = np.where(valid, total_weeks, 0)
+
+    water_cut_kg = (water_cut_percentage / 100) * target_weight
+    fight_week_start_weight = target_weight + 2 * water_cut_kg
+    fat_loss_goal = current_weight - fight_week_start_weight
+
+    # Weekly losses on a padded (athlete, week) grid; accumulating along the
+    # week axis keeps the same float order as subtracting week by week
+    max_weeks = max(int(total_weeks.max(initial=0)), 1)
+    weight_factors = 1 + WEEKLY_LOSS_GRADIENT * np.arange(max_weeks)
+    factor_sums = np.cumsum(weight_factors)
+    normalization_factor = fat_loss_goal / factor_sums[np.maximum(total_weeks - 1, 0)]
+    in_camp = np.arange(max_weeks) < total_weeks[:, None]
+
+    losses = np.where(in_camp, weight_factors * normalization_factor[:, None], 0.0)
+    weights = np.subtract.accumulate(np.hstack([current_weight[:, None], losses]), axis=1)
+
+    athlete, week_index = np.nonzero(in_camp)
+    loss = losses[in_camp]
+    weight = weights[:, 1:][in_camp]
+
+    from .energy_balance import weekly_intake
+
+    # Only valid athletes have rows, so only they are simulated
+    intake = weekly_intake(age[valid], sex[valid], height[valid], current_weight[valid],
+                           np.asarray(training_level)[valid], weights[valid, 1:])
+    calories = intake[(np.cumsum(valid) - 1)[athlete], week_index]
+
+    return WeeklyPlanBatch(
+        valid=valid,
+        athlete=athlete.astype(np.int32),
+        week=(week_index + 1).astype(np.int16),
+        date=today + week_index.astype("timedelta64[W]"),
+        weight=weight,
+        loss=loss,
+        calories=np.round(calories).astype(np.int16),
+        protein_g=np.round(2.0 * weight).astype(np.int16),
+        fat_g=np.round(1.0 * weight).astype(np.int16),
+        carbs_g=np.round(carb_multiplier[athlete] * weight).astype(np.int16),
+    )
+
+
+def plan_weekly(age, sex, height, current_weight, target_weight, fight_date,
+                water_cut_percentage, training_level, today=None):
+    """Single-athlete wrapper returning the weekly table shown by app_5.py."""
+    batch = plan_weekly_batch(
+        [age], [sex], [height], [current_weight], [target_weight], [fight_date],
+        [water_cut_percentage], [training_level], today=today,
+    )
+    return weekly_frame(batch)
+
+
+def weekly_frame(batch, logged_weight=None):
+    """Format a plan batch as the app's weekly DataFrame.
+
+    `logged_weight` (one entry per row, NaN for none) adds the weights logged
+    during a re-planned camp (fight_camp.replan).
+    """
+    import pandas as pd
+
+    dates = pd.to_datetime(batch.date)
+    frame = pd.DataFrame({
+        "Week": batch.week,
+        "Date": dates.strftime("%d %b"),
+        # Python's round() is correctly rounded at one decimal; np.round is not
+        "Target Weight (kg)": [round(w, 1) for w in batch.weight.tolist()],
+        "Calories": batch.calories,
+        "Protein (g)": batch.protein_g,
+        "Fat (g)": batch.fat_g,
+        "Carbs (g)": batch.carbs_g,
+        "Fibre (g)": FIBRE_G,
+        "Salt (g)": SALT_G,
+    })
+    if logged_weight is not None:
+        frame.insert(3, LOGGED_WEIGHT_COLUMN,
+                     [None if np.isnan(w) else round(w, 1) for w in logged_weight.tolist()])
+    if len(batch.valid) > 1:
+        frame.insert(0, "Athlete", batch.athlete)
+    return frame
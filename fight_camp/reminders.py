@@ -0,0 +1,405 @@
+"""Daily target reminders for a whole roster, sent as each one falls due.
+
+    python -m fight_camp.reminders roster.csv --sink log
+    python -m fight_camp.reminders roster.csv --sink smtp --smtp-host localhost --smtp-port 1025
+    python -m fight_camp.reminders roster.csv --sink webhook --url http://localhost:8080/reminders
+    python -m fight_camp.reminders roster.csv --simulate-until 2026-11-01 --sink log > /dev/null
+
+Each athlete gets one message a day from the first day of their plan to
+fight day, at their `reminder_time` (HH:MM, optional roster column, default
+REMINDER_TIME): that day's calories and macros, fibre and salt, and in fight
+week the carb cut and water loading. ReminderSchedule keeps one heap entry
+per athlete, (due time, athlete, plan row, attempt), so finding what's due is a heap
+pop and nothing is polled; sending a reminder pushes that athlete's next
+day. The daily targets are planned once for the roster (daily_plan) and kept
+as compact int16 columns, so building a message is an array lookup.
+
+Sinks take batches of Reminders and return the ones they couldn't deliver:
+LogSink prints them, SmtpSink sends one email each (athletes need an
+`email` column) and WebhookSink POSTs them as JSON. Reminders go to the sink
+SEND_BATCH at a time; undelivered ones are retried RETRY_SECONDS later, up
+to MAX_ATTEMPTS sends in all, then dropped.
+"""
+import argparse
+import heapq
+import json
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from .daily_plan import (
+    FIGHT_WEEK_CARB_CUT_G, FIGHT_WEEK_DAYS_OUT, LOW_FIBRE_SALT_DAYS_OUT, LOW_SALT_RANGE_G, SALT_RANGE_G,
+    iter_daily_batches,
+)
+
+REMINDER_TIME = "07:00"
+RETRY_SECONDS = 300
+MAX_ATTEMPTS = 3  # sends per reminder, counting the first
+MAX_SLEEP_SECONDS = 60  # wake at least this often, so a stopped clock or new roster is noticed
+SEND_BATCH = 1000  # reminders per sink.send() call (one POST for WebhookSink)
+PLAN_CHUNK_ATHLETES = 10_000
+
+Reminder = namedtuple("Reminder", ["athlete", "email", "due", "days_out", "subject", "body", "attempt"])
+Reminder.__doc__ = """One athlete's message for one day; `due` is a naive local datetime.
+
+`attempt` counts earlier failed sends (0 the first time).
+"""
+
+
+def _minutes(reminder_time):
+    hours, minutes = str(reminder_time).split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _seconds(moment):
+    return int(np.datetime64(moment, "s").astype(np.int64))
+
+
+# --- Schedule ---
+class ReminderSchedule:
+    """A roster's daily reminders, ordered by due time in a heap.
+
+    `ids` labels the roster rows and `inputs` holds the plan_daily_batch
+    arrays; `reminder_times` is one HH:MM per athlete (or None for all at
+    REMINDER_TIME) and `emails` one address (or None) per athlete. Plans start
+    on `start`; reminders due before `now` are skipped, not sent late.
+    """
+
+    def __init__(self, ids, inputs, start, reminder_times=None, emails=None, now=None):
+        self.ids = np.asarray(ids).astype(str)
+        self.emails = emails
+        count = len(self.ids)
+        if reminder_times is None:
+            send_minute = np.full(count, _minutes(REMINDER_TIME))
+        else:
+            send_minute = np.array([_minutes(REMINDER_TIME if value is None or value != value else value)
+                                    for value in reminder_times])
+        self.send_second = 60 * send_minute
+
+        # Compact daily targets, planned a chunk of athletes at a time
+        columns = {name: [] for name in ("athlete", "days_out", "calories", "protein_g", "fat_g", "carbs_g",
+                                         "fibre_g", "water_ml")}
+        for first, daily in iter_daily_batches(inputs, PLAN_CHUNK_ATHLETES, today=start):
+            columns["athlete"].append(daily.athlete + first)
+            columns["water_ml"].append(np.nan_to_num(daily.water_ml, nan=-1).astype(np.int16))
+            for name in ("days_out", "calories", "protein_g", "fat_g", "carbs_g", "fibre_g"):
+                columns[name].append(getattr(daily, name))
+        columns = {name: np.concatenate(values) if values else np.empty(0, np.int16)
+                   for name, values in columns.items()}
+        athlete = columns.pop("athlete")
+        self.days_out, self.calories = columns["days_out"], columns["calories"]
+        self.protein_g, self.fat_g, self.carbs_g = columns["protein_g"], columns["fat_g"], columns["carbs_g"]
+        self.fibre_g, self.water_ml = columns["fibre_g"], columns["water_ml"]
+
+        # Rows are grouped by athlete, one per day from `start`
+        rows = np.bincount(athlete, minlength=count)
+        self.first_row = np.cumsum(rows) - rows
+        self.end_row = self.first_row + rows
+        self.start_second = _seconds(np.datetime64(start, "D"))
+        self.skipped = int((rows == 0).sum())
+
+        # Each athlete's first reminder still to come
+        now_second = _seconds(now if now is not None else datetime.now())
+        first_day = np.maximum(-(-(now_second - self.start_second - self.send_second) // 86400), 0)
+        row = self.first_row + first_day
+        pending = row < self.end_row
+        athletes = np.flatnonzero(pending)
+        due = self.start_second + 86400 * first_day[pending] + self.send_second[pending]
+        self._heap = [(due, athlete, row, 0) for due, athlete, row in zip(
+            due.tolist(), athletes.tolist(), row[pending].tolist())]
+        heapq.heapify(self._heap)
+        self._index = None  # athlete ID -> row, built on the first retry
+
+    def __len__(self):
+        return len(self._heap)
+
+    @property
+    def nbytes(self):
+        arrays = [self.days_out, self.calories, self.protein_g, self.fat_g, self.carbs_g, self.fibre_g,
+                  self.water_ml, self.first_row, self.end_row, self.send_second]
+        return sum(array.nbytes for array in arrays) + 100 * len(self._heap)
+
+    def next_due(self):
+        """Epoch seconds (naive local time) of the next reminder, or None when all are sent."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Every Reminder due at or before `now`, oldest first; each athlete's next day is queued."""
+        now_second = _seconds(now)
+        heap, due = self._heap, []
+        while heap and heap[0][0] <= now_second:
+            second, athlete, row, attempt = heapq.heappop(heap)
+            due.append((second, athlete, row, attempt))
+            # A retried reminder's next day is already queued
+            if not attempt and row + 1 < self.end_row[athlete]:
+                next_due = self.start_second + 86400 * (row + 1 - self.first_row[athlete]) + self.send_second[athlete]
+                heapq.heappush(heap, (int(next_due), athlete, row + 1, 0))
+        return [self.reminder(*entry) for entry in due]
+
+    def retry(self, reminders):
+        """Queue undelivered `reminders` again RETRY_SECONDS later; returns how many ran out of attempts."""
+        if self._index is None:
+            self._index = {athlete: index for index, athlete in enumerate(self.ids.tolist())}
+        dropped = 0
+        for reminder in reminders:
+            if reminder.attempt + 1 >= MAX_ATTEMPTS:
+                dropped += 1
+                continue
+            athlete = self._index[reminder.athlete]
+            due = _seconds(reminder.due)
+            # The plan row is the day the first attempt was due on
+            first_due = due - RETRY_SECONDS * reminder.attempt
+            row = self.first_row[athlete] + (first_due - self.start_second) // 86400
+            heapq.heappush(self._heap, (due + RETRY_SECONDS, athlete, int(row), reminder.attempt + 1))
+        return dropped
+
+    # --- Messages ---
+    def reminder(self, due, athlete, row, attempt=0):
+        days_out = int(self.days_out[row])
+        lines = [f"Today's targets: {self.calories[row]} kcal | protein {self.protein_g[row]} g | "
+                 f"fat {self.fat_g[row]} g | carbs {self.carbs_g[row]} g."]
+        if days_out <= LOW_FIBRE_SALT_DAYS_OUT:
+            lines.append(f"Fibre under {self.fibre_g[row]} g and salt {LOW_SALT_RANGE_G[0]:g}-"
+                         f"{LOW_SALT_RANGE_G[1]:g} g today.")
+        else:
+            lines.append(f"Fibre {self.fibre_g[row]} g | salt {SALT_RANGE_G[0]:g}-{SALT_RANGE_G[1]:g} g.")
+        if 0 < days_out <= FIGHT_WEEK_DAYS_OUT:
+            lines.append(f"Fight week: those carbs already include the ~{FIGHT_WEEK_CARB_CUT_G} g/day cut.")
+        if self.water_ml[row] > 0:
+            lines.append(f"Water loading: {self.water_ml[row] / 1000:.1f} L across the day.")
+        if days_out == 0:
+            subject = "Fight day"
+            lines = ["Minimal sips until weigh-in, then a 1L electrolyte drink and carb meals every 1-2 hours."]
+        elif days_out <= FIGHT_WEEK_DAYS_OUT:
+            subject = f"Fight week: {days_out} day{'s' if days_out > 1 else ''} out"
+        else:
+            subject = "Today's fight camp targets"
+        return Reminder(
+            athlete=str(self.ids[athlete]),
+            email=None if self.emails is None else self.emails[athlete],
+            due=np.datetime64(due, "s").item(),
+            days_out=days_out,
+            subject=subject,
+            body="\n".join(lines),
+            attempt=attempt,
+        )
+
+
+# --- Sinks ---
+class Sink:
+    """Where reminders go: send() takes a list of Reminders and returns those it couldn't deliver.
+
+    Raising OSError instead marks the whole list undelivered.
+    """
+
+    def send(self, reminders):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LogSink(Sink):
+    """Print each reminder as one line (athlete, due time, subject, body)."""
+
+    def __init__(self, stream=sys.stdout):
+        self.stream = stream
+
+    def send(self, reminders):
+        for reminder in reminders:
+            body = reminder.body.replace("\n", " ")
+            print(f"{reminder.athlete}\t{reminder.due:%Y-%m-%d %H:%M}\t{reminder.subject}\t{body}", file=self.stream)
+        return []
+
+    def close(self):
+        self.stream.flush()
+
+
+class SmtpSink(Sink):
+    """Email each reminder through one SMTP connection, reopened if the server drops it.
+
+    A message the server refuses (say, a bad recipient) is undelivered on its
+    own; losing the connection leaves the rest of the batch undelivered.
+    Reminders for athletes without an email address are counted in `skipped`.
+    """
+
+    def __init__(self, host="localhost", port=25, sender="reminders@localhost", timeout=30):
+        self.host, self.port, self.sender, self.timeout = host, port, sender, timeout
+        self.skipped = 0
+        self._smtp = None
+
+    def send(self, reminders):
+        import smtplib
+        from email.message import EmailMessage
+
+        undelivered = []
+        for index, reminder in enumerate(reminders):
+            if not reminder.email:
+                self.skipped += 1
+                continue
+            message = EmailMessage()
+            message["From"] = self.sender
+            message["To"] = reminder.email
+            message["Subject"] = reminder.subject
+            message.set_content(reminder.body)
+            try:
+                if self._smtp is None:
+                    self._smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+                self._smtp.send_message(message)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as error:
+                print(f"Reminder for {reminder.athlete} refused: {error}", file=sys.stderr)
+                undelivered.append(reminder)
+            except OSError as error:  # includes SMTPServerDisconnected
+                print(f"SMTP connection lost: {error}", file=sys.stderr)
+                self._drop_connection()
+                return undelivered + reminders[index:]
+        return undelivered
+
+    def _drop_connection(self):
+        try:
+            self._smtp.close()
+        except (AttributeError, OSError):
+            pass
+        self._smtp = None
+
+    def close(self):
+        if self._smtp is not None:
+            self._smtp.quit()
+            self._smtp = None
+
+
+class WebhookSink(Sink):
+    """POST each batch of reminders to a URL as one JSON array."""
+
+    def __init__(self, url, timeout=30):
+        self.url, self.timeout = url, timeout
+
+    def send(self, reminders):
+        from urllib.request import Request, urlopen
+
+        payload = [dict(reminder._asdict(), due=reminder.due.isoformat()) for reminder in reminders]
+        request = Request(self.url, data=json.dumps(payload).encode("utf-8"), method="POST",
+                          headers={"Content-Type": "application/json"})
+        with urlopen(request, timeout=self.timeout):
+            pass  # urlopen raises HTTPError for non-2xx replies
+        return []
+
+
+# --- Running ---
+def deliver(schedule, sink, now):
+    """Send everything due at `now`, SEND_BATCH at a time; returns (sent, failed, dropped) counts.
+
+    Failed reminders are queued for a retry, except the `dropped` ones that
+    have had MAX_ATTEMPTS sends.
+    """
+    reminders = schedule.pop_due(now)
+    sent = failed = dropped = 0
+    for first in range(0, len(reminders), SEND_BATCH):
+        batch = reminders[first:first + SEND_BATCH]
+        try:
+            undelivered = sink.send(batch)
+        except OSError as error:  # smtplib and urllib errors are OSErrors
+            print(f"Sending {len(batch):,} reminders failed ({error})", file=sys.stderr)
+            undelivered = batch
+        if undelivered:
+            batch_dropped = schedule.retry(undelivered)
+            print(f"{len(undelivered):,} reminders undelivered: {len(undelivered) - batch_dropped:,} retry in "
+                  f"{RETRY_SECONDS}s, {batch_dropped:,} dropped after {MAX_ATTEMPTS} attempts", file=sys.stderr)
+            dropped += batch_dropped
+        sent += len(batch) - len(undelivered)
+        failed += len(undelivered)
+    return sent, failed, dropped
+
+
+def run(schedule, sink, clock=datetime.now, sleep=time.sleep):
+    """Deliver reminders as they fall due until none are left."""
+    while schedule.next_due() is not None:
+        wait = schedule.next_due() - _seconds(clock())
+        if wait > 0:
+            sleep(min(wait, MAX_SLEEP_SECONDS))
+            continue
+        deliver(schedule, sink, clock())
+
+
+def simulate(schedule, sink, until):
+    """Deliver every reminder due up to `until` without waiting, jumping from one due time to the next.
+
+    Returns {"sent", "failed", "dropped", "wakeups", "seconds"}; useful to
+    check a roster's busiest minutes keep up on one core.
+    """
+    stats = {"sent": 0, "failed": 0, "dropped": 0, "wakeups": 0}
+    until_second = _seconds(until)
+    started = time.perf_counter()
+    while schedule.next_due() is not None and schedule.next_due() <= until_second:
+        sent, failed, dropped = deliver(schedule, sink, np.datetime64(schedule.next_due(), "s").item())
+        stats["sent"] += sent
+        stats["failed"] += failed
+        stats["dropped"] += dropped
+        stats["wakeups"] += 1
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def load_schedule(path, start=None, now=None):
+    """A ReminderSchedule for a roster CSV/JSONL file (bulk_plan columns, plus optional email and reminder_time)."""
+    import pandas as pd
+
+    from .bulk_plan import ID_COLUMN, _chunk_inputs, read_roster_chunks
+
+    if start is None:
+        start = datetime.today().date()
+    roster = pd.concat(read_roster_chunks(path, 100_000), ignore_index=True)
+    emails = roster["email"].astype(object).where(roster["email"].notna(), None).tolist() if "email" in roster else None
+    reminder_times = roster["reminder_time"].tolist() if "reminder_time" in roster else None
+    return ReminderSchedule(roster[ID_COLUMN].to_numpy(), _chunk_inputs(roster), start, reminder_times,
+                            emails, now)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send daily target reminders for a roster as they fall due.")
+    parser.add_argument("roster", help="CSV or JSONL roster, as for fight_camp.bulk_plan")
+    parser.add_argument("--start", type=lambda text: datetime.fromisoformat(text).date(),
+                        help="the day the plans start (default today)")
+    parser.add_argument("--sink", choices=["log", "smtp", "webhook"], default="log")
+    parser.add_argument("--smtp-host", default="localhost")
+    parser.add_argument("--smtp-port", type=int, default=25)
+    parser.add_argument("--sender", default="reminders@localhost")
+    parser.add_argument("--url", help="webhook URL for --sink webhook")
+    parser.add_argument("--simulate-until", type=datetime.fromisoformat,
+                        help="send everything due until then at once, on a simulated clock, and report throughput")
+    args = parser.parse_args(argv)
+    if args.sink == "webhook" and not args.url:
+        parser.error("--sink webhook needs --url")
+
+    started = time.perf_counter()
+    # A simulation replays the plans from their start; a live run skips whatever is already overdue
+    schedule = load_schedule(args.roster, args.start, now=args.start if args.simulate_until else None)
+    print(f"Scheduled {len(schedule):,} athletes ({schedule.skipped:,} without a plan) in "
+          f"{time.perf_counter() - started:.1f}s", file=sys.stderr)
+    if args.sink == "smtp":
+        sink = SmtpSink(args.smtp_host, args.smtp_port, args.sender)
+    elif args.sink == "webhook":
+        sink = WebhookSink(args.url)
+    else:
+        sink = LogSink()
+    with sink:
+        if args.simulate_until is None:
+            run(schedule, sink)
+        else:
+            stats = simulate(schedule, sink, args.simulate_until)
+            print(f"Sent {stats['sent']:,} reminders over {stats['wakeups']:,} due times "
+                  f"({stats['failed']:,} failed sends, {stats['dropped']:,} dropped) in {stats['seconds']:.2f}s "
+                  f"({stats['sent'] / max(stats['seconds'], 1e-9):,.0f}/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
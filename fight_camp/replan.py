@@ -0,0 +1,147 @@
+"""Incremental re-planning from logged weigh-ins.
+
+A CampPlans holds a roster's weekly plan (planner.plan_weekly_batch) and
+re-plans athletes as real weights come in. An observation in camp week j
+keeps weeks 1..j-1 as history and spreads the fat loss still needed from the
+observed weight over weeks j..N with the same soft gradient, with calories
+from the energy-balance model run on from the observed weight. An update
+costs O(weeks left) per athlete, and a nightly batch of weigh-ins across the
+roster is one vectorized simulation of the weeks left.
+"""
+import numpy as np
+
+from .constants import WEEKLY_LOSS_GRADIENT
+from .energy_balance import weekly_intake
+from .planner import WeeklyPlanBatch, plan_weekly_batch, training_factors, weekly_frame
+
+
+class CampPlans:
+    """Weekly plans for a roster that can be re-planned in place.
+
+    Takes the same arguments as plan_weekly_batch. `batch` is updated in place
+    by update(); `observed` holds the weight logged in each planned week (NaN
+    where none was).
+    """
+
+    def __init__(self, age, sex, height, current_weight, target_weight, fight_date,
+                 water_cut_percentage, training_level, today=None):
+        self.batch = plan_weekly_batch(
+            age, sex, height, current_weight, target_weight, fight_date,
+            water_cut_percentage, training_level, today=today,
+        )
+        self.start_date = self.batch.date[0] if len(self.batch.date) else None
+        # Re-planned weeks re-run the energy-balance model from the observed weight
+        self.body = (np.asarray(age, dtype=float), np.asarray(sex), np.asarray(height, dtype=float),
+                     np.asarray(training_level))
+        self.carb_multiplier, _ = training_factors(training_level)
+        target_weight = np.asarray(target_weight, dtype=float)
+        water_cut_kg = (np.asarray(water_cut_percentage, dtype=float) / 100) * target_weight
+        self.fight_week_start_weight = target_weight + 2 * water_cut_kg
+
+        # Rows are grouped by athlete, so each athlete's weeks are one slice
+        athletes = np.arange(len(self.batch.valid))
+        self.first_row = np.searchsorted(self.batch.athlete, athletes, side="left")
+        self.total_weeks = np.searchsorted(self.batch.athlete, athletes, side="right") - self.first_row
+        self.last_observed = np.full(len(athletes), np.datetime64("NaT"), dtype="datetime64[D]")
+        self.observed = np.full(len(self.batch.week), np.nan)
+
+    def rows(self, athlete):
+        return slice(self.first_row[athlete], self.first_row[athlete] + self.total_weeks[athlete])
+
+    def athlete_batch(self, athlete):
+        """One athlete's current plan as a single-athlete WeeklyPlanBatch."""
+        rows = self.rows(athlete)
+        fields = {name: values[rows] for name, values in self.batch._asdict().items() if name != "valid"}
+        fields["athlete"] = np.zeros_like(fields["athlete"])
+        return WeeklyPlanBatch(valid=self.batch.valid[[athlete]], **fields)
+
+    def frame(self, athlete):
+        """weekly_frame() for one athlete plus the weight logged in each week so far."""
+        return weekly_frame(self.athlete_batch(athlete), self.observed[self.rows(athlete)])
+
+    # --- Updates ---
+    def update(self, athlete, day, weight):
+        """Re-plan from observed weights; arrays of athlete index, date and kg.
+
+        Every observation inside the camp is recorded against its week; each
+        athlete is then re-planned from their latest one, unless it is older
+        than what was already applied. Returns the number of week rows
+        recomputed.
+        """
+        athlete = np.atleast_1d(np.asarray(athlete, dtype=np.int64))
+        day = np.atleast_1d(np.asarray(day, dtype="datetime64[D]"))
+        weight = np.atleast_1d(np.asarray(weight, dtype=float))
+        if self.start_date is None or not len(athlete):
+            return 0
+
+        week = (day - self.start_date).astype(np.int64) // 7 + 1
+        in_camp = self.batch.valid[athlete] & (week >= 1) & (week <= self.total_weeks[athlete])
+        athlete, day, weight, week = athlete[in_camp], day[in_camp], weight[in_camp], week[in_camp]
+        if not len(athlete):
+            return 0
+
+        # Stable sort by (athlete, date) so later entries win ties and the last
+        # observation of each run is the athlete's latest
+        order = np.lexsort((day, athlete))
+        athlete, day, weight, week = athlete[order], day[order], weight[order], week[order]
+        self.observed[self.first_row[athlete] + week - 1] = weight
+        latest = np.append(athlete[1:] != athlete[:-1], True)
+        athlete, day, weight, week = athlete[latest], day[latest], weight[latest], week[latest]
+        fresh = np.isnat(self.last_observed[athlete]) | (day >= self.last_observed[athlete])
+        athlete, day, weight, week = athlete[fresh], day[fresh], weight[fresh], week[fresh]
+        if not len(athlete):
+            return 0
+        self.last_observed[athlete] = day
+        return self._replan(athlete, week, weight)
+
+    def _replan(self, athlete, week, weight):
+        # Rows for weeks `week`..N of each athlete, laid out segment by segment
+        weeks_left = self.total_weeks[athlete] - week + 1
+        segment_start = np.cumsum(weeks_left) - weeks_left
+        offset = np.arange(weeks_left.sum()) - np.repeat(segment_start, weeks_left)
+        rows = np.repeat(self.first_row[athlete] + week - 1, weeks_left) + offset
+        row_athlete = np.repeat(athlete, weeks_left)
+
+        # Re-normalize the gradient over the weeks left: sum of 1 + g*(w-1) for w in week..N
+        last_week = self.total_weeks[athlete]
+        factor_sum = weeks_left + WEEKLY_LOSS_GRADIENT * (
+            (last_week - 1) * last_week - (week - 2) * (week - 1)) / 2
+        fat_loss_left = weight - self.fight_week_start_weight[athlete]
+        normalization_factor = fat_loss_left / factor_sum
+
+        loss = (1 + WEEKLY_LOSS_GRADIENT * (self.batch.week[rows] - 1)) * np.repeat(normalization_factor, weeks_left)
+        lost_so_far = np.cumsum(loss)
+        lost_so_far -= np.repeat(lost_so_far[segment_start] - loss[segment_start], weeks_left)
+        new_weight = np.repeat(weight, weeks_left) - lost_so_far
+
+        # Weeks left on a padded (athlete, week) grid; padding holds the last week's weight
+        segment = np.repeat(np.arange(len(athlete)), weeks_left)
+        targets = np.repeat(new_weight[segment_start + weeks_left - 1][:, None], weeks_left.max(), axis=1)
+        targets[segment, offset] = new_weight
+        age, sex, height, training_level = (values[athlete] for values in self.body)
+        calories = weekly_intake(age, sex, height, weight, training_level, targets)[segment, offset]
+
+        batch = self.batch
+        batch.weight[rows] = new_weight
+        batch.loss[rows] = loss
+        batch.calories[rows] = np.round(calories)
+        batch.protein_g[rows] = np.round(2.0 * new_weight)
+        batch.fat_g[rows] = np.round(1.0 * new_weight)
+        batch.carbs_g[rows] = np.round(self.carb_multiplier[row_athlete] * new_weight)
+        return len(rows)
+
+
+def replanned_weekly(history, age, sex, height, target_weight, fight_date, water_cut_percentage, training_level):
+    """(plan, logged weights) for a camp that began at the first of `history`'s (date, kg) weigh-ins.
+
+    Weeks before the latest weigh-in are kept as planned; the rest are
+    re-planned from it. Returns None when that camp would not be valid.
+    """
+    days, weights = zip(*history)
+    start_date, start_weight = history[0]
+    plans = CampPlans([age], [sex], [height], [start_weight], [target_weight], [fight_date],
+                      [water_cut_percentage], [training_level], today=start_date)
+    if not plans.batch.valid[0]:
+        return None
+    plans.update(np.zeros(len(history), dtype=np.int64), np.array(days, dtype="datetime64[D]"), weights)
+    return plans.athlete_batch(0), plans.observed[plans.rows(0)].copy()
@@ -0,0 +1,150 @@
+"""Per-section rerun timing for the Streamlit scripts.
+
+Timing is off unless FCN_TIMING=1 is set or the page is opened with
+?debug=timing. When on, each rerun appends one JSON line to
+metrics/rerun_timings.jsonl and refreshes a Prometheus textfile
+(metrics/rerun_timings_<pid>.prom) with per-section p50/p99 over this
+process's recent reruns. Summarize a metrics file across sessions with:
+
+    python -m fight_camp.rerun_timing metrics/rerun_timings.jsonl
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+METRICS_DIR = Path(os.environ.get("FCN_METRICS_DIR", Path(__file__).resolve().parent.parent / "metrics"))
+JSONL_NAME = "rerun_timings.jsonl"
+SAMPLES_PER_SERIES = 1000
+QUANTILES = (0.5, 0.9, 0.99)
+
+_lock = threading.Lock()
+# (script, section) -> recent durations in seconds, for the Prometheus summary
+_samples = defaultdict(lambda: deque(maxlen=SAMPLES_PER_SERIES))
+
+
+def timing_enabled():
+    if os.environ.get("FCN_TIMING") == "1":
+        return True
+    try:
+        import streamlit as st
+
+        return st.query_params.get("debug") == "timing"
+    except Exception:
+        return False
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else None
+    except Exception:
+        return None
+
+
+def quantile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class RerunTimer:
+    """Checkpoint-style timer: each section() call closes the previous section.
+
+    Scripts call section("inputs"), section("calculations") ... in order, so
+    nothing has to be re-indented. When disabled every call is a no-op.
+    """
+
+    def __init__(self, script, enabled=None):
+        self.script = script
+        self.enabled = timing_enabled() if enabled is None else enabled
+        self.sections = {}
+        self._current = None
+        self._started = self._section_started = time.perf_counter()
+
+    def section(self, name):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._current is not None:
+            self.sections[self._current] = self.sections.get(self._current, 0.0) + now - self._section_started
+        self._current = name
+        self._section_started = now
+
+    def finish(self, panel=None):
+        """Close the last section, record the rerun and optionally show the debug panel."""
+        if not self.enabled:
+            return None
+        self.section(None)
+        total = time.perf_counter() - self._started
+        record = {
+            "ts": time.time(),
+            "script": self.script,
+            "session": _session_id(),
+            "total_s": total,
+            "sections": self.sections,
+        }
+        record_rerun(record)
+        if panel is not None:
+            lines = ["| Section | Time |", "|---|---|"]
+            lines += [f"| {name} | {seconds * 1000:.1f} ms |" for name, seconds in self.sections.items()]
+            lines.append(f"| **total** | **{total * 1000:.1f} ms** |")
+            panel.expander("Rerun Timing", expanded=True).markdown("\n".join(lines))
+        return record
+
+
+def record_rerun(record):
+    """Append a rerun record to the JSONL file and refresh this process's textfile."""
+    METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    with _lock:
+        with open(METRICS_DIR / JSONL_NAME, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+        series = dict(record["sections"], total=record["total_s"])
+        for section, seconds in series.items():
+            _samples[(record["script"], section)].append(seconds)
+        _write_prometheus(METRICS_DIR / f"rerun_timings_{os.getpid()}.prom")
+
+
+def _write_prometheus(path):
+    lines = [
+        "# HELP fcn_rerun_section_seconds Streamlit rerun time per script section.",
+        "# TYPE fcn_rerun_section_seconds summary",
+    ]
+    for (script, section), values in sorted(_samples.items()):
+        labels = f'script="{script}",section="{section}"'
+        for q in QUANTILES:
+            lines.append(f'fcn_rerun_section_seconds{{{labels},quantile="{q}"}} {quantile(values, q):.6f}')
+        lines.append(f"fcn_rerun_section_seconds_sum{{{labels}}} {sum(values):.6f}")
+        lines.append(f"fcn_rerun_section_seconds_count{{{labels}}} {len(values)}")
+    # Write then rename so the textfile collector never reads a partial file
+    tmp_path = path.with_suffix(".prom.tmp")
+    tmp_path.write_text("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+def summarize(jsonl_path):
+    """{(script, section): {"count", "p50_ms", "p99_ms"}} across every recorded session."""
+    series = defaultdict(list)
+    with open(jsonl_path, encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            series[(record["script"], "total")].append(record["total_s"])
+            for section, seconds in record["sections"].items():
+                series[(record["script"], section)].append(seconds)
+    return {
+        key: {"count": len(values), "p50_ms": quantile(values, 0.5) * 1000, "p99_ms": quantile(values, 0.99) * 1000}
+        for key, values in sorted(series.items())
+    }
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else METRICS_DIR / JSONL_NAME
+    print(f"{'script':<12} {'section':<16} {'count':>7} {'p50 ms':>9} {'p99 ms':>9}")
+    for (script, section), stats in summarize(path).items():
+        print(f"{script:<12} {section:<16} {stats['count']:>7} {stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f}")
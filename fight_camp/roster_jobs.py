@@ -0,0 +1,167 @@
+"""Background roster planning jobs for the Streamlit pages.
+
+A job plans an uploaded roster with the bulk planner (fight_camp.bulk_plan)
+on one of JOB_WORKERS background threads, so the script thread only submits
+it and polls. Every job lives in its own directory under JOBS_DIR:
+
+    <JOBS_DIR>/<job id>/roster.csv    the uploaded roster
+    <JOBS_DIR>/<job id>/plans.csv     weekly plan rows, appended chunk by chunk
+    <JOBS_DIR>/<job id>/status.json   state and progress, replaced atomically
+
+The job ID is a hash of the roster bytes and planning date, so uploading the
+same roster again (after a refresh, or from another session) finds the
+existing job instead of planning it twice. Jobs cut short by a server
+restart are re-queued when the queue is next opened.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+JOBS_DIR = Path(os.environ.get("FCN_JOBS_DIR", Path(__file__).resolve().parent.parent / "data" / "roster_jobs"))
+JOB_WORKERS = int(os.environ.get("FCN_JOB_WORKERS", 2))
+JOB_PROCESSES = int(os.environ.get("FCN_JOB_PROCESSES", 0)) or None  # per job; None plans in the worker thread
+JOB_CHUNK_ROWS = 5_000
+ROSTER_FILES = {".csv": "roster.csv", ".jsonl": "roster.jsonl", ".ndjson": "roster.jsonl"}
+ACTIVE_STATES = ("queued", "running")
+
+
+def job_id(roster_bytes, today):
+    return hashlib.sha1(roster_bytes + today.isoformat().encode()).hexdigest()[:16]
+
+
+class RosterJob:
+    """One job's files and status; status() re-reads status.json, so any session sees the latest."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.id = self.directory.name
+        self.status_path = self.directory / "status.json"
+        self.output_path = self.directory / "plans.csv"
+
+    @property
+    def roster_path(self):
+        return next(self.directory.glob("roster.*"))
+
+    def status(self):
+        return json.loads(self.status_path.read_text())
+
+    def write_status(self, **changes):
+        status = dict(self.status(), **changes) if self.status_path.exists() else changes
+        hidden = self.directory / ".status.json"
+        hidden.write_text(json.dumps(status))
+        os.replace(hidden, self.status_path)  # readers never see a partial file
+        return status
+
+    def preview(self, rows=20):
+        """The first planned rows so far, or None before the first chunk is written."""
+        import pandas as pd
+
+        if not self.output_path.exists() or not self.status()["rows"]:
+            return None
+        return pd.read_csv(self.output_path, nrows=rows)
+
+
+class JobQueue:
+    """Background planning for uploaded rosters on a bounded thread pool."""
+
+    def __init__(self, root=JOBS_DIR, workers=JOB_WORKERS, processes=JOB_PROCESSES, chunk_size=JOB_CHUNK_ROWS):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="roster-job")
+        self._cancel = {}
+        self._lock = threading.Lock()
+        for job in self.jobs():
+            if job.status()["state"] in ACTIVE_STATES:
+                self._start(job)
+
+    # --- Submitting ---
+    def submit(self, roster_bytes, file_name, today=None):
+        """Queue a roster upload; returns its RosterJob, reusing any job already made for the same upload."""
+        if today is None:
+            today = datetime.today().date()
+        suffix = Path(file_name).suffix.lower()
+        if suffix not in ROSTER_FILES:
+            raise ValueError(f"Unsupported roster file: {file_name!r} (use CSV or JSONL)")
+        job = RosterJob(self.root / job_id(roster_bytes, today))
+        with self._lock:
+            if job.status_path.exists():
+                if job.status()["state"] != "cancelled":
+                    return job
+            else:
+                job.directory.mkdir(parents=True, exist_ok=True)
+                (job.directory / ROSTER_FILES[suffix]).write_bytes(roster_bytes)
+            job.write_status(
+                name=file_name, today=today.isoformat(), submitted=time.time(),
+                total_athletes=roster_bytes.count(b"\n") - (suffix == ".csv") + (not roster_bytes.endswith(b"\n")),
+            )
+            self._start(job)
+        return job
+
+    def _start(self, job):
+        job.write_status(state="queued", athletes=0, invalid=0, rows=0, error=None, finished=None)
+        self._cancel[job.id] = threading.Event()
+        self._executor.submit(self._run, job, self._cancel[job.id])
+
+    def cancel(self, job):
+        """Stop a queued or running job after its current chunk; rows planned so far are kept."""
+        event = self._cancel.get(job.id)
+        if event is not None:
+            event.set()
+
+    # --- Running ---
+    def _run(self, job, cancelled):
+        from .bulk_plan import PlanWriter, _ordered_results, read_roster_chunks
+
+        if cancelled.is_set():
+            job.write_status(state="cancelled", finished=time.time())
+            return
+        status = job.write_status(state="running", started=time.time())
+        today = datetime.fromisoformat(status["today"]).date()
+        progress = {"athletes": 0, "invalid": 0, "rows": 0}
+        job.output_path.unlink(missing_ok=True)  # a re-queued job starts over
+        try:
+            chunks = read_roster_chunks(job.roster_path, self.chunk_size)
+            with PlanWriter(job.output_path, "csv") as writer:
+                for columns, athletes, invalid in _ordered_results(chunks, today, self.processes, False):
+                    writer.write(columns)
+                    progress["athletes"] += athletes
+                    progress["invalid"] += invalid
+                    progress["rows"] += len(columns["date"])
+                    job.write_status(**progress)
+                    if cancelled.is_set():
+                        job.write_status(state="cancelled", finished=time.time())
+                        return
+        except Exception as error:  # reported on the page; the worker thread stays alive
+            job.write_status(state="failed", error=f"{type(error).__name__}: {error}", finished=time.time())
+            return
+        job.write_status(state="finished", finished=time.time())
+
+    # --- Listing ---
+    def jobs(self):
+        """Every job on disk, newest first."""
+        jobs = [RosterJob(path.parent) for path in self.root.glob("*/status.json")]
+        return sorted(jobs, key=lambda job: job.status().get("submitted", 0), reverse=True)
+
+    def get(self, identifier):
+        job = RosterJob(self.root / identifier)
+        return job if job.status_path.exists() else None
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    """The process-wide queue at JOBS_DIR, opened on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue()
+        return _queue
@@ -0,0 +1,96 @@
+"""What-if sweeps over the planning math for one athlete.
+
+sweep() evaluates every combination of target weight x fight date x water
+cut % x training level at once, using the closed form of the weekly plan's
+gradient instead of expanding week rows, so a 10,000-cell grid is a few
+array operations.
+"""
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from .constants import KCAL_PER_KG, MIN_CAMP_DAYS, WEEKLY_LOSS_GRADIENT
+from .planner import camp_length_weeks, estimate_bmr, training_factors
+
+AXES = ["target_weight", "fight_date", "water_cut_percentage", "training_level"]
+
+ScenarioGrid = namedtuple(
+    "ScenarioGrid",
+    AXES + ["valid", "weeks", "weekly_loss", "peak_weekly_loss", "daily_deficit", "deficit_pct"],
+)
+ScenarioGrid.__doc__ = """Plan outcomes over a scenario grid.
+
+The first four fields are the axis values; every other field has shape
+(target weights, fight dates, water cuts, training levels). `weekly_loss` is
+the camp's average kg/week, `peak_weekly_loss` and `daily_deficit` are for
+the final (hardest) camp week, and `deficit_pct` is that deficit as a share
+of maintenance at the fight week start weight. Invalid cells are NaN.
+"""
+
+
+def sweep(age, sex, height, current_weight, target_weight, fight_date, water_cut_percentage,
+          training_level, today=None):
+    """Evaluate the weekly plan for every combination of the four axis arrays."""
+    if today is None:
+        today = datetime.today().date()
+    today = np.datetime64(today, "D")
+
+    target_weights = np.atleast_1d(np.asarray(target_weight, dtype=float))
+    fight_dates = np.atleast_1d(np.asarray(fight_date, dtype="datetime64[D]"))
+    water_cuts = np.atleast_1d(np.asarray(water_cut_percentage, dtype=float))
+    training_levels = np.atleast_1d(np.asarray(training_level))
+    _, maintenance_factor = training_factors(training_levels)
+
+    # One axis per dimension; broadcasting builds the grid without materializing it
+    target = target_weights[:, None, None, None]
+    days_left = (fight_dates - today).astype(np.int64)[None, :, None, None]
+    water_cut = water_cuts[None, None, :, None]
+    maintenance_factor = maintenance_factor[None, None, None, :]
+    shape = (len(target_weights), len(fight_dates), len(water_cuts), len(training_levels))
+
+    total_weeks = camp_length_weeks(days_left) - 1
+    valid = np.broadcast_to((days_left > MIN_CAMP_DAYS) & (current_weight > target), shape)
+    weeks = np.maximum(total_weeks, 1)
+    fight_week_start_weight = target * (1 + 2 * water_cut / 100)
+    fat_loss_goal = current_weight - fight_week_start_weight
+
+    # Sum of the weekly factors 1 + g*i for i < weeks, as in plan_weekly_batch
+    factor_sum = weeks + WEEKLY_LOSS_GRADIENT * weeks * (weeks - 1) / 2
+    peak_weekly_loss = fat_loss_goal / factor_sum * (1 + WEEKLY_LOSS_GRADIENT * (weeks - 1))
+    daily_deficit = peak_weekly_loss * KCAL_PER_KG / 7
+    maintenance = estimate_bmr(fight_week_start_weight, height, age, sex) * maintenance_factor
+
+    def grid(values):
+        return np.where(valid, np.broadcast_to(values, shape), np.nan)
+
+    return ScenarioGrid(
+        target_weight=target_weights,
+        fight_date=fight_dates,
+        water_cut_percentage=water_cuts,
+        training_level=training_levels,
+        valid=valid,
+        weeks=np.broadcast_to(np.where(days_left > MIN_CAMP_DAYS, total_weeks, 0), shape),
+        weekly_loss=grid(fat_loss_goal / weeks),
+        peak_weekly_loss=grid(peak_weekly_loss),
+        daily_deficit=grid(daily_deficit),
+        deficit_pct=grid(100 * daily_deficit / maintenance),
+    )
+
+
+def heatmap_frame(grid, target_index, level_index):
+    """Long-format (fight date x water cut) slice of the grid for one target weight and training level."""
+    import pandas as pd
+
+    cells = (target_index, slice(None), slice(None), level_index)
+    fight_dates = pd.to_datetime(grid.fight_date).strftime("%d %b %Y")
+    fight_week, water_cut = np.meshgrid(np.arange(len(grid.fight_date)), grid.water_cut_percentage, indexing="ij")
+    return pd.DataFrame({
+        "Fight Date": np.asarray(fight_dates)[fight_week.ravel()],
+        "Water Cut (%)": water_cut.ravel(),
+        "Camp Weeks": grid.weeks[cells].ravel(),
+        "Weekly Loss (kg)": np.round(grid.weekly_loss[cells].ravel(), 2),
+        "Peak Weekly Loss (kg)": np.round(grid.peak_weekly_loss[cells].ravel(), 2),
+        "Daily Deficit (kcal)": np.round(grid.daily_deficit[cells].ravel()),
+        "Deficit (% of maintenance)": np.round(grid.deficit_pct[cells].ravel(), 1),
+    })
@@ -0,0 +1,364 @@
+"""Training session import: heart-rate/activity files to daily training energy.
+
+    python -m fight_camp.sessions ride.fit run.tcx hike.gpx gym.csv --weight 72 --height 178 --age 27 --sex Male
+
+Files are read in chunks of CHUNK_SAMPLES samples (CSV with pandas' chunked
+reader, TCX and GPX with iterparse, FIT from a small block buffer) and each
+chunk is folded into per-day sums before the next is read, so a season of
+1 Hz data never sits in memory at once. Those sums (SessionDays) don't depend
+on the athlete, so the app caches them per file content hash; training
+energy comes from them with the athlete's weight, age and sex:
+
+- samples at or above EXERCISE_HR_BPM use Keytel et al.'s (2005)
+  heart-rate equation, minus the resting energy the plan already counts;
+- days without heart rate fall back to the calories the device reported for
+  its sessions (FIT session and TCX lap totals), also net of resting energy.
+"""
+import argparse
+import hashlib
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from .constants import SESSION_FILE_TYPES
+from .planner import estimate_bmr
+
+CHUNK_SAMPLES = 100_000
+MAX_GAP_SECONDS = 10  # longer gaps between samples are pauses and count for nothing
+EXERCISE_HR_BPM = 90  # below this a sample counts as rest (the equation isn't valid there)
+REST_FACTOR = 1.2  # maintenance over BMR with no training; the training levels start at 1.375
+# Keytel et al. (2005) kJ/min = a + b * HR + c * weight + d * age
+KEYTEL_MALE = (-55.0969, 0.6309, 0.1988, 0.2017)
+KEYTEL_FEMALE = (-20.4022, 0.4472, -0.1263, 0.0740)
+KJ_PER_KCAL = 4.184
+
+CSV_TIME_COLUMNS = ("timestamp", "time", "datetime", "date_time")
+CSV_HR_COLUMNS = ("heart_rate", "heartrate", "heart rate", "hr", "bpm")
+
+SessionDays = namedtuple(
+    "SessionDays", ["date", "seconds", "hr_seconds", "exercise_seconds", "exercise_beats", "device_kcal"])
+SessionDays.__doc__ = """Per-day sums over one or more session files, sorted by date.
+
+`seconds` is recorded time, `hr_seconds` the part with a heart rate,
+`exercise_seconds` the part at or above EXERCISE_HR_BPM and `exercise_beats`
+the heart rate summed over that part (bpm x seconds). `device_kcal` totals
+the session calories the files report.
+"""
+
+TrainingEstimate = namedtuple("TrainingEstimate", ["date", "kcal", "daily_kcal", "maintenance_factor",
+                                                   "unmeasured_days"])
+TrainingEstimate.__doc__ = """An athlete's training energy from SessionDays.
+
+`kcal` has one entry per day over the whole Monday-Sunday weeks the sessions
+fall in (rest days are 0) and `daily_kcal` is its mean, so a lone session
+is spread over its week rather than counted as a daily habit.
+`maintenance_factor` is training_expenditure()'s, in place of a TRAINING_LEVELS
+factor. `unmeasured_days` counts days with sessions but no heart rate or
+calories, which add nothing.
+"""
+
+
+# --- Reading ---
+def _epoch_seconds(values):
+    """Seconds since 1970 for ISO 8601 strings (zoned ones converted to UTC) or numbers taken as epoch seconds."""
+    import pandas as pd
+
+    values = pd.Series(values)
+    if values.dtype.kind in "if":
+        return values.to_numpy(dtype=float)
+    stamps = pd.to_datetime(values, utc=True, format="ISO8601").dt.tz_localize(None)
+    return stamps.to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+
+
+def _csv_chunks(source):
+    import pandas as pd
+
+    def wanted(column):
+        return column.strip().lower() in CSV_TIME_COLUMNS + CSV_HR_COLUMNS
+
+    with pd.read_csv(source, usecols=wanted, chunksize=CHUNK_SAMPLES) as reader:
+        for chunk in reader:
+            chunk.columns = [column.strip().lower() for column in chunk.columns]
+            time_column = next((column for column in CSV_TIME_COLUMNS if column in chunk), None)
+            if time_column is None:
+                raise ValueError(f"Session CSV needs a time column (one of {', '.join(CSV_TIME_COLUMNS)})")
+            hr_column = next((column for column in CSV_HR_COLUMNS if column in chunk), None)
+            heart_rate = chunk[hr_column].to_numpy(dtype=float) if hr_column else np.full(len(chunk), np.nan)
+            yield _epoch_seconds(chunk[time_column]), heart_rate, []
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _xml_chunks(source, point_tag, lap_tag=None):
+    """Trackpoint time and heart rate from TCX/GPX, removing each point once read."""
+    from xml.etree.ElementTree import iterparse
+
+    times, heart_rates, laps = [], array("d"), []
+    parents = []
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+        parents.pop()
+        name = _local_name(element.tag)
+        if name == point_tag:
+            time, heart_rate = None, np.nan
+            for child in element.iter():
+                child_name = _local_name(child.tag)
+                if child_name in ("Time", "time"):
+                    time = child.text
+                elif child_name in ("Value", "hr"):  # TCX HeartRateBpm/Value, GPX TrackPointExtension hr
+                    heart_rate = float(child.text)
+            if time is not None:
+                times.append(time.strip())
+                heart_rates.append(heart_rate)
+            parents[-1].remove(element)  # the point is always its parent's first child left
+        elif name == lap_tag:
+            calories = next((child.text for child in element if _local_name(child.tag) == "Calories"), None)
+            if calories is not None and element.get("StartTime"):
+                laps.append((element.get("StartTime"), float(calories)))
+            parents[-1].remove(element)
+        if len(times) >= CHUNK_SAMPLES:
+            yield _epoch_seconds(times), np.frombuffer(heart_rates), _lap_events(laps)
+            times, heart_rates, laps = [], array("d"), []
+    if times or laps:
+        yield _epoch_seconds(times), np.frombuffer(heart_rates), _lap_events(laps)
+
+
+def _lap_events(laps):
+    if not laps:
+        return []
+    starts = _epoch_seconds([start for start, _ in laps])
+    return list(zip(starts.tolist(), [calories for _, calories in laps]))
+
+
+# FIT: base type -> struct code; the messages and fields read below
+FIT_EPOCH = 631065600  # 1989-12-31T00:00:00Z
+FIT_TYPES = {0x00: "B", 0x01: "b", 0x02: "B", 0x83: "h", 0x84: "H", 0x85: "i", 0x86: "I", 0x88: "f",
+             0x89: "d", 0x0A: "B", 0x8B: "H", 0x8C: "I", 0x8E: "q", 0x8F: "Q", 0x90: "Q"}
+FIT_RECORD, FIT_SESSION = 20, 18
+FIT_TIMESTAMP, FIT_HEART_RATE, FIT_START_TIME, FIT_TOTAL_CALORIES = 253, 3, 2, 11
+FIT_FIELDS = {FIT_RECORD: (FIT_TIMESTAMP, FIT_HEART_RATE),
+              FIT_SESSION: (FIT_TIMESTAMP, FIT_START_TIME, FIT_TOTAL_CALORIES)}
+FIT_BLOCK_BYTES = 1 << 20
+
+
+def _fit_definition(body, architecture):
+    """(global message, struct, [wanted field numbers]) for a definition message's fields."""
+    order = ">" if architecture else "<"
+    message = struct.unpack(order + "H", body[:2])[0]
+    wanted = FIT_FIELDS.get(message, ())
+    codes, names = [], []
+    for offset in range(3, 3 + 3 * body[2], 3):
+        number, size, base_type = body[offset:offset + 3]
+        code = FIT_TYPES.get(base_type)
+        if number in wanted and code is not None and struct.calcsize(code) == size:
+            codes.append(code)
+            names.append(number)
+        else:
+            codes.append(f"{size}x")
+    return message, struct.Struct(order + "".join(codes)), names
+
+
+def _fit_chunks(source):
+    """Record time and heart rate, plus session calories, from a FIT file's messages."""
+    buffer, position = source.read(FIT_BLOCK_BYTES), 0
+
+    def take(size):
+        nonlocal buffer, position
+        if position + size > len(buffer):
+            buffer = buffer[position:] + source.read(max(FIT_BLOCK_BYTES, size))
+            position = 0
+            if size > len(buffer):
+                raise ValueError("FIT file ends mid-message")
+        position += size
+        return buffer[position - size:position]
+
+    header = take(1)[0]
+    header_rest = take(header - 1)
+    if header_rest[7:11] != b".FIT":
+        raise ValueError("Not a FIT file")
+    remaining = struct.unpack("<I", header_rest[3:7])[0]
+
+    definitions, developer_sizes = {}, {}
+    times, heart_rates, sessions = array("d"), array("d"), []
+    last_time = 0
+    while remaining > 0:
+        record_header = take(1)[0]
+        remaining -= 1
+        if record_header & 0x80:  # compressed timestamp header: data message with a 5-bit time offset
+            local, offset = (record_header >> 5) & 0x03, record_header & 0x1F
+            last_time += (offset - (last_time & 0x1F)) & 0x1F
+            compressed = True
+        elif record_header & 0x40:  # definition message
+            local = record_header & 0x0F
+            fixed = take(5)
+            body = fixed[2:] + take(3 * fixed[4])
+            remaining -= 5 + 3 * fixed[4]
+            developer = 0
+            if record_header & 0x20:
+                count = take(1)[0]
+                developer = sum(take(3 * count)[1::3])
+                remaining -= 1 + 3 * count
+            definitions[local] = _fit_definition(body, fixed[1])
+            developer_sizes[local] = developer
+            continue
+        else:
+            local, compressed = record_header & 0x0F, False
+        message, layout, names = definitions[local]
+        values = dict(zip(names, layout.unpack(take(layout.size))))
+        take(developer_sizes[local])
+        remaining -= layout.size + developer_sizes[local]
+        if FIT_TIMESTAMP in values and not compressed:
+            last_time = values[FIT_TIMESTAMP]
+        if message == FIT_RECORD:
+            heart_rate = values.get(FIT_HEART_RATE, 0xFF)
+            times.append(last_time + FIT_EPOCH)
+            heart_rates.append(np.nan if heart_rate in (0, 0xFF) else heart_rate)
+            if len(times) >= CHUNK_SAMPLES:
+                yield np.frombuffer(times), np.frombuffer(heart_rates), []
+                times, heart_rates = array("d"), array("d")
+        elif message == FIT_SESSION and values.get(FIT_TOTAL_CALORIES, 0xFFFF) != 0xFFFF:
+            start = values.get(FIT_START_TIME, values.get(FIT_TIMESTAMP, last_time))
+            sessions.append((start + FIT_EPOCH, float(values[FIT_TOTAL_CALORIES])))
+    yield np.frombuffer(times), np.frombuffer(heart_rates), sessions
+
+
+def session_chunks(source, name):
+    """Yield (epoch seconds, heart rate with NaN gaps, [(epoch seconds, session kcal)]) chunks.
+
+    `source` is a path or binary file object; `name` picks the format from
+    its suffix (SESSION_FILE_TYPES).
+    """
+    kind = Path(name).suffix.lower().lstrip(".")
+    if kind not in SESSION_FILE_TYPES:
+        raise ValueError(f"Unsupported session file: {name!r} (use one of {', '.join(SESSION_FILE_TYPES)})")
+    if kind == "csv":
+        return _csv_chunks(source)
+    if kind == "tcx":
+        return _xml_chunks(source, "Trackpoint", "Lap")
+    if kind == "gpx":
+        return _xml_chunks(source, "trkpt")
+    if isinstance(source, (str, Path)):
+        return _fit_file_chunks(source)
+    return _fit_chunks(source)
+
+
+def _fit_file_chunks(path):
+    with open(path, "rb") as source:
+        yield from _fit_chunks(source)
+
+
+# --- Aggregating ---
+def read_session_days(source, name):
+    """Per-day sums (SessionDays) for one session file, read chunk by chunk."""
+    totals = {}  # epoch day -> [seconds, hr_seconds, exercise_seconds, exercise_beats, device_kcal]
+    previous = None
+    for times, heart_rate, sessions in session_chunks(source, name):
+        if len(times):
+            # Each sample covers the time since the one before it, unless that gap is a pause
+            gaps = np.diff(times, prepend=times[0] if previous is None else previous)
+            seconds = np.where((gaps > 0) & (gaps <= MAX_GAP_SECONDS), gaps, 0.0)
+            previous = times[-1]
+            has_hr = ~np.isnan(heart_rate)
+            exercise = has_hr & (heart_rate >= EXERCISE_HR_BPM)
+            days, index = np.unique((times // 86400).astype(np.int64), return_inverse=True)
+            sums = [np.bincount(index, weights, len(days)) for weights in (
+                seconds, seconds * has_hr, seconds * exercise, np.where(exercise, heart_rate * seconds, 0.0))]
+            for day, values in zip(days.tolist(), zip(*(column.tolist() for column in sums))):
+                day_totals = totals.setdefault(day, [0.0] * 5)
+                for position, value in enumerate(values):
+                    day_totals[position] += value
+        for start, kcal in sessions:
+            totals.setdefault(int(start // 86400), [0.0] * 5)[4] += kcal
+    return _session_days(totals)
+
+
+def _session_days(totals):
+    days = sorted(totals)
+    columns = np.array([totals[day] for day in days], dtype=float).reshape(len(days), 5).T
+    return SessionDays(np.array(days, dtype="datetime64[D]"), *columns)
+
+
+def combine_session_days(session_days):
+    """One SessionDays summing several files' days."""
+    totals = {}
+    for days in session_days:
+        for day, *values in zip(days.date.astype(np.int64).tolist(), *(column.tolist() for column in days[1:])):
+            day_totals = totals.setdefault(day, [0.0] * 5)
+            for position, value in enumerate(values):
+                day_totals[position] += value
+    return _session_days(totals)
+
+
+def file_key(data):
+    """Cache key for a session file's bytes."""
+    return ("sessions", hashlib.sha1(data).hexdigest())
+
+
+# --- Energy ---
+def training_kcal(days, weight, height, age, sex):
+    """Training kcal for each day in `days`, net of the resting energy BMR already covers."""
+    a, b, c, d = KEYTEL_MALE if sex == "Male" else KEYTEL_FEMALE
+    rest_per_second = estimate_bmr(weight, height, age, sex) / 86400
+    heart_rate_kcal = ((a + c * weight + d * age) * days.exercise_seconds + b * days.exercise_beats) / 60 / KJ_PER_KCAL
+    heart_rate_kcal -= rest_per_second * days.exercise_seconds
+    device_kcal = days.device_kcal - rest_per_second * days.seconds
+    return np.maximum(np.where(days.hr_seconds > 0, heart_rate_kcal, device_kcal), 0.0)
+
+
+def training_expenditure(daily_kcal, bmr):
+    """(maintenance factor, maintenance kcal/day) for `daily_kcal` of training on top of REST_FACTOR x BMR.
+
+    The one mapping from measured training to daily expenditure, whether an
+    app wants it as a multiple of BMR or as kcal.
+    """
+    maintenance_factor = REST_FACTOR + daily_kcal / bmr
+    return maintenance_factor, maintenance_factor * bmr
+
+
+def estimate_training(days, weight, height, age, sex):
+    """A TrainingEstimate over the whole weeks (Monday to Sunday) covering the session days."""
+    if not len(days.date):
+        raise ValueError("No timed samples or session calories in these files")
+    first_monday = days.date[0] - (days.date[0].astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    offset = (days.date - first_monday).astype(np.int64)
+    kcal = np.zeros((offset[-1] // 7 + 1) * 7)
+    kcal[offset] = training_kcal(days, weight, height, age, sex)
+    daily_kcal = float(kcal.mean())
+    maintenance_factor, _ = training_expenditure(daily_kcal, float(estimate_bmr(weight, height, age, sex)))
+    return TrainingEstimate(
+        date=first_monday + np.arange(len(kcal)),
+        kcal=kcal,
+        daily_kcal=daily_kcal,
+        maintenance_factor=maintenance_factor,
+        unmeasured_days=int(((days.hr_seconds == 0) & (days.device_kcal == 0)).sum()),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Daily training energy from session files.")
+    parser.add_argument("files", nargs="+", help=f"session files ({', '.join(SESSION_FILE_TYPES)})")
+    parser.add_argument("--weight", type=float, required=True, help="kg")
+    parser.add_argument("--height", type=float, required=True, help="cm")
+    parser.add_argument("--age", type=float, required=True)
+    parser.add_argument("--sex", choices=["Male", "Female"], required=True)
+    args = parser.parse_args(argv)
+
+    days = combine_session_days(read_session_days(path, path) for path in args.files)
+    estimate = estimate_training(days, args.weight, args.height, args.age, args.sex)
+    print("date,training_kcal")
+    for day, kcal in zip(estimate.date.tolist(), estimate.kcal.tolist()):
+        print(f"{day},{kcal:.0f}")
+    print(f"{estimate.daily_kcal:.0f} kcal/day over {len(estimate.kcal)} days; maintenance factor "
+          f"{estimate.maintenance_factor:.2f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import hashlib
+import re
+from pathlib import Path
+
+# --- Asset Locations ---
+# Sources live in assets/; built files go to static/, which Streamlit serves at
+# app/static/ when server.enableStaticServing is on (see .streamlit/config.toml).
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SOURCE_DIR = ROOT_DIR / "assets"
+CSS_DIR = SOURCE_DIR / "css"
+STATIC_DIR = ROOT_DIR / "static"
+STATIC_URL = "app/static"
+
+LOGO_SOURCE = SOURCE_DIR / "logo.jpg"
+LOGO_WEBP_WIDTH = 500  # 2x the widest on-page rendering (250px in app_3)
+
+# Stylesheets merged, in order, into one minified file per app variant
+STYLESHEETS = {
+    "app_2": ["base.css", "red_headings.css"],
+    "app_3": ["base.css", "header_bar.css"],
+    "app_4": ["base.css", "header_bar.css", "hide_header.css"],
+    "app_5": ["base.css", "expander_buttons.css", "hide_header.css", "sidebar_toggle.css"],
+}
+
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _content_hash(data):
+    return hashlib.sha1(data).hexdigest()[:10]
+
+
+def _write_if_changed(path, data):
+    if not path.exists() or path.read_bytes() != data:
+        path.write_bytes(data)
+
+
+def _build_logo():
+    _write_if_changed(STATIC_DIR / "logo.jpg", LOGO_SOURCE.read_bytes())
+    webp_path = STATIC_DIR / "logo.webp"
+    if webp_path.exists() and webp_path.stat().st_mtime >= LOGO_SOURCE.stat().st_mtime:
+        return True  # up to date; don't pay for importing Pillow
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+    with Image.open(LOGO_SOURCE) as image:
+        if image.width > LOGO_WEBP_WIDTH:
+            height = round(image.height * LOGO_WEBP_WIDTH / image.width)
+            image = image.resize((LOGO_WEBP_WIDTH, height), Image.LANCZOS)
+        image.save(webp_path, "WEBP", quality=80, method=6)
+    return True
+
+
+def build_static():
+    """Build static/ from assets/ and return {name: versioned URL}."""
+    STATIC_DIR.mkdir(exist_ok=True)
+    urls = {}
+    for app_name, parts in STYLESHEETS.items():
+        css = "\n".join((CSS_DIR / part).read_text() for part in parts)
+        data = minify_css(css).encode("utf-8")
+        _write_if_changed(STATIC_DIR / f"{app_name}.min.css", data)
+        urls[app_name] = f"{STATIC_URL}/{app_name}.min.css?v={_content_hash(data)}"
+
+    logo_version = _content_hash(LOGO_SOURCE.read_bytes())
+    urls["logo.jpg"] = f"{STATIC_URL}/logo.jpg?v={logo_version}"
+    if _build_logo():
+        urls["logo.webp"] = f"{STATIC_URL}/logo.webp?v={logo_version}"
+    return urls
+
+
+# Built once per server process; every rerun only sends the short tags below
+ASSET_URLS = build_static()
+
+
+def stylesheet_tag(app_name):
+    return f'<link rel="stylesheet" href="{ASSET_URLS[app_name]}">'
+
+
+def logo_tag(style):
+    """<picture> tag for the logo, preferring the smaller WebP variant."""
+    img = f'<img src="{ASSET_URLS["logo.jpg"]}" alt="My Fight Camp Nutrition" style="{style}">'
+    if "logo.webp" not in ASSET_URLS:
+        return img
+    return f'<picture><source srcset="{ASSET_URLS["logo.webp"]}" type="image/webp">{img}</picture>'
@@ -0,0 +1,140 @@
+"""The five app variants as configurations of the shared page in fight_camp.app.
+
+Each entry script (app.py ... app_5.py) just calls fight_camp.app.run() with
+its variant name; everything that differed between the old scripts is here.
+"""
+
+# app_4.py training level -> (carb multiplier g/kg, training kcal/day)
+WEEK1_TRAINING_LEVELS = {
+    "Low (<5 hrs/week)": (2.0, 200),
+    "Medium (5-10 hrs/week)": (2.75, 400),
+    "High (>10 hrs/week)": (3.0, 600),
+}
+
+# Fight week guides: (heading, instruction lines, expander title, expander text)
+FIGHT_WEEK_GUIDES = {
+    "basic": [
+        ("Carbohydrate Management", "- 5-7 days out: Reduce carbs by 50-80g/day.", None, None),
+        ("Fibre Management", "- 3 days before weigh-in: Fibre <10g/day.", None, None),
+        ("Salt Management", "- 3 days before weigh-in: Salt 0.5-1g/day.", None, None),
+        ("Water Loading Strategy",
+         "- 4/3/2 days out: 100ml/kg body weight.\n- 1 day out: 15ml/kg body weight.\n"
+         "- 0 days out: minimal sips only.", None, None),
+        ("Post Weigh-In Rehydration",
+         "- 1L electrolyte solution immediately after weigh-in.\n- Small carb-rich meals every 1-2 hours.\n"
+         "- Avoid high-fat and high-fibre foods initially.", None, None),
+    ],
+    "explained": [
+        ("Carbohydrate Management", "- 5-7 days out: Reduce carbs by 50-80g/day.", "Why reduce carbs?",
+         "Reducing carbs helps deplete muscle glycogen stores and associated water, lowering body weight "
+         "quickly before the weigh-in."),
+        ("Fibre Management", "- 3 days before weigh-in: Fibre <10g/day.", "Why reduce fibre?",
+         "Reducing fibre minimizes undigested material and bulk in the gut, leading to lower body mass on "
+         "the scale."),
+        ("Salt Management", "- 3 days before weigh-in: Salt 0.5-1g/day.", "Why reduce salt?",
+         "Lowering salt intake reduces water retention, helping flush out excess body water before the "
+         "weigh-in."),
+        ("Water Loading Strategy",
+         "- 4, 3, 2 days out: 100ml/kg body weight.\n- 1 day out: 15ml/kg body weight.\n"
+         "- Weigh-in day: minimal sips only.", "Why water load?",
+         "Strategically overhydrating then cutting fluids trains the body to flush water rapidly, enhancing "
+         "acute weight loss before weigh-in."),
+        ("Post Weigh-In Rehydration",
+         "- 1L electrolyte solution immediately after weigh-in.\n- Small carb-rich meals every 1-2 hours.\n"
+         "- Avoid high-fat and high-fibre foods initially.", "Why structured rehydration?",
+         "Rehydration restores plasma volume, electrolyte balance, and muscle glycogen efficiently, setting "
+         "up optimal fight performance."),
+    ],
+}
+
+BUILT_FOR_FIGHTERS = "Built for serious fighters preparing for peak performance."
+MAKE_IT_SIMPLE = "Make cutting weight simple."
+
+# header:   "welcome" | "tagline" | "header_bar"
+# training: None | "hours" (calories from weekly hours) | "week1" (app_4 levels)
+#           | "planner" (planner.TRAINING_LEVELS)
+# plan:     "overview" | "hours" | "week1" | "weekly" (see PLANS in fight_camp.app)
+VARIANTS = {
+    "app": {
+        "page_config": False,
+        "header": "welcome",
+        "sex_options": ["Male", "Female", "Dev the Twat"],
+        "training": None,
+        "price_per_week": 10,
+        "plan": "overview",
+        "footer": BUILT_FOR_FIGHTERS,
+    },
+    "app_2": {
+        "header": "tagline",
+        "tagline": "Personalised nutrition, weight cut, and water loading strategy to make weight with ease.",
+        "height_input": True,
+        "weigh_in_log": True,
+        "training": "hours",
+        "session_import": True,
+        "plan": "hours",
+        "fight_week_guide": "basic",
+        "footer": BUILT_FOR_FIGHTERS,
+    },
+    "app_3": {
+        "header": "header_bar",
+        "header_logo": "width:250px; margin-bottom:10px;",
+        "tagline": "Welcome to a protoype of our app. It has been designed exclusively by fighters, for fighters! "
+                   "MY Fight Camp Nutrition is here to guide you through your weight cut by incorporating "
+                   "tried-and-tested weight loss principles to ensure you are in prime condition for competition!",
+        "height_input": True,
+        "training": "hours",
+        "session_import": True,
+        "plan": "hours",
+        "fight_week_guide": "explained",
+        "footer": MAKE_IT_SIMPLE,
+    },
+    "app_4": {
+        "header": "header_bar",
+        "tagline": "A prototype nutrition planner built for fighters!",
+        "height_input": True,
+        "training": "week1",
+        "plan": "week1",
+        "fight_week_guide": "explained",
+        "cache_panel": True,
+        "footer": MAKE_IT_SIMPLE,
+    },
+    "app_5": {
+        "header": "header_bar",
+        "banner_logo": "width:160px; margin-bottom: 10px;",
+        "tagline": "Make cutting weight simple: a prototype nutrition plan created by fighters, for fighters!",
+        "height_input": True,
+        "weigh_in_log": True,
+        "water_cut_default": 0.0,
+        "training": "planner",
+        "session_import": True,
+        "form": True,
+        "plan": "weekly",
+        "cache_panel": True,
+        "disclaimer": True,
+    },
+}
+
+# Settings a variant doesn't list
+DEFAULTS = {
+    "page_config": True,
+    "header_logo": None,
+    "banner_logo": None,
+    "tagline": None,
+    "sex_options": ["Male", "Female"],
+    "height_input": False,
+    "weigh_in_log": False,  # athlete ID input, weight defaults from and logs to fight_camp.weigh_ins
+    "water_cut_default": 3.0,
+    "form": False,
+    "session_import": False,  # training session upload (fight_camp.sessions) in place of the training inputs
+    "price_per_week": None,  # None: £5/week for 4-12 week camps, otherwise £120
+    "fight_week_guide": None,
+    "cache_panel": False,
+    "disclaimer": False,
+    "footer": None,
+}
+
+
+def get_variant(name):
+    if name not in VARIANTS:
+        raise ValueError(f"Unknown app variant: {name!r} (use one of {sorted(VARIANTS)})")
+    return dict(DEFAULTS, name=name, **VARIANTS[name])
@@ -0,0 +1,218 @@
+"""Weigh-in history per athlete, stored in SQLite.
+
+    python -m fight_camp.weigh_ins import scale_export.csv     # athlete,date,weight_kg
+    python -m fight_camp.weigh_ins recent --days 90
+
+The database runs in WAL mode so Streamlit sessions can read while an import
+is writing. Rows are keyed on (athlete, date) in a WITHOUT ROWID table, so
+one athlete's history is a contiguous range and roster-wide "last N days"
+reads come back in (athlete, date) order without a sort; a (date, athlete)
+index covers narrow windows such as a single day. Logging the same athlete
+and date again replaces that day's weight.
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+from .constants import MIN_CAMP_DAYS
+
+DEFAULT_DB_PATH = Path(os.environ.get(
+    "FCN_WEIGH_IN_DB", Path(__file__).resolve().parent.parent / "data" / "weigh_ins.sqlite3"))
+INSERT_BATCH_ROWS = 50_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS weigh_ins (
+    athlete TEXT NOT NULL,
+    date TEXT NOT NULL,  -- ISO YYYY-MM-DD, so text order is date order
+    weight_kg REAL NOT NULL,
+    PRIMARY KEY (athlete, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS weigh_ins_date ON weigh_ins (date, athlete);
+"""
+
+
+def _iso(day):
+    if isinstance(day, str):
+        return date.fromisoformat(day).isoformat()
+    if isinstance(day, datetime):
+        return day.date().isoformat()
+    return day.isoformat()
+
+
+class WeighInStore:
+    """Thread-safe access to one weigh-in database; each thread gets its own connection."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints; safe with WAL
+            self._local.connection = connection
+        return connection
+
+    # --- Writing ---
+    def record(self, athlete, day, weight_kg):
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO weigh_ins (athlete, date, weight_kg) VALUES (?, ?, ?)",
+                (str(athlete), _iso(day), float(weight_kg)),
+            )
+
+    def bulk_insert(self, rows):
+        """Insert (athlete, date, weight_kg) rows; one transaction per INSERT_BATCH_ROWS rows.
+
+        Returns the number of rows written.
+        """
+        written = 0
+        rows = iter(rows)
+        connection = self._connection()
+        while True:
+            batch = [(str(athlete), _iso(day), float(weight)) for athlete, day, weight in islice(rows, INSERT_BATCH_ROWS)]
+            if not batch:
+                if written:
+                    # Refresh planner statistics so roster-wide range queries skip-scan the
+                    # primary key in (athlete, date) order instead of sorting the date index
+                    connection.execute("PRAGMA analysis_limit=1000")
+                    connection.execute("ANALYZE weigh_ins")
+                return written
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO weigh_ins (athlete, date, weight_kg) VALUES (?, ?, ?)", batch)
+            written += len(batch)
+
+    def import_csv(self, path):
+        """Bulk insert a scale export with athlete, date and weight_kg columns."""
+        with open(path, newline="", encoding="utf-8") as handle:
+            reader = csv.DictReader(handle)
+            return self.bulk_insert((row["athlete"], row["date"], row["weight_kg"]) for row in reader)
+
+    # --- Reading ---
+    def history(self, athlete, start=None, end=None):
+        """[(date, weight_kg)] for one athlete, oldest first, optionally within [start, end]."""
+        return [
+            (date.fromisoformat(day), weight)
+            for day, weight in self._connection().execute(
+                "SELECT date, weight_kg FROM weigh_ins WHERE athlete = ? AND date BETWEEN ? AND ? ORDER BY date",
+                (str(athlete), _iso(start) if start else "", _iso(end) if end else "9999-12-31"),
+            )
+        ]
+
+    def latest(self, athlete):
+        """(date, weight_kg) of the athlete's most recent weigh-in, or None."""
+        row = self._connection().execute(
+            "SELECT date, weight_kg FROM weigh_ins WHERE athlete = ? ORDER BY date DESC LIMIT 1",
+            (str(athlete),),
+        ).fetchone()
+        return (date.fromisoformat(row[0]), row[1]) if row else None
+
+    def recent(self, days, today=None, athletes=None):
+        """Columns {"athlete", "date", "weight_kg"} for the last `days` days, by athlete then date.
+
+        Covers the whole roster unless `athletes` is given. Dates stay ISO
+        strings; the caller converts only what it displays.
+        """
+        if today is None:
+            today = datetime.today().date()
+        start = _iso(today - timedelta(days=days - 1))
+        end = _iso(today)
+        if athletes is None:
+            rows = self._connection().execute(
+                "SELECT athlete, date, weight_kg FROM weigh_ins WHERE date BETWEEN ? AND ? ORDER BY athlete, date",
+                (start, end),
+            ).fetchall()
+        else:
+            query = ("SELECT athlete, date, weight_kg FROM weigh_ins WHERE athlete = ? AND date BETWEEN ? AND ? "
+                     "ORDER BY date")
+            connection = self._connection()
+            rows = [row for athlete in sorted(map(str, athletes))
+                    for row in connection.execute(query, (athlete, start, end))]
+        athlete_ids, dates, weights = zip(*rows) if rows else ((), (), ())
+        return {"athlete": list(athlete_ids), "date": list(dates), "weight_kg": list(weights)}
+
+    def latest_by_athlete(self, since=None):
+        """Columns {"athlete", "date", "weight_kg"} of each athlete's latest weigh-in, by athlete.
+
+        One pass over the primary key; with `since`, athletes whose latest
+        weigh-in is older are left out.
+        """
+        # SQLite takes the bare columns of a MAX() aggregate from the row holding the maximum
+        rows = self._connection().execute(
+            "SELECT athlete, MAX(date), weight_kg FROM weigh_ins WHERE date >= ? GROUP BY athlete ORDER BY athlete",
+            (_iso(since) if since else "",),
+        ).fetchall()
+        athlete_ids, dates, weights = zip(*rows) if rows else ((), (), ())
+        return {"athlete": list(athlete_ids), "date": list(dates), "weight_kg": list(weights)}
+
+    def athletes(self):
+        return [row[0] for row in self._connection().execute("SELECT DISTINCT athlete FROM weigh_ins ORDER BY athlete")]
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def current_camp(history, max_gap_days=MIN_CAMP_DAYS):
+    """The weigh-ins in `history` after its last gap of more than `max_gap_days` days.
+
+    A gap that a whole camp fits in means the weigh-ins before it belong to
+    an earlier camp.
+    """
+    start = 0
+    for index in range(1, len(history)):
+        if (history[index][0] - history[index - 1][0]).days > max_gap_days:
+            start = index
+    return history[start:]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The process-wide store at DEFAULT_DB_PATH, opened on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = WeighInStore()
+        return _store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the weigh-in history database.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="bulk insert a CSV of athlete,date,weight_kg")
+    import_parser.add_argument("csv")
+    recent_parser = commands.add_parser("recent", help="summarize the last N days across the roster")
+    recent_parser.add_argument("--days", type=int, default=90)
+    args = parser.parse_args(argv)
+
+    store = WeighInStore(args.db)
+    started = time.perf_counter()
+    if args.command == "import":
+        written = store.import_csv(args.csv)
+        print(f"Imported {written:,} weigh-ins in {time.perf_counter() - started:.2f}s")
+    else:
+        recent = store.recent(args.days)
+        print(f"{len(recent['date']):,} weigh-ins from {len(set(recent['athlete'])):,} athletes "
+              f"in the last {args.days} days ({time.perf_counter() - started:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
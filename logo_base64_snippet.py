@@ -1 +0,0 @@
-logo_base64 = "/9j/4AAQSkZJRgABAQEAwADAAAD/2wBDAAMCAgMCAgMDAwMEAwMEBQgFBQQEBQoHBwYIDAoMDAsKCwsNDhIQDQ4RDgsLEBYQERMUFRUVDA8XGBYUGBIUFRT/2wBDAQMEBAUEBQkFBQkUDQsNFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBT/wAARCADgAiYDASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwD8qqKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAPY/wBlX9mjVv2rfidJ4K0XWLLRLxLCW/Nzfo7R7UZFK4UE5O8flWL+0J8BPE37NvxR1PwP4pjQ3tptkgu4AfJu4G5SaMkAlTyPYgg8ivqD/gjf/wAnbXX/AGLl5/6Mhr9Tvi9+zn8MP2nvFfhrV/EEEOqal4G1Y71hI+ZgiubS4BHKEtFJtPt2Y51qQs6TT0au/Tmav8tP+HM6c7+0Uuj09bJ2+ev/AAx+OXir/gnf488D/stN8a9f1PT9Ms/s8F3/AGBLHJ9sEU0yRxluNqkh1fBOQDg88V8q1++P/BSDXNO8R/sG/EC/0m7hvrCT7Ikc8ByjbL+FG2nuAykZHHFfgdXKp81WaSsk9PuOjk5aUW93e/4BXrH7MvwDb9pT4n2/ga28Uab4X1O8gkkspNUR2juZEGTEu0cMV3MM9dpHXFeT1o+HPEWo+EfEGna3pF3JYarp1xHdWt1CcPFKjBlYH1BArpp8vMufYwnzcr5dz1j9p79lHxf+y38TLbwdr3laq99DHPp2oaejmK9VjtIQEZ3K/wApXr07EV6h8cf+Cc3if9nj4G2/xE8aeMdD0+e4SBY/D6pK129xKAfs4ONpZRuLHoAhr9QfgR4k+Hv7fHwt+GvxL8QadbzeJfBmofaZ7cEAWeoJHhwwPWJiY5lH+yn90ivy5/4KPftYv+0v8a5rPR7ppPA3hlpLLSlU/JcvnEtzjvvIAX/ZVfU1hU5qf7l/Hffpy9H872+57XNqfLU/er4Utv73b8L/AHrsfJdFFFWQFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAfZn/AASh8eeGfhz+1Bcar4r8RaT4Y0s6BdQi+1m+itIDIZISE3yMq7iAcDOeDTv2rf2uPGXgX9qT4xt8J/iIIvC3iae3E9xok8F1bXQFpHGWjlAYKwyy74yDx14GPjGiip+8cb9E4+qbvqEPcUrdWn6WVj9UfHPxm8A3v/BI6w8Hw+OfDc/i9dIso20FNXt2vw630bMpgD+ZkKCxGOAM1+V1FFEveqzq/wAzuEfdpRpfy/8AA/yCiiigD9TP+CTvxi8A/Dn4B/EnT/Fnjjw34Xv7vVGkt7XWdWt7SWZfsqruRJHUsM8ZA61+W1wQ1xIQcgsf50yiifv1fa+SX3BD3Kfs/Nv7wooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooA674UfCnxP8bvHum+DPBunLqviPURKba0aeOAP5cTyv88jKowiMeSM4x1r6E/4dX/tM/wDRPof/AAe6f/8AH6j/AOCWf/J9Hw5/3NT/APTbdV+/VAH4E/8ADq/9pn/on0P/AIPdP/8Aj9H/AA6v/aZ/6J9D/wCD3T//AI/X77UUAfgT/wAOr/2mf+ifQ/8Ag90//wCP0f8ADq/9pn/on0P/AIPdP/8Aj9fvtRQB+BP/AA6v/aZ/6J9D/wCD3T//AI/R/wAOr/2mf+ifQ/8Ag90//wCP1++1FAH4E/8ADq/9pn/on0P/AIPdP/8Aj9H/AA6v/aZ/6J9D/wCD3T//AI/X77UUAfgT/wAOr/2mf+ifQ/8Ag90//wCP0f8ADq/9pn/on0P/AIPdP/8Aj9fvtRQB+BP/AA6v/aZ/6J9D/wCD3T//AI/R/wAOr/2mf+ifQ/8Ag90//wCP1++1FAH4E/8ADq/9pn/on0P/AIPdP/8Aj9H/AA6v/aZ/6J9D/wCD3T//AI/X77UUAfz5eMP+Cbf7QvgLwnrXiXXPA8Nno2j2U2oXtwNZsZDFBEheRtqzFmwqk4AJOOBXzJX9J37XH/Jqvxj/AOxP1f8A9I5a/mxoAKKKKACiivRfgn+zz8Qf2hvER0bwF4autcnjK/aLhQI7a1U9GlmYhEHBwCcnBwCaAPOqltLOfULqK2tYJLm4lYLHDChZ3Y9AAOSa/Xj4B/8ABGDwrodva6j8WvEdx4l1Hh30XQ3a2slP9xpiBLIPdfLr7y+GnwN+H3wcsUtfBPg3RvDSKuwy2FmiTSD/AG5cb3PuzE0AfgX4F/YN+P8A8Rlik0j4W67FBKAVm1WJdOQqf4gbhkyPpXu3hn/gjP8AHLWUjk1LVPCOgKeWjudQmllX2xFCyk/8Cr9t6KAPyT0n/gh34gmjU6n8WdNs5P4ltNFknA+haZM/lXTWf/BDfTETF18YbuZ/WHw8sY/I3LV+o1FAH5gt/wAEOtB/h+LWog++iRn/ANrVkal/wQ1PLaf8ZM+kdz4b/wDZluv6V+qtFAH47eIP+CI/xEtYidD+IfhnUZOy38FxaA/iqy15F4v/AOCT/wC0V4WilltfDWm+JI4+SdH1WEkj1CymNj9AM+1fvNRQB/MZ4++CXxB+FcjJ4w8E694aCnHmanp0sMbf7rsu1h7gmuKr+qS4t4ruCSCeJJoZFKPHIoZWU8EEHqK+YfjX/wAE2/gT8ao7ieXwnH4S1mQEjVPDGLJgx7tEAYX56kpk+ooA/n5or7b/AGkv+CUfxU+Ctve614VKfEfwxADI0mmRFNQhQd3tsktj1jZ+5IUV8SsrRsyspVlOCpGCD6UAJRRRQAUUUUAfRnw1/wCCe/x4+L3gfSfGHhTwZFqXh/VI2ltLptXsoTIquyE7HmVh8ysOQOldN/w6v/aZ/wCifQ/+D3T/AP4/X6x/8E4v+TJ/hZ/14z/+lU1fSdAH4E/8Or/2mf8Aon0P/g90/wD+P0f8Or/2mf8Aon0P/g90/wD+P1++1FAH4E/8Or/2mf8Aon0P/g90/wD+P0f8Or/2mf8Aon0P/g90/wD+P1++1FAH4E/8Or/2mf8Aon0P/g90/wD+P14P8ZPgf43/AGf/ABgfC/j3QpdB1nyUuUieRJUlibo6SRsyOMgglScFSDyCK/pur5//AGzv2R9C/a2+Fsui3Xlaf4p08PPoesMvNtMRzG5HJifADD2DAZUUAfzr0Vv+PvAevfDDxlq/hXxNp0uk67pU7W11aTDlGHcHoykYYMOCCCCQawKACiiigAooooAK+mPBX/BOD9oL4h+ENG8T6D4IivdE1i0ivrK4Os2MZkhkUMjbWmDLkEcEA18z1/SJ+xr/AMmm/B//ALFXTv8A0nSgD8bf+HV/7TP/AET6H/we6f8A/H6P+HV/7TP/AET6H/we6f8A/H6/faigD8Cf+HV/7TP/AET6H/we6f8A/H6P+HV/7TP/AET6H/we6f8A/H6/faigD8Cf+HV/7TP/AET6H/we6f8A/H6+U7yzl0+8ntZ12TwSNFIuQcMpwRke4r+qKv5bvGH/ACNut/8AX9P/AOjGoAyKKKKACiiigAooooAKKKKAPq7/AIJZ/wDJ9Hw5/wBzU/8A023Vfv1X4C/8Es/+T6Phz/uan/6bbqv36oAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAPJf2uP8Ak1X4x/8AYn6v/wCkctfzY1/Sd+1x/wAmq/GP/sT9X/8ASOWv5saACiivqz/gnv8Asbz/ALVnxUM2swyxfD7QGSfWLhSU+0seY7RGHO58EsR91AeQSuQDq/2Df+Cc+s/tOTweMPF7XGgfDSGUhZI/ludWZThkgz92MEENLjqCq5OSv7VfDj4ZeFfhD4Ts/DPg3QrPw/odqP3dpZptBPd2PV3OOWYlj3Jra0XRrDw7pFlpWl2cGn6bZQpb21pbRhIoY1AVUVRwAAAABV2gAooooAKKKKACiiigAooooAKKKKACiiigAr45/bS/4Jw+Df2l9PvNf8Nw2nhH4kANIupQx7LfUW/uXSqOSf8AnqBuHfeABX2NRQB/L78Svhr4l+EPjbVPCXi3SptG17TZPLuLWbH1DKw4ZGGCGBIIIIrma/fX/goT+xfY/tTfDOXUtGtIoviRoMDSaTdDCm8jGWazkPdW52E/dc9QGfP4IXlncadeT2l1BJbXUEjRSwzKVeN1OGVgeQQQQQaAIaKKKAP6Ff8AgnF/yZP8LP8Arxn/APSqavpOvmz/AIJxf8mT/Cz/AK8Z/wD0qmr6ToAKKKKACiiigAooooA+LP8Ago5+wvB+0x4NPi3wpaRxfEzRID5IXC/2rbrkm2c/3xyY2PclTw2V/C+8s59Pu57W6gktrqB2ilhmQo8bqcMrKeQQQQQa/qjr8xf+Cpn7Bf8AwkdrqPxp+H2nZ1W3QzeJdJtU/wCPmNRzeRqP41A/eAfeUb+obcAfkjRRRQAUUUUAFf0ifsa/8mm/B/8A7FXTv/SdK/m7r+kT9jX/AJNN+D//AGKunf8ApOlAHslFFFABRRRQAV/Ld4w/5G3W/wDr+n/9GNX9SNfy3eMP+Rt1v/r+n/8ARjUAZFFFFABRRRQAUUUUAFFFFAHW/Cn4reKPgn4803xl4N1IaR4j04Si1vDbxThPMiaJ/kkVlOUdhyDjORzX0F/w9N/aa/6KLH/4IdO/+R6+UKKAPq//AIem/tNf9FFj/wDBDp3/AMj0f8PTf2mv+iix/wDgh07/AOR6+UKKAPq//h6b+01/0UWP/wAEOnf/ACPR/wAPTf2mv+iix/8Agh07/wCR6+UKKAPqLVv+CnH7SusW6wy/EuaBVffutNKsYGzgjBZIAcc9OnSsn/h4l+0b/wBFV1b/AL82/wD8br5zooA+jP8Ah4l+0b/0VXVv+/Nv/wDG6P8Ah4l+0b/0VXVv+/Nv/wDG6+c6KAPoz/h4l+0b/wBFV1b/AL82/wD8bo/4eJftG/8ARVdW/wC/Nv8A/G6+c6KAPoz/AIeJftG/9FV1b/vzb/8Axuj/AIeJftG/9FV1b/vzb/8AxuvnOigD6M/4eJftG/8ARVdW/wC/Nv8A/G6P+HiX7Rv/AEVXVv8Avzb/APxuvnOigD3rxN+3d8e/GXhzVNA1r4lanf6PqlrLZXlrJFAFmhkQo6HEYOCpI4PevBaKKAJrGyuNSvLe0tYXuLq4kWKKGNSzO7HCqB3JJAr+jz9kT9n2x/Zn+A3hzwXbxp/aaRC81e4XH+kX0gBmbPcAgIv+zGtfjV/wTD+FK/FT9sHwl9ohE+neHEl8QXKsMgeRgQn8J5ID+Ffv3QAUUUUAFFFFABXKfE34qeEvg14RuvE/jTXbTw9oltw91dN95j0RFGWdzg4VQSccCrHxG+IGi/CnwJrvi/xHdfY9E0a0e8uperbVH3VHdmOFVe5IHev55f2rv2qvFn7V3xJufEOvTyWujW7vHo+ho+YbCAngAdGkYAF36sfRQqgA+7fjZ/wWuW3ubix+FHgmO5jRiqaz4oZgrgcZW2iYHB6gtID6qOlfMHir/gqt+0f4kmLW/jGz8Pwk58jStItgv/fUqO//AI9XyNRQB9N2n/BSz9pWzmEsfxQu2YdptNspF/JoCK9S+H//AAWO+N/hi4hXxHa+HvGVoD+9+1WX2Sdh/svCVRT7mNvpXwlRQB+8/wCzD/wU6+Fn7RN/aaDfmXwF4wuCEi0zV5la3uHPRILkAKzHgBXCMTwAa+wa/lXBIORwa/W7/gnF/wAFH9OvfClx4B+M3iq10290eESaV4k1m5WNbq3BC+RNIx5lTIKsTllznlcsAfp1RXi//DaXwG/6K/4N/wDBzB/8VR/w2l8Bv+iv+Df/AAcwf/FUAe0UV4v/AMNpfAb/AKK/4N/8HMH/AMVR/wANpfAb/or/AIN/8HMH/wAVQB7RX4q/8Fe/2bY/hl8ZLL4kaNbiLRPGm83kca4WHUYwPMPt5qkP6lhKa/UL/htL4Df9Ff8ABv8A4OYP/iq+bv8AgoV8Yvgb8ev2WPFWi6Z8TvCWp+ItO8vV9Jt7fVYXle4hPKIobJZ4mlQAdS4oA/FCiiigD+hX/gnF/wAmT/Cz/rxn/wDSqavpOvmz/gnF/wAmT/Cz/rxn/wDSqavpOgAooooAKKKKACivmj9ln9snSPjr42+IHw+1Uw6b458J61f2gtlOFv7KK5eOOeMH+JQFV17HDDhsL9L0AFIyhlIIyDwQaWigD8Wf+CnH7Bp+CuvXHxQ8B6fjwFqk+dR0+3T5dHuXPUAfdgkY/L2Rjt4BQV+ftf1L+IvD2meLNB1DRdZsYNT0nUIHtrqzuUDxzROCGRgeoIJr8Df29v2LNS/ZL+I3m6ck998PNalZ9H1F8sYT1NrM3/PRB0J++oyOQwUA+WqKKKACv6RP2Nf+TTfg/wD9irp3/pOlfzd1/SJ+xr/yab8H/wDsVdO/9J0oA9kooooAKKKKACv5bvGH/I263/1/T/8Aoxq/qRr+W7xh/wAjbrf/AF/T/wDoxqAMiiiigAooooAKKKKACiiigD1n9lX4Ep+0t8d/Dfw6k1pvDy6wLonUVtftJi8m2ln/ANXvTOfK2/eGM55xiv0D/wCHGtp/0Wab/wAJkf8AyXXyj/wSz/5Po+HP+5qf/ptuq/fqgD8s/wDhxraf9Fmm/wDCZH/yXR/w41tP+izTf+EyP/kuv1MooA/LP/hxraf9Fmm/8Jkf/JdH/DjW0/6LNN/4TI/+S6/UyigD8sm/4IaWvb4zTD6+GR/8l0n/AA4zt/8Aos8v/hMD/wCS6/U6igD8sf8Ahxnb/wDRZ5f/AAmB/wDJdH/DjO3/AOizy/8AhMD/AOS6/U6igD8sf+HGdv8A9Fnl/wDCYH/yXR/w4zt/+izy/wDhMD/5Lr9TqKAPyx/4cZ2//RZ5f/CYH/yXR/w4zt/+izy/+EwP/kuv1OooA/LH/hxnb/8ARZ5f/CYH/wAl18D/ALWn7Pq/sv8Axu1f4fJrp8SLYQW839oNafZS/mxLJjy974xux97nFf0jV+DH/BWL/k9nxb/146d/6SR0AfH1FFFAH6g/8EPPCkdx4k+K/iZ1/fWlpYadE2P4ZXmkkH5wR/nX6z1+an/BEK2Rfhf8TLgD97JrNtGx9lgJH/oRr9K6ACiiigAooooA/Mf/AILWfGifSfCfgr4X2Fw8Q1eV9Z1NEON8MR2QI3qpkMjY9YVNfkfX3N/wWN1WfUP2uobeVsxWPhyyghHopkmkP/j0jV8M0AFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFAH9Cv/AATi/wCTJ/hZ/wBeM/8A6VTV9J182f8ABOL/AJMn+Fn/AF4z/wDpVNX0nQAUUUUAFFFFAH833xN+IOv/AAq/a98deLPC+oy6Vr2leMdTuLW6i6qwu5QQR0ZWBKsp4IJB4NfuP+xx+1loH7Wvwrg1+x8qw8R2O231zRlbLWk5H3lzyYnwWRvYg8q1fgt+0h/ycR8Uv+xq1T/0rlq9+zX+0V4n/Zh+KmneM/DUu8x/ub/TpHIhv7UkF4X+uAQ2PlYKe1AH9KtFcH8EPjT4Y/aB+GukeNvCV59q0rUE+aNsCW1mH34JVH3XU8Ed+CMggnvKACuK+Mnwg8M/Hb4dax4K8W2IvtH1KLa2MCSCQcpNE2PldDgg+2DkEg9rRQB/Np+1F+zX4m/ZZ+Kl/wCEPEKGe35n0zVUQrFqFqSQsq+h7MuflYEcjBPkVf0dftcfss+Hf2sPhXdeGNXCWWsW2640bWAmZLG5xwfUxtgK6dxg8Mqkfz3fFD4Y+I/g3481jwd4r099M13SpjDPC3Knurof4kZSGVhwQQaAOWr+kT9jX/k034P/APYq6d/6TpX83df0ifsa/wDJpvwf/wCxV07/ANJ0oA9kooooAKKKKACv5bvGH/I263/1/T/+jGr+pGv5bvGH/I263/1/T/8AoxqAMiiiigAooooAKKKKACiiigD6u/4JZ/8AJ9Hw5/3NT/8ATbdV+/VfgL/wSz/5Po+HP+5qf/ptuq/fqgAooooAKKKKACivhz/gr5418Q+A/wBmfw9qHhrXtT8PX8niy1ge60q8ktZWjNpeMULRsCVJVTjplR6V+P3/AA0f8Wv+io+NP/Cgu/8A45QB/TJRX8zf/DR/xa/6Kj40/wDCgu//AI5R/wANH/Fr/oqPjT/woLv/AOOUAf0yUV/M3/w0f8Wv+io+NP8AwoLv/wCOUf8ADR/xa/6Kj40/8KC7/wDjlAH9MlFfzN/8NH/Fr/oqPjT/AMKC7/8AjlH/AA0f8Wv+io+NP/Cgu/8A45QB/TJX4Mf8FYv+T2fFv/Xjp3/pJHXgX/DR/wAWv+io+NP/AAoLv/45XHeJPFGteMtWk1TX9Xv9c1OUKsl7qVy9xM4UYUF3JYgAADngCgDMooooA/Wv/gh3rAm8JfFrSs8219p11j/rpHOv/tGv09r8Xv8Agi34+j0H9obxR4XnmEUfiDQmkhQn/WT28quq/Xy3nP8AwE1+0NABRRRQAUUUUAfjN/wWr8DzaT8fPB3ilYWSy1rQBa+bjh57eeTfz6hJoa/PCv3/AP8Ago9+zPP+0l+zxfQ6NbtP4t8NyHV9JijXL3BVCJbce8iZwB1dI+2a/AF0aN2R1KOpwVYYIPpQAlFFFABRRRQAUUV7B+zd+yn4/wD2qvEGqaV4GsrZzpduLi7vNQmMNtEGbaiFwp+dvmIXHIRj2oA8for7i/4c6/H7+94V/wDBq/8A8ao/4c6/H7+94V/8Gr//ABqgD4dor7i/4c6/H7+94V/8Gr//ABqj/hzr8fv73hX/AMGr/wDxqgD4dor7i/4c6/H7+94V/wDBq/8A8armfid/wS7+Mvwj+H+veMvEM/hmHRdFtHvLpodTZ5Cqj7qr5YyxOABnkkUAfIdFFFAH9Cv/AATi/wCTJ/hZ/wBeM/8A6VTV9J182f8ABOL/AJMn+Fn/AF4z/wDpVNX0nQAUUUUAFFFFAH8zn7SH/JxHxS/7GrVP/SuWvOq9F/aQ/wCTiPil/wBjVqn/AKVy151QB9N/sJ/tmar+yT8ShJdNPf8AgLWHSLW9LQ5KjotzEP8AnqgPT+Ncqf4Sv78+GPE2leNPDum69od/Dqmj6jAl1aXls26OaNhlWB+hr+Wuvvj/AIJl/t4N8C/EUHw28c35Hw+1af8A0K9uH+XR7pz1JPSByfm7Kx38AvkA/bCikVhIoZSGVhkEHIIpaACvkP8A4KFfsQWf7VXgP+2dAhhtfiVocLHTrg4QX8QyxtJW9CclGP3WPYM1fXlFAH8sOraVe6Fql3puo2s1jqFnM9vcWtwhSSGRSVZGU8hgQQQfSv6Ov2Nf+TTfg/8A9irp3/pOlfIv/BUT9gv/AIWRpd78Xvh/p27xXYw79d0u2T5tSgQf69FHWZFHI/jUcfMoDfXX7Gv/ACab8H/+xV07/wBJ0oA9kooooAKKKKACv5bvGH/I263/ANf0/wD6Mav6ka/lu8Yf8jbrf/X9P/6MagDIooooAKKKKACiiigAooooA+rv+CWf/J9Hw5/3NT/9Nt1X79V+Av8AwSz/AOT6Phz/ALmp/wDptuq/fqgAooooAKKKKAPgP/gtP/yar4a/7HG0/wDSK9r8U6/az/gtP/yar4a/7HG0/wDSK9r8U6ACiiigAooooAKKKKACiiigAooooA9I/Zw+Lk3wI+Ongrx5ErvHouopLcxx/ektmzHOg92ieQfjX9K2l6paa5pdnqNhcJd2N5Clxb3ERyskbqGVge4IIP41/LDX7K/8Ejv2tIPH3w9/4VB4jv8A/ipvDcRfR2mbm704f8s1J6tCTjH/ADzKYGEYgA/ROiiigAooooAK/Nj9vr/gl3J8TtY1H4jfCKG3t/Et0zXGq+GndYor+Q8tNAxwqSk8srEKx5yGzu/SeigD+XDxf4L1/wCH+vXGieJtFv8AQNXtztlstRt3glX32sAce/Q1jV/UD48+GPhD4paWNN8YeGNJ8T2KnKwatZx3CofVd4O0+4wa+e/FX/BL/wDZw8UzGb/hAf7ImJyX0rUrqBT7bPMKD8FFAH4BUV+71p/wST/Zztpg8nh7WLpf+ec2szhf/HSD+teqfD/9hf4CfDG4hudB+GGhi6hO6O41KN9QkRv7ytcNIQfcUAfip+zH+wr8UP2oNUtZNG0iXRPCjN+/8T6pE0doqg8+V3nf/ZTIzjcVHNfuh+zj+zr4S/Zh+Gtn4O8JW7eSrefe38+DPfXBADTSEdzgAAcKAAK9PjjWGNURQiKNqqowAB0AFOoAKKKKACiiigAr88v+Cy3xwTwh8E9F+HFjchdT8WXguLyJW+YWNuwfkdt03lYPfy3HrX3p4x8YaP8AD/wrq3iTxBfRaZoul2z3d3dzHCxxoMk+59AOSSAOTX86H7WX7Ql/+058cvEHji6WW3sJ3FtpdlKcm1so8iJPQE5Ltjje7UAeP0UUUAf0K/8ABOL/AJMn+Fn/AF4z/wDpVNX0nXzZ/wAE4v8Akyf4Wf8AXjP/AOlU1fSdABRRRQAUUUUAfzOftIf8nEfFL/satU/9K5a86r0X9pD/AJOI+KX/AGNWqf8ApXLXnVABRRRQB+s//BLD9vL+2rfTvgp8QdR/4mEKiHwxq10/+vQDiykY/wAaj/Vk9QNnUIG/UGv5XLW6msbqG5tppLe4hdZIpomKujA5DKRyCCM5FfuZ/wAE4f26IP2lfBy+EPFt3HH8S9EgHms5C/2tbrgC4Qf89BwJFHchhwxCgH2vRRRQAVW07TbTR7GCysbaGzs4FCRW9ugSONR0VVHAA9BVmigAooooAKKKKACv5bvGH/I263/1/T/+jGr+pGv5bvGH/I263/1/T/8AoxqAMiiiigAooooAKKKKACiiigD6u/4JZ/8AJ9Hw5/3NT/8ATbdV+/VfgL/wSz/5Po+HP+5qf/ptuq/fqgAooooAKKKKAPgP/gtP/wAmq+Gv+xxtP/SK9r8U6/az/gtP/wAmq+Gv+xxtP/SK9r8U6ACiiigAooooAKKKKACiiigAooooAK3vAfjrXfhn4x0jxT4Z1GXStd0q4W5tLuHqjj1B4KkZBU8EEggg1g0UAf0H/sTftueGf2tvBMamS30jx/p8I/tfQd+M4wDcQZ5aFjj1KE7W/hZvpmv5cfBvjTXfh54n0/xF4a1W60TXNPlE1tfWchSSNvY9wRkEHggkEEGv1k/ZM/4K+aB4otbXw78a0j8O60u2OPxNZwk2Vz2zPGoJhY8ZZQUOSf3YGKAP0qorP0HxBpfirR7XVtF1G01fS7pPMt72xnWaGVf7yupIYe4NaFABRRRQAUUUUAFFFFABRRRQAUUUUAFVdU1Sy0PTbrUdRu4LCwtYmmuLq6kEcUMajLO7EgKoAJJPArxn9of9sz4V/szadO3i3xHDLrapuh8O6ayz6hMSOB5YP7sH+9IVX37V+N/7YH/BQnx9+1bJJo5UeFPAaS74tAspSxuMHKtcyceaQeQuAgODtyN1AHpH/BSL/goCf2htUk+H3gO6kj+HGnzhrm8XKNrM6HIcg8iFCMqp+8RuPRQvwfRRQAUUUUAf0K/8E4v+TJ/hZ/14z/8ApVNX0nXzZ/wTi/5Mn+Fn/XjP/wClU1fSdABRRRQAUUUUAfzOftIf8nEfFL/satU/9K5a86r0X9pD/k4j4pf9jVqn/pXLXnVABRRRQAVveA/Heu/DHxjpPinwzqM2k67pU63NpdwnlGHYjoVIyCp4IJBBBNYNFAH9E/7F/wC1xoX7W3wti1m28mw8U6eEg1zR1bm3mI4kQHkxSYJU+xUklTX0DX80v7Of7QXij9mf4paZ418Lz/vrc+VeWMjEQ39sSPMgkHocAg9VYKw5Ff0M/Aj44eGP2iPhlpPjfwndefp18u2WByPOtJwB5kEoH3XUn6EEMMggkA9BooooAKKKKACiiigAr+W7xh/yNut/9f0//oxq/qRr+W7xh/yNut/9f0//AKMagDIooooAKKKKACiiigAooooA+hP2A/il4X+C/wC1h4K8YeMtUGjeHNPW+F1emCWby/Msp4k+SNWY5d1HAPXJ4r9f/wDh59+zL/0U6P8A8Eupf/I9fz+UUAf0B/8ADz79mX/op0f/AIJdS/8Akej/AIeffsy/9FOj/wDBLqX/AMj1/P5RQB/QH/w8+/Zl/wCinR/+CXUv/kej/h59+zL/ANFOj/8ABLqX/wAj1/P5RQB+on/BUD9sj4PftCfs/wCh+HPh/wCMV8Qa1b+Jbe/ltV067t9sC2t0jPumiRThpEGAc/N04Nfl3RRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAei/CH9or4lfAbUPtXgPxlqnh0M/mSWsEu+1mb1kgfMbn/eU191fCn/AILY+KtJjt7X4h+BNP8AECKAr6jodw1nNj+8YnDozewKD6V+aFFAH7veBP8AgrR+zz4wWJdQ1zVvCNw4A8rWtLkIDem+DzVH1JAr3fwz+1T8G/GKRnR/in4QvHk5WEa1bpN+MbOGH4iv5qqKAP6ndN1ax1i3E9heW99AekltKsin8QTVuv5WYpngkDxu0bjoynBFbln8QPFGnpstfEmr2yf3Yb6VB+jUAf1FUhIUEngV/L+3xR8ZsMN4u11h76lN/wDFVj6l4g1TWCTf6leXxPU3M7yfzJoA/p08QfE3wf4SiMuueLND0WNer6hqMMAH4uwryHxf/wAFAP2evBMUr33xV0K7Mf8ABpEj6izH0H2dXz/Kv52qKAP2U+I3/Bar4aaGs0Xg3wf4g8VXK5CTXzR6fbMexDZkfH1QV8W/Gz/gqh8c/i5HcWOnavb+AdGlBU23htDFOy/7VyxMgPuhQe1fHtFAEt1dz311Lc3M0lxcTOXkmlYs7sTksSeSSe5qKiigAooooAKKKKAP2U/Yn/b6+A3wm/Zb8AeEvFfj1NJ8Q6XaSx3dmdKvpfKY3Ergb44GU/KyngnrXt//AA8+/Zl/6KdH/wCCXUv/AJHr+fyigD+gP/h59+zL/wBFOj/8Eupf/I9H/Dz79mX/AKKdH/4JdS/+R6/n8ooA/oD/AOHn37Mv/RTo/wDwS6l/8j0f8PPv2Zf+inR/+CXUv/kev5/KKAO0+N3iDT/Fvxn8fa5pNx9r0rU/EGoXtpcbGTzYZLmR0bawBGVYHBAIzyK4uiigAooooAKKKKACvpP9hv8AbG1j9kn4mrdSGbUPA+rMkOuaShySgOFuIgeBLHkkf3hlTjIK/NlFAH9AX/Dz79mX/op0f/gk1L/5Hpf+Hn37Mv8A0U6P/wAEupf/ACPX8/lFAH9Af/Dz79mX/op0f/gl1L/5Ho/4effsy/8ARTo//BLqX/yPX8/lFAH9Af8Aw8+/Zl/6KdH/AOCXUv8A5Ho/4effsy/9FOj/APBLqX/yPX8/lFAH9Af/AA8+/Zl/6KdH/wCCXUv/AJHr8DfEl3Ff+ItVuYH8yCa6lkjbBGVLkg4PsazqKACiiigAooooAKKKKACiitvwNplvrXjbw/p12hktLvULe3mQMV3I8qqwyORwT0q6cHUmoLd6ETkoRcn0MSiv1n/aB/Z2/ZG+APiK48O6n8HfiDq1/wDYBeJfaE17d2iBtwAaT7SMEFckY4GK/JisYzUm0v6/qxq4uKuwopVxuGemea/UrUfgv+xtY/sl2nxpPgPxN/ZN4502HGoXJuBefPHuMf2nbs8xCevTHHarl7tN1Hsvv12/HQmPvTUO/wCn/A1+R+WlFFXNG0m78QaxY6XYxGe+vZ47aCJeryOwVV/EkVUYuTUVuxNqKuynRX6VeKf2af2R/wBkW30Lwj8bdS8ReKviDqVol1fSaO8qwaeHyAwWMrhMhsbt7HbnaAQK+Y/21v2cfCHwE8YaJdfD3xlbeMfBPiK1N3YSLdRTXNqRtLRS7MdnUqSqkgkEZUk5ykouy1V7XW1+34MqKcl2dr2e9j5xoor7F/4Ju/s4+CP2jfE3xF0/xpo0+tDSdC+2afFb3U0LLOX2g/u2Bb6HNX0b7Jv7lcm+qXdpfe7Hx1RX3P8ACf8AYtsrf9jP41eOPiX4A1/w/wCNtABk0SXWIrvT2EYjQ7hE21ZBuJ5Kn0r4YqZPlm6fWyf3lL3oc/S7X3BRXW/CW78IWPxK8O3Hj+yu9R8GR3aNqtrYEieWD+JUIZTn6MPrX6Y618HP2ItB/Zz0P413Pw98VHwhrF82n28UeoXJuxIHlQlk+1bQMwvyGPara5Yc7el7f5ff0JTvLk/rr+Vj8oaK1PFMmlTeJtXk0KGW30R7yZrGGckyJblz5atknkLgHk/U1l1nF8yTtYqS5W0FFFFUIKK+lP2H/wBku2/ai8ba5J4h1l/DvgTwvZ/2hrmpRbRIIzuKxoWBCkhHJYggBDweK+j/AA78DP2Kf2k7rU/A/wANNe8Q+C/GdvbySafq+sSyC1vmQcsVlYgr3K/umxkgcEVUouK7u17dbd/wYoyUm+iva/S/b8Ufm5RWr4s8N3fg3xRq+g35jN9pd3LZzmFw6F43KsVYdRkcHuKyqiMlJKS2ZcouLcXugor7X/4Jmfse+G/2mvFvirVfHtlLdeDNEtUgEcdy9v5t5M37sb0IPyqrEjPVk9a+bP2hvhDe/Af40eLfAt6GLaPfPFBK45mtz80Mn/Ao2Q/jTn+7lGEt2r/1+foTD34ykujt/X5ep53RRX2b/wAEzf2Y/An7UHjbx5onjmwuLuCx0ZZ7KW2upIHt5mk2eYNpAYgHowI46VUYuV0uzf3K5MpKNm+6X3ux8ZUV+ov7LX/BJT/i5Xjn/hcdnLe+FdGnax0iK3uHtxqpIDC6DIwYRhCoxn75YH7hz+Zniayi03xJq1pbrsgt7uWKNck4VXIAyfYVlzK8Y91f+vM05XaT7O3/AA3kZtFFfrTrn7Ln7Ivw9Hwe8M+LvB3iJfE/xEsbYWV7puoXUkS3DrEpZ8zfLl5RjCMB6YFbKLkrrq0ku7d3+hk5JOz7N/JW/wAz8lqK9j/a8+A8P7Nn7QHijwFZ38mpadYPHLZ3M2PNaCWNZED4AG4BtpIABxnAzivHKxhNVIqS6m0ouD5WFFFFWQFFfS3/AATy+CvhL4/ftKad4R8bafJqegzafdzvbx3MkBLomVO+Ng3B96+qvBH/AATR8LeD/i98atA8caRda54b03QDrXhLUBdTQZQmXhzGy7njKqrA+gOMMKKn7tJy6py/8BvdeujsEP3jaj0aX32/DVXPy/ooq1pMCXWqWcMg3RyTIjDOMgsAauEXUkoLqTKXKm30KtFfoP8AtG/sj/DD4e/t1/Bn4baHoU1p4Q8SQWL6lZNfzyNKZLmWN8SM5dcqij5SMYr5s/be+F3hz4L/ALT/AI18HeErJ9P8P6ZJbra20k7zFA1vE7fO5LH5mJ5PesVJNJ93Jf8AgLSf56GnLq12UX/4Ft/wTwuiiv0k/YL+Dn7Kn7SmkaX4N1XwX4gvPiTYaRJqGsXsl9cQWcuyVUJjKXHXEicbAODWyi5JtdP+C/wsZSkotJn5t0V73+1xqHwJuvE2k2/wO8P63oFnaJPDqya1I7mSYOAhQtNJwAG9PpXglYxlzrmRtOLg+VhRX3H/AME6v2efhR8X/Afxe8T/ABR8PX3iC08I20F7FHp93NDMI/LneVUWORN7ERDAJ6+mas/tmfsrfCjQv2dPCXxv+EVprvhvRdUv/wCz59C8QmQSnPmhZFEhZgQ0TcbmUhgRjHN1f3Pxf3f/ACbYin+828/w1f4HwnRRXrf7LEfw0uPjPo1p8WNK1DWfCV4GtTa6ZIySm4kwsJysiEKGPPzdOxq4QdSXKtyJyUI8zPJKK+7v+Cl3wa+Af7PU+leCPh74Y1XR/Hplg1G6uprya4tG090nXYDJK3z+YsZ+6OAee1fCNYxkpXt0NZRcdwor2L9l/WPgxo3jjUJvjhoesa94YawZbW30V3SVbrzE2sSssZ27A46nkjivtr9sr4J/si/s5+B4LVPA/iKDxZ4m0Ga+8PXNvf3E0MMpTETTB7jAwzKSNrDGetXU/dwU9/8APXT10bJh78uTb+lr6ao/MOiitjwZNotv4v0OXxJBNdeHkvoW1GC3JEklsJAZVXBHzFNwHI57iqiuZpXsKT5U2Y9Ffpp+1R8Ef2T/AIX/ALMOjeOvD/gnxBZ6r4302STwvO1/cS+ROYg6NcI1wVAAYdN9fmXWd/flTa1jv69ire5Ga2ewUV0Pw78C6n8TvHegeEtFRZNV1q+hsLYOcKHkYKCx7AZyfYGv0K8WfAP9ir9m/wAQWnwy+Jms+J/EPjkxxDU9bsnkS30+SRQQSsZCqMEMF2ykAjdWnK7J93ZeZHNq121fkfmpRX0N+21+ym37KPxRtdJsNUbXfCmtWg1LRdSkC+ZJCTgo+35SynHzDAIZTgZwPnms4yUldf1bc0lHldv61Civtv8A4Jp/soeBP2qm+J+meM7W5e40+wtv7Mvba5kia0llMymTarBXwVU4cEce9dBefsLaJ8M/2Q/jrrfjnQpT8SPBmu/YdP1JLqZIXtj9kKSJGGCOrrMzAkE/NjqOKqfuk3Loub5Xt9+v3E0/3klGPfl+dr/cfAlFFFABRRRQAUUUUAFdD8O7qGx+IHhi5uZY7e3h1S1kkmlYKiKJVJZieAAOcmueorSnP2c4zXR3IqR9pBw7n6lft7/8FIPFng34pXHhb4U+LfC/iHwTe6JGJ7qwEGor5snmLKomRiAQu3jqM+9flrRRXPGHLd7v/gt2+VzaUuay6f8AA/WwqjcwGcZPWv1r1j4Y/CG+/YJ034Lr+0j8Pxf2N22t/wBof2nZlpG3STeR5H2rIbL7c7uo6dq/JOitJ+9SdPvbX01X46kR92pGfa/46fldfMK1vCHiS48G+LNF1+0VXutLvYb6JX6F43DqD7ZUVk0VUZOElKO6JlFSTi9mft34J+Pfwi+KHjJ/jR4T+LXgjwTres6Ta6f4j0Hx5brLLEsDMw8lTd25VxvK7x5iMApABzn4a/4Ke/tVeEP2h/iF4e0bwGY7vw54ZimVtVih8pL24lKbzGCATGojUAnqS2OME/FNFZzipNW0SbaXrf8ADVmkJOKd9W1a/pp99lYK+8P+CTnxS8M/Cvxn8UL/AMR+KtG8KvN4dCWM2sX8Nqs0wk3BU81gHbodoz9K+D6Ku7Skl1TX3pohpNq/Rp/c7n6Z+A/20NW+NX7Cnx5sviz8SNGvvGEkTW2jafePY2F3cRGNCVigjWMy/NnkKT2r8zKKKmSTqOotLpL7v8yk2oKD7t/f/kFfdfxC+I3hO9/4JP8Aw58I2/ifRp/Flr4iknuNBi1CFr6GM3F4d7wBt6rh1OSMYYeor4Uopy96m6fdp/c7ij7s1Ptf8U1+oUUUUAFFFFAH2F/wTq/aP8GfCHXPHXgf4kSyWPgjx9po0271KME/ZHCyIC2ASEZZnBYA7TtJGMkexeGf2Xf2Tf2d77U/HPjj42aD8W9Cjt5DpfhPTWhe4nZh8gkEE7s7DoDiNQeWIHA/NuiqlLm95aSta/l/mr6MmKtdPVXvbz0/Oyuavi3VrPXvFOr6lp2mRaLp93dyz22mwEmO1jZyUiUnkhQQMn0rKoorOMeVJLoaSfM22fq/8G/jh+z3+yr+x34J8IeLNePivVfEk663q9p4H1GG4urW6V45o1naKdGi2BIU2k8mNhjGa8d/4KieJvhj8crP4ffGHwB4p0e+1LU7MWGq6It/B/acCgF4XntlcujLmRGJGB8gz0r4Coqq376XM973Xlpa33aE0v3UeVdrPz1vf79Qr7t/4JR/Ezwv8M/FvxTu/EvirSPCn2nw35VnNq2oxWfmzCTIWMyMu5u+BzXwlRTu7SS6pr701+orapvo0/uaf6H6xfsX/wDBSnWfi18VdM0f4qeI/Dvg/wAP6N4ZuEfUL6+Syj1S98y3VZZXlcL5m0SEKuPvOcen5Z+Lpo7nxZrU0MiyxSXszpIhBVlMjEEEdQRWTRUySlNT6pNet3e/6ehUXywcOjafpZWCv11/aI/4KOWvwH8C/CSz+G48DeP9Qk8PRreXD3a3smlzxxQqEYQSAoTlsqxB+X2NfkVRVuT5ORd0/uTX6k8q5ud9mvvaf6HU/FD4meIPjF4+1nxl4pvft+u6tP59xMFCr0AVVUfdVVAUDsAK5aiis4xUUorZFSk5O7CiiiqEfWv/AAS78beHfh/+1npWseKNe0vw3pKaXextf6veR2sCs0eFUySMFBJ6DPNfd3wP/wCCgXhL4geD/jB4N8deLtF03WdGl1aDRdX1C/hhh1exd5RAIpWYK8ijauFJLLsYZ5Nfi5RRW/fQ5HtyuP3u9/VbegU/3Uudb8yl9ytb5hU9hdfYr63uNu7yZFk2+uCDioKKqMnCSkt0JpSVmfsl4k1b4DftHfGX4WftEH47eH/CsfhOytzdeGNUkhiu2eKR5QhDyq6ndIVOEcNt+UnNfmx+2f8AFjRfjf8AtN+O/GXh1pJND1C7RbOWVCjSxxxJEJNp5AbZuAPOCM814pRWbiuZNaJXdvOTTf5FRbjGz1bSV/KOwV9s/wDBJf4geF/hv+0V4g1Lxb4k0jwvp0vhm5t47zWr+KzheQ3FuQgeRlBYhWOM5wD6V8TUVrGXLfzTX3pr9TOcedJeaf3O5peJpkuPEmrSxOskb3crK6HIYFyQQe4rNoorKMeWKj2Npy55ufc/Qj/gmL8d/D/wJ+Evx71a/wDEmg6R4hTT4LvRtP1m/iga/nihuWWOONnVpMsUBCc/MB3FXf8AgpV8adG/aW+D/wAMvHfhX4i6VPpnlj+0vh8dRtxfWF24P79oAfNbGGjJIIA2svDsa/Oqiqrfvmm+nLb5afj+Fk0RS/dXt1v+Nvyt87tMK9d/ZS8B6D8Qvjh4fsPEnjfSfh9pdrJ/aD6xrTxpb7oWVxEWeSNQXxgHd+BryKitKc/ZyU1uiJx9pFxfU/Q3/grRp/w/8eeKdJ+KXhH4seFfFt3MttoUnhzRL+3u54Y0W4lNyzRzMdmdqY2AZYfN2r88qKK54QULpd7/AH/8E1lJy1f9WCvuv/gqZ8RvCfxCu/g2fC3ijRvEosPDXkXZ0fUIbv7PJmP5JPLY7G4PBweK+FKK0l70VHs7/g1+pK0k5eVvxT/QK1/B+iW3iXxZoukXupwaLZ397DazaldY8q0R3CtK+SBtUEsckDA6isiiqi0mm1cUrtNJ2P1W/bL8F/CnxZ+x34I8MaN8fvA2q6r8M9Ld4rWx1K0nn1p1hVBHHGtwWRm28Y3nnpX5U0UVm03UlUb1lq/XuVdKEYLaOi9Dtvgl8Spvg38XfCHjeC3+1voOpw3xt8481EYF0z2JXIz71+h3xe+B37NX7YHxIf4y237Q2j+C9P1ZYZ9b8P6o0EV6roiowQSzI0bFUA+5IM5KlgQK/LuitebRaaxba+dr+q0WhFrNtPfR/Lb0er1PrP8A4KLftK+F/j/8S/D2l+BN83gvwbpo0nT72RWU3RyN8ihsNswiKMjJ2k96+TKKKyjHlWru3d/Nu7/E0k77KyVl8krI+8/+CYHxW8OfCzwz8eJ9Z8XaT4U1O68PxjSm1LUYrSSe4VLgqId7Au4YrwuTkj1r3L4kftxeEv2kP+CcPjKDWte0jSfiX9lt7K90Se7ihuL2ZJ4T51vESGkRlG75QdpDDtmvyaoqqv76LjLqkvSzevzvr8uxNP8AdzU1unf10St+AUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAf/2Q=="
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+# The package, and the benchmark helpers the planner tests compare against
+sys.path[:0] = [str(ROOT_DIR), str(ROOT_DIR / "benchmarks")]
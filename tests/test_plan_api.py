@@ -0,0 +1,90 @@
+import asyncio
+import json
+from datetime import date, timedelta
+
+import pytest
+from starlette.requests import Request
+
+from fight_camp import plan_api
+
+TODAY = date(2026, 1, 5)
+ATHLETE = {
+    "age": 25, "sex": "Male", "height": 175, "current_weight": 72.0, "target_weight": 66.0,
+    "fight_date": (TODAY + timedelta(days=70)).isoformat(), "water_cut_percentage": 3.0,
+    "training_level": "Medium (5-10 hrs)", "today": TODAY.isoformat(),
+}
+
+
+def post(handler, body, query=""):
+    """(status, decoded JSON) from calling a route handler with `body` as the POST body."""
+    content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    scope = {"type": "http", "method": "POST", "path": "/", "query_string": query.encode(),
+             "headers": [(b"content-type", b"application/json")]}
+
+    async def receive():
+        return {"type": "http.request", "body": content, "more_body": False}
+
+    response = asyncio.run(handler(Request(scope, receive)))
+    return response.status_code, json.loads(response.body)
+
+
+def athlete(**changes):
+    return dict(ATHLETE, **changes)
+
+
+def test_plan_ok():
+    status, body = post(plan_api.plan, athlete())
+    assert status == 200
+    assert body["valid"] and len(body["rows"]) == 9
+
+
+def test_batch_ok_counts_invalid():
+    status, body = post(plan_api.plan_batch, {"athletes": [athlete(), athlete(current_weight=60.0)],
+                                              "today": TODAY.isoformat()})
+    assert status == 200
+    assert (body["athletes"], body["invalid"]) == (2, 1)
+
+
+@pytest.mark.parametrize("body, error", [
+    (b"not json", "Request body must be JSON"),
+    ([ATHLETE], "Request body must be a JSON object"),
+    ({key: value for key, value in ATHLETE.items() if key != "height"}, "Athlete 0 is missing: height"),
+    (athlete(age="old"), "age must be a number"),
+    (athlete(fight_date="next spring"), "fight_date must be a YYYY-MM-DD date"),
+    (athlete(sex="Other"), "sex must be Male or Female"),
+    (athlete(athlete_id=["a"]), "must be a string or number"),
+    (athlete(today="yesterday"), "today must be a YYYY-MM-DD date"),
+    (athlete(training_level="Extreme"), "Extreme"),
+    (athlete(fight_date=(TODAY + timedelta(days=28)).isoformat()), "at least 4 weeks"),
+    (athlete(fight_date=(TODAY + timedelta(days=400)).isoformat()), "at most 52 weeks"),
+    (athlete(target_weight=72.0), "Current weight must be higher than fight weight."),
+])
+def test_plan_rejects(body, error):
+    status, response = post(plan_api.plan, body)
+    assert status == 400
+    assert error in response["error"]
+
+
+@pytest.mark.parametrize("body, error", [
+    ({"athletes": []}, "Expected a non-empty list of athletes"),
+    ({"athletes": "everyone"}, "Expected a non-empty list of athletes"),
+    ({}, "Expected a non-empty list of athletes"),
+    ({"athletes": [ATHLETE, 7]}, "Athlete 1 is missing"),
+])
+def test_batch_rejects(body, error):
+    status, response = post(plan_api.plan_batch, body)
+    assert status == 400
+    assert error in response["error"]
+
+
+def test_batch_size_limit(monkeypatch):
+    monkeypatch.setattr(plan_api, "MAX_BATCH_ATHLETES", 2)
+    status, response = post(plan_api.plan_batch, {"athletes": [ATHLETE] * 3})
+    assert status == 400
+    assert response["error"] == "At most 2 athletes per request"
+
+
+def test_unknown_format():
+    status, response = post(plan_api.plan, athlete(), query="format=xml")
+    assert status == 400
+    assert response["error"] == "format must be json or arrow"
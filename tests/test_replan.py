@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from fight_camp.constants import WEEKLY_LOSS_GRADIENT
+from fight_camp.energy_balance import weekly_intake
+from fight_camp.replan import CampPlans
+from run_benchmarks import TODAY, random_roster
+
+CAMP_WEEKS = 12
+
+
+def camp_plans(roster):
+    return CampPlans(**roster, today=TODAY)
+
+
+def recomputed_weeks(roster, athlete, week, weight, total_weeks):
+    """Weights and calories for weeks `week`..N, planned from scratch from a weigh-in of `weight` kg."""
+    fight_week_start_weight = roster["target_weight"][athlete] * (
+        1 + 2 * roster["water_cut_percentage"][athlete] / 100)
+    factors = 1 + WEEKLY_LOSS_GRADIENT * np.arange(week - 1, total_weeks)
+    loss = factors * (weight - fight_week_start_weight) / factors.sum()
+    weights = weight - np.cumsum(loss)
+    calories = weekly_intake(*([roster[field][athlete]] for field in ("age", "sex", "height")), [weight],
+                             [roster["training_level"][athlete]], weights[None, :])[0]
+    return weights, np.round(calories)
+
+
+@pytest.mark.parametrize("week", [2, 5, CAMP_WEEKS - 1])
+def test_update_matches_full_recompute(week):
+    roster = random_roster(50, CAMP_WEEKS + 1, seed=week)
+    plans = camp_plans(roster)
+    original = plans.batch.weight.copy(), plans.batch.calories.copy()
+    athletes = np.arange(0, 50, 3)
+    observed = roster["current_weight"][athletes] - np.linspace(-1, 3, len(athletes))
+    day = np.datetime64(TODAY) + 7 * (week - 1) + 3
+
+    plans.update(athletes, np.full(len(athletes), day), observed)
+
+    for athlete in range(50):
+        rows = plans.rows(athlete)
+        weights, calories = plans.batch.weight[rows], plans.batch.calories[rows]
+        if athlete not in athletes:
+            np.testing.assert_array_equal(weights, original[0][rows])
+            np.testing.assert_array_equal(calories, original[1][rows])
+            continue
+        # Weeks before the weigh-in stay as planned; the rest match a fresh plan from it
+        np.testing.assert_array_equal(weights[:week - 1], original[0][rows][:week - 1])
+        expected_weights, expected_calories = recomputed_weeks(
+            roster, athlete, week, observed[athletes == athlete][0], plans.total_weeks[athlete])
+        np.testing.assert_allclose(weights[week - 1:], expected_weights)
+        np.testing.assert_allclose(calories[week - 1:], expected_calories, atol=1)
+        assert plans.observed[rows][week - 1] == observed[athletes == athlete][0]
+
+
+def test_week_one_weigh_in_at_start_weight_reproduces_plan():
+    roster = random_roster(20, CAMP_WEEKS + 1)
+    plans = camp_plans(roster)
+    original = plans.batch.weight.copy(), plans.batch.calories.copy()
+    plans.update(np.arange(20), np.full(20, np.datetime64(TODAY)), roster["current_weight"])
+    np.testing.assert_allclose(plans.batch.weight, original[0])
+    np.testing.assert_allclose(plans.batch.calories, original[1], atol=1)
+
+
+def test_stale_and_out_of_camp_weigh_ins_are_ignored():
+    roster = random_roster(2, CAMP_WEEKS + 1)
+    plans = camp_plans(roster)
+    later = np.datetime64(TODAY) + 20
+    assert plans.update([0], [later], [roster["current_weight"][0] - 2]) > 0
+    replanned = plans.batch.weight.copy()
+    assert plans.update([0], [later - 10], [roster["current_weight"][0]]) == 0  # older than the one applied
+    assert plans.update([1], [np.datetime64(TODAY) - 1], [roster["current_weight"][1]]) == 0  # before camp
+    np.testing.assert_array_equal(plans.batch.weight, replanned)
@@ -0,0 +1,108 @@
+import struct
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from fight_camp.sessions import FIT_EPOCH, combine_session_days, read_session_days
+
+START = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+SAMPLES = 600
+
+
+def iso(seconds):
+    return f"{START + timedelta(seconds=seconds):%Y-%m-%dT%H:%M:%SZ}"
+
+
+def fit_bytes(heart_rate, session_kcal):
+    """1 Hz records (every other one with a compressed timestamp header) and a big-endian session message."""
+    start = int(START.timestamp()) - FIT_EPOCH
+    body = bytearray(b"\x40\x00\x00" + struct.pack("<H", 20) + bytes([2, 253, 4, 0x86, 3, 1, 0x02]))
+    body += b"\x41\x00\x00" + struct.pack("<H", 20) + bytes([1, 3, 1, 0x02])
+    for second in range(SAMPLES):
+        timestamp = start + second
+        if second % 2:
+            body += bytes([0x80 | 1 << 5 | timestamp & 0x1F, heart_rate])
+        else:
+            body += b"\x00" + struct.pack("<IB", timestamp, heart_rate)
+    body += b"\x42\x00\x01" + struct.pack(">H", 18) + bytes([2, 2, 4, 0x86, 11, 2, 0x84])
+    body += b"\x02" + struct.pack(">IH", start, session_kcal)
+    return struct.pack("<BBHI4sH", 14, 0x10, 2100, len(body), b".FIT", 0) + body + b"\x00\x00"
+
+
+def test_fit(tmp_path):
+    path = tmp_path / "ride.fit"
+    path.write_bytes(fit_bytes(130, 450))
+    with open(path, "rb") as source:
+        from_file_object = read_session_days(source, path.name)
+    for days in (read_session_days(path, path.name), from_file_object):
+        assert days.date.tolist() == [START.date()]
+        assert days.seconds[0] == days.hr_seconds[0] == days.exercise_seconds[0] == SAMPLES - 1
+        assert days.exercise_beats[0] == 130 * (SAMPLES - 1)
+        assert days.device_kcal[0] == 450
+
+
+def test_csv_pause_and_rest(tmp_path):
+    # Two 150 s halves a minute apart; the first at rest heart rate, the second exercising
+    seconds = list(range(150)) + list(range(210, 360))
+    lines = ["Timestamp,HR,cadence"] + [f"{iso(s)},{80 if s < 150 else 140},1" for s in seconds]
+    path = tmp_path / "session.csv"
+    path.write_text("\n".join(lines))
+    days = read_session_days(path, path.name)
+    assert days.seconds[0] == days.hr_seconds[0] == 298  # the 61 s pause counts for nothing
+    assert days.exercise_seconds[0] == 149
+    assert days.exercise_beats[0] == 140 * 149
+
+
+def test_csv_needs_a_time_column(tmp_path):
+    path = tmp_path / "session.csv"
+    path.write_text("HR\n120\n")
+    with pytest.raises(ValueError, match="time column"):
+        read_session_days(path, path.name)
+
+
+def test_tcx_heart_rate_and_lap_calories(tmp_path):
+    points = "".join(f"<Trackpoint><Time>{iso(s)}</Time><HeartRateBpm><Value>150</Value></HeartRateBpm></Trackpoint>"
+                     for s in range(SAMPLES))
+    path = tmp_path / "session.tcx"
+    path.write_text(
+        '<?xml version="1.0"?><TrainingCenterDatabase '
+        'xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2"><Activities><Activity Sport="Other">'
+        f'<Id>{iso(0)}</Id><Lap StartTime="{iso(0)}"><Calories>300</Calories><Track>{points}</Track></Lap>'
+        "</Activity></Activities></TrainingCenterDatabase>")
+    days = read_session_days(path, path.name)
+    assert days.exercise_seconds[0] == SAMPLES - 1
+    assert days.exercise_beats[0] == 150 * (SAMPLES - 1)
+    assert days.device_kcal[0] == 300
+
+
+def test_gpx_with_and_without_heart_rate(tmp_path):
+    extension = ('<extensions><gpxtpx:TrackPointExtension><gpxtpx:hr>{}</gpxtpx:hr>'
+                 '</gpxtpx:TrackPointExtension></extensions>')
+    points = "".join(
+        f'<trkpt lat="0" lon="0"><time>{iso(s)}</time>{extension.format(120) if s >= 300 else ""}</trkpt>'
+        for s in range(0, SAMPLES, 5))
+    path = tmp_path / "run.gpx"
+    path.write_text(
+        '<?xml version="1.0"?><gpx xmlns="http://www.topografix.com/GPX/1/1" '
+        'xmlns:gpxtpx="http://www.garmin.com/xmlschemas/TrackPointExtension/v1">'
+        f"<trk><trkseg>{points}</trkseg></trk></gpx>")
+    days = read_session_days(path, path.name)
+    assert days.seconds[0] == SAMPLES - 5
+    assert days.hr_seconds[0] == days.exercise_seconds[0] == SAMPLES - 300
+    assert days.device_kcal[0] == 0
+
+
+def test_combine_sums_days(tmp_path):
+    first, second = tmp_path / "a.fit", tmp_path / "b.fit"
+    first.write_bytes(fit_bytes(130, 450))
+    second.write_bytes(fit_bytes(100, 50))
+    days = combine_session_days([read_session_days(path, path.name) for path in (first, second)])
+    assert days.date.tolist() == [START.date()]
+    assert days.device_kcal[0] == 500
+    np.testing.assert_allclose(days.exercise_beats, [230 * (SAMPLES - 1)])
+
+
+def test_unsupported_file_type():
+    with pytest.raises(ValueError, match="Unsupported session file"):
+        read_session_days(b"", "notes.txt")